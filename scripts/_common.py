@@ -0,0 +1,129 @@
+"""
+Shared helpers for the command-line scripts.
+Centralizes path constants, config loading, and logging setup.
+"""
+
+import sys
+import importlib.util
+import logging
+import pickle
+import queue
+import yaml
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from datetime import datetime
+
+# Fix encoding for Windows (applied exactly once, on first import)
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8', line_buffering=True)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+LOGS_DIR = PROJECT_ROOT / 'logs'
+CONFIG_DIR = PROJECT_ROOT / 'config'
+
+# Output of scripts/compile_configs.py; when fresh, config loading becomes
+# a plain module import instead of a YAML parse
+COMPILED_CONFIG_PATH = CONFIG_DIR / '_compiled_config.py'
+
+# LibYAML's C loader is 10-20x faster than the pure-Python SafeLoader
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=1)
+def load_config():
+    """
+    Load configuration files.
+
+    Memoized with lru_cache so in-process callers parse at most once, and
+    cached to config/.config.pkl keyed on the YAML file mtimes so repeated
+    runs (cron/GitHub Actions) skip YAML parsing entirely unless a config
+    file changed.
+    """
+    config_path = CONFIG_DIR / 'config.yaml'
+    scraper_config_path = CONFIG_DIR / 'scraper_config.yaml'
+    cache_path = CONFIG_DIR / '.config.pkl'
+
+    yaml_mtimes = (config_path.stat().st_mtime, scraper_config_path.stat().st_mtime)
+
+    # Fastest path: pre-compiled config module (see scripts/compile_configs.py),
+    # used only when it is at least as new as both YAML sources so plain
+    # YAML edits during development still take effect
+    if (COMPILED_CONFIG_PATH.exists()
+            and COMPILED_CONFIG_PATH.stat().st_mtime >= max(yaml_mtimes)):
+        spec = importlib.util.spec_from_file_location(
+            '_compiled_config', COMPILED_CONFIG_PATH
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.CONFIG
+
+    cache_key = yaml_mtimes
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_key, cached_config = pickle.load(f)
+            if cached_key == cache_key:
+                return cached_config
+        except Exception:
+            pass  # Stale/corrupt cache, fall through to re-parse
+
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=_YAML_LOADER)
+
+    with open(scraper_config_path, 'r', encoding='utf-8') as f:
+        scraper_config = yaml.load(f, Loader=_YAML_LOADER)
+
+    config.update(scraper_config)
+
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump((cache_key, config), f)
+    except OSError:
+        pass  # Cache is best-effort
+
+    return config
+
+
+def setup_logging(prefix: str):
+    """
+    Configure logging with a background writer thread.
+
+    Handlers sit behind a QueueHandler/QueueListener pair so log calls in
+    hot loops only enqueue in memory instead of blocking on file and
+    console writes.
+
+    Args:
+        prefix: Log file name prefix (e.g. 'etl', 'scraper')
+
+    Returns:
+        Tuple of (log file path, QueueListener). Callers must stop() the
+        listener on shutdown to flush pending records.
+    """
+    LOGS_DIR.mkdir(exist_ok=True)
+
+    log_file = LOGS_DIR / f'{prefix}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue,
+        logging.FileHandler(log_file, encoding='utf-8'),
+        logging.StreamHandler(sys.stdout)
+    )
+    for handler in listener.handlers:
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        ))
+    listener.start()
+
+    # The queue handler must not pre-format; the listener's handlers do that
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[queue_handler]
+    )
+
+    return log_file, listener
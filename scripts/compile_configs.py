@@ -0,0 +1,42 @@
+"""
+Pre-compile YAML configs to a Python module.
+Meant as a CI prebuild step so runtime config loading is a cached-bytecode
+import instead of a YAML parse.
+"""
+
+import sys
+import pprint
+from pathlib import Path
+
+import yaml
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts._common import CONFIG_DIR, COMPILED_CONFIG_PATH
+
+HEADER = '''"""
+Generated by scripts/compile_configs.py — do not edit.
+Re-run the script after changing config/config.yaml or
+config/scraper_config.yaml.
+"""
+
+CONFIG = '''
+
+
+def main():
+    """Merge the YAML configs and emit config/_compiled_config.py."""
+    with open(CONFIG_DIR / 'config.yaml', 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+
+    with open(CONFIG_DIR / 'scraper_config.yaml', 'r', encoding='utf-8') as f:
+        config.update(yaml.safe_load(f))
+
+    with open(COMPILED_CONFIG_PATH, 'w', encoding='utf-8') as f:
+        f.write(HEADER + pprint.pformat(config) + '\n')
+
+    print(f"Compiled config written to: {COMPILED_CONFIG_PATH}")
+
+
+if __name__ == "__main__":
+    main()
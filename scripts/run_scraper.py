@@ -7,80 +7,81 @@ import sys
 import os
 import time
 import logging
-import yaml
+import argparse
 from pathlib import Path
 from datetime import datetime
 
-# Fix encoding for Windows
-if sys.platform == 'win32':
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-
 # Add src directory to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.scraper.nofluff_scraper import NoFluffScraper
-from src.database.db_manager import DatabaseManager
+# Shared script plumbing (also applies the Windows stdout encoding fix)
+from scripts._common import LOGS_DIR, load_config, setup_logging
 
+# Console banner built once at import time
+BANNER = "=" * 60
 
-def setup_logging():
-    """Configure logging."""
-    log_dir = project_root / 'logs'
-    log_dir.mkdir(exist_ok=True)
+from src.scraper.nofluff_scraper import NoFluffScraper
+from src.database.db_manager import DatabaseManager
 
-    log_file = log_dir / f'scraper_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
+def display_job_summary(job: dict, verbose: bool = False):
+    """
+    Log a summary of a scraped job.
+
+    Uses %-style deferred formatting so field lookups and string joins are
+    skipped entirely when the log level suppresses the record. With
+    verbose=True the summary is also echoed to stdout.
+    """
+    job_id = job.get('job_id', 'N/A')
+    title = job.get('title', 'N/A')
+    company = job.get('company_name', 'N/A')
+    salary = job.get('salary', 'N/A')
+    location = job.get('location', 'N/A')
+    seniority = job.get('seniority', 'N/A')
+    url = job.get('url', 'N/A')
+
+    logging.info(
+        "Job %s | %s | %s | %s | %s | %s | %s",
+        job_id, title, company, salary, location, seniority, url
     )
 
-    return log_file
-
-
-def load_config():
-    """Load configuration files."""
-    config_path = project_root / 'config' / 'config.yaml'
-    scraper_config_path = project_root / 'config' / 'scraper_config.yaml'
-
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
-
-    with open(scraper_config_path, 'r', encoding='utf-8') as f:
-        scraper_config = yaml.safe_load(f)
-
-    # Merge configs
-    config.update(scraper_config)
-
-    return config
-
-
-def display_job_summary(job: dict):
-    """Display a summary of a scraped job."""
-    print(f"\n{'='*60}")
-    print(f"Job ID: {job.get('job_id', 'N/A')}")
-    print(f"Title: {job.get('title', 'N/A')}")
-    print(f"Company: {job.get('company_name', 'N/A')}")
-    print(f"Salary: {job.get('salary', 'N/A')}")
-    print(f"Location: {job.get('location', 'N/A')}")
-    print(f"Seniority: {job.get('seniority', 'N/A')}")
-    print(f"Technologies: {', '.join(job.get('technologies', []))[:100]}")
-    print(f"URL: {job.get('url', 'N/A')}")
+    if verbose:
+        print(f"\n{BANNER}")
+        print(f"Job ID: {job_id}")
+        print(f"Title: {title}")
+        print(f"Company: {company}")
+        print(f"Salary: {salary}")
+        print(f"Location: {location}")
+        print(f"Seniority: {seniority}")
+        print(f"Technologies: {', '.join(job.get('technologies', []))[:100]}")
+        print(f"URL: {url}")
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Run the NoFluffJobs scraper")
+    parser.add_argument(
+        '-y', '--yes', action='store_true',
+        help="Skip the confirmation prompt (for CI/automation)"
+    )
+    parser.add_argument(
+        '-v', '--verbose', action='store_true',
+        help="Echo per-job summaries to stdout as well as the log"
+    )
+    return parser.parse_args()
 
 
 def main():
     """Main execution function."""
-    print("=" * 60)
+    args = parse_args()
+
+    print(BANNER)
     print("NoFluffJobs Scraper")
-    print("=" * 60)
+    print(BANNER)
 
     # Setup
-    log_file = setup_logging()
+    log_file, log_listener = setup_logging('scraper')
     logging.info("Starting scraper execution")
     print(f"\nLog file: {log_file}")
 
@@ -112,10 +113,11 @@ def main():
     print("\n⚠️  This will make requests to NoFluffJobs website.")
     print("   Please ensure you're following ethical scraping practices.")
 
-    response = input("\nProceed with scraping? (yes/no): ")
-    if response.lower() != 'yes':
-        print("Scraping cancelled.")
-        return 0
+    if not args.yes:
+        response = input("\nProceed with scraping? (yes/no): ")
+        if response.lower() != 'yes':
+            print("Scraping cancelled.")
+            return 0
 
     # Check robots.txt
     print("\nChecking robots.txt...")
@@ -123,9 +125,9 @@ def main():
     scraper.check_robots_txt()
 
     # Run scraper
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("STARTING SCRAPE")
-    print("=" * 60)
+    print(BANNER)
 
     start_time = time.time()
 
@@ -136,22 +138,21 @@ def main():
         duration = time.time() - start_time
 
         # Display results
-        print("\n" + "=" * 60)
+        print("\n" + BANNER)
         print("SCRAPING COMPLETED")
-        print("=" * 60)
+        print(BANNER)
         print(f"Duration: {duration:.2f} seconds")
         print(f"Jobs scraped: {len(jobs)}")
 
         if jobs:
             print(f"\nFirst 3 jobs:")
             for job in jobs[:3]:
-                display_job_summary(job)
+                display_job_summary(job, verbose=args.verbose)
 
             # Save to file for inspection
-            import json
-            output_file = project_root / 'logs' / f'scraped_jobs_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(jobs, f, indent=2, ensure_ascii=False)
+            from scripts.run_etl import save_json
+            output_file = LOGS_DIR / f'scraped_jobs_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+            save_json(output_file, jobs)
 
             print(f"\n✓ Full data saved to: {output_file}")
             print(f"\nNext steps:")
@@ -197,6 +198,7 @@ def main():
 
     finally:
         db.close()
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -8,6 +8,12 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Console banner built once at import time
+BANNER = "=" * 60
+
+# Database path computed once at import time
+DB_PATH_STR = str(project_root / "data" / "jobs.db")
+
 from src.database.db_manager import DatabaseManager
 
 # Fix encoding for Windows
@@ -17,22 +23,29 @@ if sys.platform == 'win32':
 
 
 def main():
-    db = DatabaseManager("data/jobs.db")
+    db = DatabaseManager(DB_PATH_STR)
 
-    print("=" * 60)
+    print(BANNER)
     print("DATABASE INFORMATION")
-    print("=" * 60)
+    print(BANNER)
 
     # List all tables
     tables = db.fetch_all(
         "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
     )
 
+    # One UNION ALL query returns every table count in a single round-trip
+    counts = {}
+    if tables:
+        count_sql = " UNION ALL ".join(
+            f"SELECT '{table['name']}' AS name, COUNT(*) AS count FROM {table['name']}"
+            for table in tables
+        )
+        counts = {row['name']: row['count'] for row in db.fetch_all(count_sql)}
+
     print(f"\nTables ({len(tables)}):")
     for table in tables:
-        # Get row count
-        count_result = db.fetch_one(f"SELECT COUNT(*) as count FROM {table['name']}")
-        print(f"  - {table['name']:20} ({count_result['count']} rows)")
+        print(f"  - {table['name']:20} ({counts.get(table['name'], 0)} rows)")
 
     # Show indexes
     indexes = db.fetch_all(
@@ -50,7 +63,7 @@ def main():
     else:
         print("\nNo scrape runs recorded yet")
 
-    print("=" * 60)
+    print(BANNER)
 
     db.close()
 
@@ -3,77 +3,99 @@ Test ETL pipeline with mock data.
 """
 
 import sys
+from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from datetime import date
+from typing import List
 
 # Fix encoding for Windows
 if sys.platform == 'win32':
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8', line_buffering=True)
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Console banner built once at import time
+BANNER = "=" * 60
+
 from src.etl.extractor import DataExtractor
 from src.etl.transformer import DataTransformer
 from src.etl.loader import DataLoader
 from src.database.db_manager import DatabaseManager
 
 
-# Mock job data (simulating scraper output)
-MOCK_JOBS = [
-    {
-        'job_id': 'python-developer-warszawa-123',
-        'title': 'Senior Python Developer',
-        'company_name': 'Tech Solutions',
-        'url': 'https://nofluffjobs.com/job/python-developer-warszawa-123',
-        'description': 'Great opportunity to work with Python and Django',
-        'requirements': 'Python, Django, PostgreSQL required',
-        'salary': '15000 - 20000 PLN',
-        'location': 'Warszawa / Zdalnie',
-        'technologies': ['Python', 'Django', 'PostgreSQL', 'Docker', 'AWS'],
-        'seniority': 'senior',
-        'employment_type': 'B2B'
-    },
-    {
-        'job_id': 'java-engineer-krakow-456',
-        'title': 'Java Backend Engineer',
-        'company_name': 'Software Inc',
-        'url': 'https://nofluffjobs.com/job/java-engineer-krakow-456',
-        'description': 'Backend development with Spring Boot',
-        'requirements': 'Java, Spring, Microservices',
-        'salary': '18 000 - 25 000 PLN',
-        'location': 'Kraków',
-        'technologies': ['Java', 'Spring', 'Kubernetes', 'MySQL'],
-        'seniority': 'mid',
-        'employment_type': 'full-time'
-    },
-    {
-        'job_id': 'frontend-dev-remote-789',
-        'title': 'Junior Frontend Developer',
-        'company_name': 'StartupCo',
-        'url': 'https://nofluffjobs.com/job/frontend-dev-remote-789',
-        'description': 'React development for modern web applications',
-        'requirements': 'React, JavaScript, TypeScript',
-        'salary': '8000 - 12000 PLN',
-        'location': 'Praca zdalna',
-        'technologies': ['React', 'TypeScript', 'JavaScript', 'Git'],
-        'seniority': 'junior',
-        'employment_type': 'contract'
-    },
-]
+@dataclass(frozen=True, slots=True)
+class MockJob:
+    """One mock scraper record; frozen and slotted, so records carry no
+    per-instance dict overhead and can't be mutated between tests."""
+    job_id: str
+    title: str
+    company_name: str
+    url: str
+    description: str
+    requirements: str
+    salary: str
+    location: str
+    technologies: List[str] = field(default_factory=list)
+    seniority: str = 'mid'
+    employment_type: str = 'full-time'
+
+
+# Mock job data (simulating scraper output); asdict() converts records at
+# the extractor boundary, which still expects plain dicts
+MOCK_JOBS: tuple = (
+    MockJob(
+        job_id='python-developer-warszawa-123',
+        title='Senior Python Developer',
+        company_name='Tech Solutions',
+        url='https://nofluffjobs.com/job/python-developer-warszawa-123',
+        description='Great opportunity to work with Python and Django',
+        requirements='Python, Django, PostgreSQL required',
+        salary='15000 - 20000 PLN',
+        location='Warszawa / Zdalnie',
+        technologies=['Python', 'Django', 'PostgreSQL', 'Docker', 'AWS'],
+        seniority='senior',
+        employment_type='B2B'
+    ),
+    MockJob(
+        job_id='java-engineer-krakow-456',
+        title='Java Backend Engineer',
+        company_name='Software Inc',
+        url='https://nofluffjobs.com/job/java-engineer-krakow-456',
+        description='Backend development with Spring Boot',
+        requirements='Java, Spring, Microservices',
+        salary='18 000 - 25 000 PLN',
+        location='Kraków',
+        technologies=['Java', 'Spring', 'Kubernetes', 'MySQL'],
+        seniority='mid',
+        employment_type='full-time'
+    ),
+    MockJob(
+        job_id='frontend-dev-remote-789',
+        title='Junior Frontend Developer',
+        company_name='StartupCo',
+        url='https://nofluffjobs.com/job/frontend-dev-remote-789',
+        description='React development for modern web applications',
+        requirements='React, JavaScript, TypeScript',
+        salary='8000 - 12000 PLN',
+        location='Praca zdalna',
+        technologies=['React', 'TypeScript', 'JavaScript', 'Git'],
+        seniority='junior',
+        employment_type='contract'
+    ),
+)
 
 
 def test_extractor():
     """Test data extraction."""
-    print("=" * 60)
+    print(BANNER)
     print("TEST 1: Data Extraction")
-    print("=" * 60)
+    print(BANNER)
 
     extractor = DataExtractor()
 
     # Test single job extraction
-    extracted = extractor.extract_job_data(MOCK_JOBS[0])
+    extracted = extractor.extract_job_data(asdict(MOCK_JOBS[0]))
 
     assert extracted is not None, "Extraction failed"
     assert 'job_posting' in extracted
@@ -86,7 +108,7 @@ def test_extractor():
     print(f"  - Title: {extracted['job_posting']['title']}")
 
     # Test batch extraction
-    extracted_batch = extractor.extract_batch(MOCK_JOBS)
+    extracted_batch = extractor.extract_batch([asdict(job) for job in MOCK_JOBS])
 
     assert len(extracted_batch) == 3, f"Expected 3 jobs, got {len(extracted_batch)}"
 
@@ -97,9 +119,9 @@ def test_extractor():
 
 def test_transformer(extracted_jobs):
     """Test data transformation."""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 2: Data Transformation")
-    print("=" * 60)
+    print(BANNER)
 
     transformer = DataTransformer()
 
@@ -163,13 +185,12 @@ def test_transformer(extracted_jobs):
     return transformed_batch
 
 
-def test_loader(transformed_jobs):
+def test_loader(db, transformed_jobs):
     """Test data loading into database."""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("TEST 3: Data Loading")
-    print("=" * 60)
+    print(BANNER)
 
-    db = DatabaseManager("data/jobs.db")
     loader = DataLoader(db)
 
     # Load data
@@ -218,34 +239,28 @@ def test_loader(transformed_jobs):
 
     print("✓ Idempotency test passed (no duplicates created)")
 
-    db.close()
-
     return stats
 
 
-def cleanup_test_data():
+def cleanup_test_data(db):
     """Clean up test data."""
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("CLEANUP: Removing Test Data")
-    print("=" * 60)
-
-    db = DatabaseManager("data/jobs.db")
+    print(BANNER)
 
-    # Delete test jobs
-    test_job_ids = [job['job_id'] for job in MOCK_JOBS]
+    # Delete test jobs: one IN (...) delete per table inside a single
+    # transaction, so cleanup costs one fsync regardless of mock-job count
+    test_job_ids = tuple(job.job_id for job in MOCK_JOBS)
+    placeholders = ','.join('?' * len(test_job_ids))
 
-    for job_id in test_job_ids:
-        db.execute_query("DELETE FROM job_technologies WHERE job_id = ?", (job_id,))
-        db.execute_query("DELETE FROM salaries WHERE job_id = ?", (job_id,))
-        db.execute_query("DELETE FROM job_snapshots WHERE job_id = ?", (job_id,))
-        db.execute_query("DELETE FROM job_postings WHERE job_id = ?", (job_id,))
-
-    db.commit()
+    with db.transaction():
+        db.execute_query(f"DELETE FROM job_technologies WHERE job_id IN ({placeholders})", test_job_ids)
+        db.execute_query(f"DELETE FROM salaries WHERE job_id IN ({placeholders})", test_job_ids)
+        db.execute_query(f"DELETE FROM job_snapshots WHERE job_id IN ({placeholders})", test_job_ids)
+        db.execute_query(f"DELETE FROM job_postings WHERE job_id IN ({placeholders})", test_job_ids)
 
     print(f"✓ Cleaned up {len(test_job_ids)} test jobs")
 
-    db.close()
-
 
 def main():
     """Run all ETL tests."""
@@ -253,19 +268,23 @@ def main():
     print("# ETL PIPELINE TEST SUITE")
     print("#" * 60)
 
+    # One shared connection for all DB phases; reopening per phase would
+    # replay the connect-time PRAGMAs and the db/-wal/-shm file opens twice
+    db = DatabaseManager("data/jobs.db")
+
     try:
         # Run tests
         extracted_jobs = test_extractor()
         transformed_jobs = test_transformer(extracted_jobs)
-        stats = test_loader(transformed_jobs)
+        stats = test_loader(db, transformed_jobs)
 
         # Cleanup
-        cleanup_test_data()
+        cleanup_test_data(db)
 
         # Summary
-        print("\n" + "=" * 60)
+        print("\n" + BANNER)
         print("TEST SUMMARY")
-        print("=" * 60)
+        print(BANNER)
         print("✓ All ETL tests passed successfully!")
         print("\nETL Pipeline is ready for:")
         print("  - Extracting data from scraped jobs")
@@ -276,7 +295,7 @@ def main():
         print("\nNext steps:")
         print("  - Run full pipeline: python scripts/run_etl.py")
         print("  - Build dashboard for visualization")
-        print("=" * 60 + "\n")
+        print(BANNER + "\n")
 
         return 0
 
@@ -289,6 +308,9 @@ def main():
         traceback.print_exc()
         return 1
 
+    finally:
+        db.close()
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -13,7 +13,9 @@ sys.path.insert(0, str(project_root))
 
 from src.database.db_manager import DatabaseManager
 from src.dashboard.utils.data_loader import DashboardDataLoader
-from src.dashboard.components import salary_charts, tech_trends, geo_charts
+
+# The chart component modules (and the plotly stack they pull in) are
+# imported lazily inside the tab fragments, keeping cold start light.
 
 
 # Page configuration
@@ -24,8 +26,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+@st.cache_resource
+def _page_css() -> str:
+    """Custom CSS for better styling, built once per server process."""
+    return """
     <style>
     .main-header {
         font-size: 2.5rem;
@@ -41,7 +45,18 @@ st.markdown("""
         margin: 0.5rem 0;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource
+def _footer_html() -> str:
+    """Footer markup, built once per server process."""
+    return """
+    <div style="text-align: center; color: gray; padding: 1rem;">
+        <p>NoFluffJobs IT Market Dashboard | Data Engineering Project</p>
+        <p>Built with Streamlit & Plotly | Data from NoFluffJobs</p>
+    </div>
+"""
 
 
 @st.cache_resource
@@ -51,6 +66,12 @@ def get_database():
     return DatabaseManager(str(db_path))
 
 
+@st.cache_resource
+def get_data_loader():
+    """Get the data loader (cached together with its database)."""
+    return DashboardDataLoader(get_database())
+
+
 @st.cache_data(ttl=3600)
 def load_dashboard_data(_data_loader, date_from, date_to):
     """Load all dashboard data (cached for 1 hour)."""
@@ -58,24 +79,230 @@ def load_dashboard_data(_data_loader, date_from, date_to):
         'jobs': _data_loader.get_active_jobs(date_from, date_to),
         'salary': _data_loader.get_salary_data(date_from, date_to),
         'technology': _data_loader.get_technology_data(date_from, date_to),
+        'top_technologies': _data_loader.get_top_technologies(top_n=20, date_from=date_from, date_to=date_to),
+        'top_technology_trends': _data_loader.get_top_technology_trends(top_n=10, date_from=date_from, date_to=date_to),
         'location': _data_loader.get_location_data(date_from, date_to),
+        'city_counts': _data_loader.get_city_counts(date_from, date_to, top_n=15),
+        'region_counts': _data_loader.get_region_counts(date_from, date_to),
+        'location_type_counts': _data_loader.get_location_type_counts(date_from, date_to),
+        'remote_trend': _data_loader.get_remote_pct_trend(date_from, date_to),
         'salary_by_tech': _data_loader.get_salary_by_technology(top_n=20),
         'kpis': _data_loader.get_kpi_metrics(),
         'scrape_info': _data_loader.get_last_scrape_info()
     }
 
 
+# Each tab body is a fragment: interactions inside a tab rerun only that
+# function instead of the whole script, so the other tabs' charts are
+# not rebuilt.
+
+@st.fragment
+def render_salary_tab(data):
+    """Render the salary analysis tab."""
+    from src.dashboard.components import salary_charts
+
+    st.header("💰 Salary Analysis")
+
+    if not data['salary'].empty:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            fig = salary_charts.plot_salary_distribution(data['salary'])
+            st.plotly_chart(fig, use_container_width=True, key="salary_distribution")
+
+        with col2:
+            fig = salary_charts.plot_salary_by_seniority(data['jobs'])
+            st.plotly_chart(fig, use_container_width=True, key="salary_by_seniority")
+
+        # Salary by technology
+        st.subheader("Salary by Technology")
+        fig = salary_charts.plot_salary_by_technology(data['salary_by_tech'], top_n=15)
+        st.plotly_chart(fig, use_container_width=True, key="salary_by_technology")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            fig = salary_charts.plot_salary_trends(data['salary'])
+            st.plotly_chart(fig, use_container_width=True, key="salary_trends")
+
+        with col2:
+            fig = salary_charts.plot_salary_by_location_type(data['jobs'])
+            st.plotly_chart(fig, use_container_width=True, key="salary_by_location_type")
+
+        # Summary statistics
+        with st.expander("📊 Salary Statistics"):
+            summary = salary_charts.create_salary_summary_table(data['salary'])
+            if not summary.empty:
+                st.dataframe(summary, use_container_width=True, hide_index=True)
+    else:
+        st.info("No salary data available. Run the ETL pipeline to populate the database.")
+
+
+@st.fragment
+def render_technology_tab(data):
+    """Render the technology trends tab."""
+    from src.dashboard.components import tech_trends
+
+    st.header("📈 Technology Trends")
+
+    if not data['technology'].empty:
+        # Top technologies
+        fig = tech_trends.plot_top_technologies(data['top_technologies'], top_n=20)
+        st.plotly_chart(fig, use_container_width=True, key="top_technologies")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            fig = tech_trends.plot_technology_categories(data['technology'])
+            st.plotly_chart(fig, use_container_width=True, key="technology_categories")
+
+        with col2:
+            fig = tech_trends.plot_technology_trends(data['top_technology_trends'], top_n=10)
+            st.plotly_chart(fig, use_container_width=True, key="technology_trends")
+
+        # Heatmap
+        st.subheader("Technology Demand Heatmap")
+        fig = tech_trends.plot_skill_demand_heatmap(data['technology'])
+        st.plotly_chart(fig, use_container_width=True, key="skill_demand_heatmap")
+
+        # Summary table
+        with st.expander("📊 Technology Statistics"):
+            summary = tech_trends.create_technology_summary_table(data['technology'], top_n=30)
+            if not summary.empty:
+                st.dataframe(summary, use_container_width=True)
+    else:
+        st.info("No technology data available. Run the ETL pipeline to populate the database.")
+
+
+@st.fragment
+def render_geo_tab(data):
+    """Render the geographic distribution tab."""
+    from src.dashboard.components import geo_charts
+
+    st.header("🗺️ Geographic Distribution")
+
+    if not data['location'].empty:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            fig = geo_charts.plot_jobs_by_city(data['city_counts'], top_n=15)
+            st.plotly_chart(fig, use_container_width=True, key="jobs_by_city")
+
+        with col2:
+            fig = geo_charts.plot_location_type_distribution(data['location_type_counts'])
+            st.plotly_chart(fig, use_container_width=True, key="location_type_distribution")
+
+        # Regional comparison
+        fig = geo_charts.plot_regional_comparison(data['region_counts'])
+        st.plotly_chart(fig, use_container_width=True, key="regional_comparison")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            fig = geo_charts.plot_city_by_location_type(data['location'], top_n=10)
+            st.plotly_chart(fig, use_container_width=True, key="city_by_location_type")
+
+        with col2:
+            fig = geo_charts.plot_remote_percentage_trend(data['remote_trend'])
+            st.plotly_chart(fig, use_container_width=True, key="remote_percentage_trend")
+
+        # Location summary
+        with st.expander("📊 Location Statistics"):
+            summary = geo_charts.create_location_summary_table(data['location'], top_n=20)
+            if not summary.empty:
+                st.dataframe(summary, use_container_width=True)
+    else:
+        st.info("No location data available. Run the ETL pipeline to populate the database.")
+
+
+@st.fragment
+def render_skills_tab(data):
+    """Render the skills analysis tab."""
+    from src.dashboard.components import tech_trends
+
+    st.header("🔧 Skills Analysis")
+
+    if not data['technology'].empty:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            fig = tech_trends.plot_technology_by_category(data['technology'], top_per_category=5)
+            st.plotly_chart(fig, use_container_width=True, key="technology_by_category")
+
+        with col2:
+            if not data['salary_by_tech'].empty:
+                # Top paying technologies
+                st.subheader("💎 Highest Paying Technologies")
+                # Already sorted by avg_salary in SQL; itertuples
+                # avoids boxing each row into a Series
+                top_paying = data['salary_by_tech'].head(10)
+                for tech, avg_salary, job_count in top_paying[
+                    ['technology', 'avg_salary', 'job_count']
+                ].itertuples(index=False, name=None):
+                    st.metric(
+                        label=tech,
+                        value=f"{avg_salary:,.0f} PLN",
+                        delta=f"{job_count} jobs"
+                    )
+
+        # Technology demand by category
+        st.subheader("Technology Demand by Category")
+        fig = tech_trends.plot_technology_categories(data['technology'])
+        st.plotly_chart(fig, use_container_width=True, key="technology_categories_2")
+    else:
+        st.info("No skills data available. Run the ETL pipeline to populate the database.")
+
+
+@st.fragment
+def render_overview_tab(data):
+    """Render the market overview tab."""
+    st.header("📊 Market Overview")
+
+    scrape_info = data['scrape_info']
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Dataset Summary")
+        total_jobs = data['kpis']['total_jobs']
+        st.write(f"**Total Active Jobs:** {total_jobs:,}")
+        st.write(f"**Jobs with Salary Data:** {len(data['salary'])}")
+        st.write(f"**Technologies Tracked:** {data['technology']['technology'].nunique() if not data['technology'].empty else 0}")
+        st.write(f"**Cities:** {data['location']['city'].nunique() if not data['location'].empty else 0}")
+
+    with col2:
+        st.subheader("Recent Activity")
+        st.write(f"**Last Scrape:** {scrape_info['last_update']}")
+        st.write(f"**Jobs Found:** {scrape_info['jobs_found']}")
+        st.write(f"**New Jobs:** {scrape_info['jobs_new']}")
+        st.write(f"**Status:** {scrape_info['status'].upper()}")
+
+    # Recent jobs table
+    if not data['jobs'].empty:
+        st.subheader("Recent Job Postings")
+        recent_jobs = data['jobs'].head(20)[['title', 'company_name', 'city', 'seniority_level', 'salary_avg']].copy()
+        if not recent_jobs.empty:
+            # Format non-null salaries in one pass; nulls fall through to
+            # the fillna instead of a per-row conditional lambda
+            recent_jobs['salary_avg'] = (
+                recent_jobs['salary_avg']
+                .map('{:,.0f} PLN'.format, na_action='ignore')
+                .fillna('N/A')
+            )
+            recent_jobs.columns = ['Title', 'Company', 'City', 'Seniority', 'Avg Salary']
+            st.dataframe(recent_jobs, use_container_width=True, hide_index=True)
+
+
 def main():
     """Main dashboard application."""
 
-    # Header
+    # Styling and header
+    st.markdown(_page_css(), unsafe_allow_html=True)
     st.markdown('<div class="main-header">📊 NoFluffJobs IT Market Dashboard</div>', unsafe_allow_html=True)
     st.markdown("---")
 
     # Initialize database and data loader
     try:
-        db = get_database()
-        data_loader = DashboardDataLoader(db)
+        data_loader = get_data_loader()
     except Exception as e:
         st.error(f"Failed to connect to database: {e}")
         st.info("Please ensure the database exists. Run: python scripts/init_database.py")
@@ -178,185 +405,25 @@ def main():
         "📊 Overview"
     ])
 
-    # Tab 1: Salaries
     with tab1:
-        st.header("💰 Salary Analysis")
-
-        if not data['salary'].empty:
-            col1, col2 = st.columns(2)
-
-            with col1:
-                fig = salary_charts.plot_salary_distribution(data['salary'])
-                st.plotly_chart(fig, use_container_width=True)
-
-            with col2:
-                fig = salary_charts.plot_salary_by_seniority(data['jobs'])
-                st.plotly_chart(fig, use_container_width=True)
+        render_salary_tab(data)
 
-            # Salary by technology
-            st.subheader("Salary by Technology")
-            fig = salary_charts.plot_salary_by_technology(data['salary_by_tech'], top_n=15)
-            st.plotly_chart(fig, use_container_width=True)
-
-            col1, col2 = st.columns(2)
-
-            with col1:
-                fig = salary_charts.plot_salary_trends(data['salary'])
-                st.plotly_chart(fig, use_container_width=True)
-
-            with col2:
-                fig = salary_charts.plot_salary_by_location_type(data['jobs'])
-                st.plotly_chart(fig, use_container_width=True)
-
-            # Summary statistics
-            with st.expander("📊 Salary Statistics"):
-                summary = salary_charts.create_salary_summary_table(data['salary'])
-                if not summary.empty:
-                    st.dataframe(summary, use_container_width=True, hide_index=True)
-        else:
-            st.info("No salary data available. Run the ETL pipeline to populate the database.")
-
-    # Tab 2: Technology Trends
     with tab2:
-        st.header("📈 Technology Trends")
-
-        if not data['technology'].empty:
-            # Top technologies
-            fig = tech_trends.plot_top_technologies(data['technology'], top_n=20)
-            st.plotly_chart(fig, use_container_width=True)
-
-            col1, col2 = st.columns(2)
-
-            with col1:
-                fig = tech_trends.plot_technology_categories(data['technology'])
-                st.plotly_chart(fig, use_container_width=True)
-
-            with col2:
-                fig = tech_trends.plot_technology_trends(data['technology'], top_n=10)
-                st.plotly_chart(fig, use_container_width=True)
-
-            # Heatmap
-            st.subheader("Technology Demand Heatmap")
-            fig = tech_trends.plot_skill_demand_heatmap(data['technology'])
-            st.plotly_chart(fig, use_container_width=True)
-
-            # Summary table
-            with st.expander("📊 Technology Statistics"):
-                summary = tech_trends.create_technology_summary_table(data['technology'], top_n=30)
-                if not summary.empty:
-                    st.dataframe(summary, use_container_width=True)
-        else:
-            st.info("No technology data available. Run the ETL pipeline to populate the database.")
+        render_technology_tab(data)
 
-    # Tab 3: Geographic Distribution
     with tab3:
-        st.header("🗺️ Geographic Distribution")
+        render_geo_tab(data)
 
-        if not data['location'].empty:
-            col1, col2 = st.columns(2)
-
-            with col1:
-                fig = geo_charts.plot_jobs_by_city(data['location'], top_n=15)
-                st.plotly_chart(fig, use_container_width=True)
-
-            with col2:
-                fig = geo_charts.plot_location_type_distribution(data['location'])
-                st.plotly_chart(fig, use_container_width=True)
-
-            # Regional comparison
-            fig = geo_charts.plot_regional_comparison(data['location'])
-            st.plotly_chart(fig, use_container_width=True)
-
-            col1, col2 = st.columns(2)
-
-            with col1:
-                fig = geo_charts.plot_city_by_location_type(data['location'], top_n=10)
-                st.plotly_chart(fig, use_container_width=True)
-
-            with col2:
-                fig = geo_charts.plot_remote_percentage_trend(data['location'])
-                st.plotly_chart(fig, use_container_width=True)
-
-            # Location summary
-            with st.expander("📊 Location Statistics"):
-                summary = geo_charts.create_location_summary_table(data['location'], top_n=20)
-                if not summary.empty:
-                    st.dataframe(summary, use_container_width=True)
-        else:
-            st.info("No location data available. Run the ETL pipeline to populate the database.")
-
-    # Tab 4: Skills Analysis
     with tab4:
-        st.header("🔧 Skills Analysis")
-
-        if not data['technology'].empty:
-            col1, col2 = st.columns(2)
+        render_skills_tab(data)
 
-            with col1:
-                fig = tech_trends.plot_technology_by_category(data['technology'], top_per_category=5)
-                st.plotly_chart(fig, use_container_width=True)
-
-            with col2:
-                if not data['salary_by_tech'].empty:
-                    # Top paying technologies
-                    st.subheader("💎 Highest Paying Technologies")
-                    top_paying = data['salary_by_tech'].nlargest(10, 'avg_salary')
-                    for idx, row in top_paying.iterrows():
-                        st.metric(
-                            label=row['technology'],
-                            value=f"{row['avg_salary']:,.0f} PLN",
-                            delta=f"{row['job_count']} jobs"
-                        )
-
-            # Technology demand by category
-            st.subheader("Technology Demand by Category")
-            fig = tech_trends.plot_technology_categories(data['technology'])
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("No skills data available. Run the ETL pipeline to populate the database.")
-
-    # Tab 5: Overview
     with tab5:
-        st.header("📊 Market Overview")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.subheader("Dataset Summary")
-            total_jobs = data['kpis']['total_jobs']
-            st.write(f"**Total Active Jobs:** {total_jobs:,}")
-            st.write(f"**Jobs with Salary Data:** {len(data['salary'])}")
-            st.write(f"**Technologies Tracked:** {data['technology']['technology'].nunique() if not data['technology'].empty else 0}")
-            st.write(f"**Cities:** {data['location']['city'].nunique() if not data['location'].empty else 0}")
-
-        with col2:
-            st.subheader("Recent Activity")
-            st.write(f"**Last Scrape:** {scrape_info['last_update']}")
-            st.write(f"**Jobs Found:** {scrape_info['jobs_found']}")
-            st.write(f"**New Jobs:** {scrape_info['jobs_new']}")
-            st.write(f"**Status:** {scrape_info['status'].upper()}")
-
-        # Recent jobs table
-        if not data['jobs'].empty:
-            st.subheader("Recent Job Postings")
-            recent_jobs = data['jobs'].head(20)[['title', 'company_name', 'city', 'seniority_level', 'salary_avg']].copy()
-            if not recent_jobs.empty:
-                recent_jobs['salary_avg'] = recent_jobs['salary_avg'].apply(
-                    lambda x: f"{x:,.0f} PLN" if pd.notna(x) else "N/A"
-                )
-                recent_jobs.columns = ['Title', 'Company', 'City', 'Seniority', 'Avg Salary']
-                st.dataframe(recent_jobs, use_container_width=True, hide_index=True)
+        render_overview_tab(data)
 
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: gray; padding: 1rem;">
-        <p>NoFluffJobs IT Market Dashboard | Data Engineering Project</p>
-        <p>Built with Streamlit & Plotly | Data from NoFluffJobs</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_footer_html(), unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
-    import pandas as pd  # Import here to avoid issues
     main()
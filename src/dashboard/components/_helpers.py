@@ -0,0 +1,114 @@
+"""
+Shared helpers for dashboard chart components.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objects as go
+
+# Trend charts send at most this many points per trace to the browser;
+# longer histories are downsampled first
+_MAX_TREND_POINTS = 1000
+
+
+def _downsample_indices(y: np.ndarray, n_out: int = _MAX_TREND_POINTS) -> np.ndarray:
+    """
+    Pick at most n_out row indices using largest-triangle-three-buckets.
+
+    LTTB keeps the points that contribute most to the visual shape of a
+    line (peaks, troughs, inflections), so a multi-year daily history
+    can be drawn with a bounded number of points without visibly
+    changing the chart.
+
+    Args:
+        y: Series values, evenly ordered along x
+        n_out: Maximum number of indices to return
+
+    Returns:
+        Sorted array of selected indices (all indices if already small)
+    """
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    x = np.arange(n, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # First and last points are always kept; interior points fall into
+    # n_out - 2 even buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket anchors the triangle
+        nxt_lo, nxt_hi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[nxt_lo:nxt_hi].mean() if nxt_hi > nxt_lo else x[-1]
+        avg_y = y[nxt_lo:nxt_hi].mean() if nxt_hi > nxt_lo else y[-1]
+        # Largest triangle area between previous point and next-bucket average
+        area = np.abs(
+            (x[prev] - avg_x) * (y[lo:hi] - y[prev])
+            - (x[prev] - x[lo:hi]) * (avg_y - y[prev])
+        )
+        prev = lo + int(area.argmax()) if hi > lo else lo
+        selected[i + 1] = prev
+
+    return np.unique(selected)
+
+
+# Pristine layout for placeholder figures, allocated once; _empty_figure
+# runs on every empty-data rerun, so the per-call dict building is
+# hoisted out
+_EMPTY_LAYOUT = dict(
+    xaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
+    yaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
+    height=400
+)
+
+
+@lru_cache(maxsize=32)
+def _empty_figure_dict(message: str) -> dict:
+    """
+    Build (and cache) the serialized placeholder figure for a message.
+
+    The dashboard shows a handful of distinct placeholder messages, so
+    caching the validated figure dict skips Plotly's object-model work
+    on every empty-data rerun after the first.
+
+    Args:
+        message: Message to display
+
+    Returns:
+        Plotly figure dict
+    """
+    fig = go.Figure(layout=_EMPTY_LAYOUT)
+
+    fig.add_annotation(
+        text=message,
+        xref="paper",
+        yref="paper",
+        x=0.5,
+        y=0.5,
+        showarrow=False,
+        font=dict(size=16, color="gray")
+    )
+
+    return fig.to_dict()
+
+
+def _empty_figure(message: str) -> go.Figure:
+    """
+    Create an empty figure with a message.
+
+    Args:
+        message: Message to display
+
+    Returns:
+        Plotly figure
+    """
+    # Each caller gets a fresh Figure built from the cached dict, so
+    # mutating one placeholder cannot leak into another
+    return go.Figure(_empty_figure_dict(message))
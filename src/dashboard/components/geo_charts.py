@@ -2,34 +2,58 @@
 Geographic visualization components for dashboard.
 """
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-
-
-def plot_jobs_by_city(df: pd.DataFrame, top_n: int = 15) -> go.Figure:
+import plotly.io as pio
+import streamlit as st
+
+from ._helpers import _MAX_TREND_POINTS, _downsample_indices, _empty_figure
+
+# Shared layout defaults registered once at import; figures reference
+# the template by name instead of re-validating the same properties in
+# every update_layout call. Charts with a non-default height still set
+# it explicitly.
+pio.templates['dashboard'] = go.layout.Template(layout=dict(height=400))
+
+# Shared per-location-type palette, built once. The previous per-call
+# dicts fell back to '#gray', which is not a valid hex color and made
+# Plotly silently pick its own default.
+LOCATION_TYPE_COLORS = {
+    'remote': '#2ca02c',
+    'hybrid': '#ff7f0e',
+    'office': '#1f77b4'
+}
+_DEFAULT_COLOR = '#808080'
+
+
+
+# Memoize built figures on (data hash, params): a Streamlit rerun with
+# unchanged inputs reuses the prior figure instead of rebuilding and
+# re-serializing it. DataFrames are hashed by shape plus row hashes so
+# the cache key tracks content, not object identity.
+_cache_figure = st.cache_data(
+    ttl=3600,
+    hash_funcs={pd.DataFrame: lambda df: (df.shape, pd.util.hash_pandas_object(df, index=False).sum())},
+)
+
+@_cache_figure
+def plot_jobs_by_city(city_counts: pd.DataFrame, top_n: int = 15) -> go.Figure:
     """
     Create bar chart of jobs by city.
 
     Args:
-        df: DataFrame with city and job_count
-        top_n: Number of top cities to show
+        city_counts: Pre-aggregated DataFrame with city and job_count,
+            as returned by DashboardDataLoader.get_city_counts
+        top_n: Number of top cities to show (title only; the loader
+            already limits the rows)
 
     Returns:
         Plotly figure
     """
-    if df.empty or 'city' not in df.columns:
+    if city_counts.empty or 'city' not in city_counts.columns:
         return _empty_figure("No city data available")
 
-    # Filter out nulls and group by city
-    df_clean = df[df['city'].notna()].copy()
-
-    if df_clean.empty:
-        return _empty_figure("No valid city data")
-
-    city_counts = df_clean.groupby('city')['job_count'].sum().reset_index()
-    city_counts = city_counts.nlargest(top_n, 'job_count')
-
     fig = go.Figure()
 
     fig.add_trace(go.Bar(
@@ -49,6 +73,7 @@ def plot_jobs_by_city(df: pd.DataFrame, top_n: int = 15) -> go.Figure:
     ))
 
     fig.update_layout(
+        template='dashboard',
         title=f'Job Distribution by City (Top {top_n})',
         xaxis_title='City',
         yaxis_title='Number of Jobs',
@@ -60,38 +85,33 @@ def plot_jobs_by_city(df: pd.DataFrame, top_n: int = 15) -> go.Figure:
     return fig
 
 
-def plot_location_type_distribution(df: pd.DataFrame) -> go.Figure:
+@_cache_figure
+def plot_location_type_distribution(location_counts: pd.DataFrame) -> go.Figure:
     """
     Create pie chart of location type distribution.
 
     Args:
-        df: DataFrame with location_type and job_count
+        location_counts: Pre-aggregated DataFrame with location_type and
+            job_count, as returned by
+            DashboardDataLoader.get_location_type_counts
 
     Returns:
         Plotly figure
     """
-    if df.empty or 'location_type' not in df.columns:
+    if location_counts.empty or 'location_type' not in location_counts.columns:
         return _empty_figure("No location type data available")
 
-    # Filter out nulls and group by location type
-    df_clean = df[df['location_type'].notna()].copy()
-
-    if df_clean.empty:
-        return _empty_figure("No valid location type data")
-
-    location_counts = df_clean.groupby('location_type')['job_count'].sum().reset_index()
-
-    # Define colors for location types
-    color_map = {
-        'remote': '#2ca02c',
-        'hybrid': '#ff7f0e',
-        'office': '#1f77b4'
-    }
-
-    colors = [color_map.get(loc, '#gray') for loc in location_counts['location_type']]
+    # Map colors per row with the C-level dict lookup
+    colors = (
+        location_counts['location_type']
+        .map(LOCATION_TYPE_COLORS)
+        .fillna(_DEFAULT_COLOR)
+        .to_numpy()
+    )
 
     fig = go.Figure(data=[go.Pie(
-        labels=location_counts['location_type'].str.title(),
+        # Title-case the handful of category labels, not every row
+        labels=location_counts['location_type'].cat.rename_categories(str.title),
         values=location_counts['job_count'],
         marker=dict(colors=colors),
         hole=0.3,
@@ -102,33 +122,30 @@ def plot_location_type_distribution(df: pd.DataFrame) -> go.Figure:
     )])
 
     fig.update_layout(
+        template='dashboard',
         title='Job Distribution by Location Type',
-        height=400,
         annotations=[dict(text='Location<br>Type', x=0.5, y=0.5, font_size=14, showarrow=False)]
     )
 
     return fig
 
 
-def plot_location_type_trend(df: pd.DataFrame) -> go.Figure:
+@_cache_figure
+def plot_location_type_trend(trend_data: pd.DataFrame) -> go.Figure:
     """
     Create stacked area chart of location type trends over time.
 
     Args:
-        df: DataFrame with snapshot_date, location_type, and job_count
+        trend_data: Pre-aggregated DataFrame with snapshot_date,
+            location_type and job_count, as returned by
+            DashboardDataLoader.get_location_type_trend
 
     Returns:
         Plotly figure
     """
-    if df.empty or 'snapshot_date' not in df.columns or 'location_type' not in df.columns:
+    if trend_data.empty or 'snapshot_date' not in trend_data.columns or 'location_type' not in trend_data.columns:
         return _empty_figure("No temporal location data available")
 
-    # Group by date and location type
-    trend_data = df.groupby(['snapshot_date', 'location_type'])['job_count'].sum().reset_index()
-
-    if trend_data.empty:
-        return _empty_figure("Insufficient data for trend analysis")
-
     # Pivot for area chart
     trend_pivot = trend_data.pivot(
         index='snapshot_date',
@@ -138,56 +155,55 @@ def plot_location_type_trend(df: pd.DataFrame) -> go.Figure:
 
     fig = go.Figure()
 
-    colors = {
-        'remote': '#2ca02c',
-        'hybrid': '#ff7f0e',
-        'office': '#1f77b4'
-    }
-
-    for col in trend_pivot.columns:
-        fig.add_trace(go.Scatter(
-            x=trend_pivot.index,
-            y=trend_pivot[col],
+    # WebGL traces render on the GPU, so the chart stays responsive as
+    # the snapshot history grows. Scattergl has no stackgroup, so the
+    # stacking is precomputed as a cumulative sum and each band drawn as
+    # a filled trace on top of the previous one.
+    stacked = trend_pivot.cumsum(axis=1)
+
+    # Long histories are LTTB-downsampled on the total (top band) so all
+    # bands keep the same dates and stay aligned
+    if len(stacked) > _MAX_TREND_POINTS:
+        stacked = stacked.iloc[_downsample_indices(stacked.iloc[:, -1].to_numpy())]
+
+    for i, col in enumerate(stacked.columns):
+        fig.add_trace(go.Scattergl(
+            x=stacked.index,
+            y=stacked[col],
             name=col.title(),
             mode='lines',
-            stackgroup='one',
-            fillcolor=colors.get(col, '#gray'),
-            line=dict(width=0.5, color=colors.get(col, '#gray'))
+            fill='tozeroy' if i == 0 else 'tonexty',
+            fillcolor=LOCATION_TYPE_COLORS.get(col, _DEFAULT_COLOR),
+            line=dict(width=0.5, color=LOCATION_TYPE_COLORS.get(col, _DEFAULT_COLOR))
         ))
 
     fig.update_layout(
+        template='dashboard',
         title='Location Type Trends Over Time',
         xaxis_title='Date',
         yaxis_title='Number of Jobs',
-        hovermode='x unified',
-        height=400
+        hovermode='x unified'
     )
 
     return fig
 
 
-def plot_regional_comparison(df: pd.DataFrame) -> go.Figure:
+@_cache_figure
+def plot_regional_comparison(region_counts: pd.DataFrame) -> go.Figure:
     """
     Create bar chart comparing job counts by region.
 
     Args:
-        df: DataFrame with region and job_count
+        region_counts: Pre-aggregated DataFrame with region and
+            job_count, ascending by count, as returned by
+            DashboardDataLoader.get_region_counts
 
     Returns:
         Plotly figure
     """
-    if df.empty or 'region' not in df.columns:
+    if region_counts.empty or 'region' not in region_counts.columns:
         return _empty_figure("No region data available")
 
-    # Filter out nulls and group by region
-    df_clean = df[df['region'].notna()].copy()
-
-    if df_clean.empty:
-        return _empty_figure("No valid region data")
-
-    region_counts = df_clean.groupby('region')['job_count'].sum().reset_index()
-    region_counts = region_counts.sort_values('job_count', ascending=True)
-
     fig = go.Figure()
 
     fig.add_trace(go.Bar(
@@ -208,6 +224,7 @@ def plot_regional_comparison(df: pd.DataFrame) -> go.Figure:
     ))
 
     fig.update_layout(
+        template='dashboard',
         title='Job Distribution by Region',
         xaxis_title='Number of Jobs',
         yaxis_title='Region',
@@ -218,6 +235,7 @@ def plot_regional_comparison(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@_cache_figure
 def plot_city_by_location_type(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
     """
     Create grouped bar chart showing location types by city.
@@ -232,37 +250,44 @@ def plot_city_by_location_type(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
     if df.empty or 'city' not in df.columns or 'location_type' not in df.columns:
         return _empty_figure("No city/location type data available")
 
-    # Filter valid data
-    df_clean = df[df['city'].notna() & df['location_type'].notna()].copy()
-
-    if df_clean.empty:
-        return _empty_figure("No valid city/location data")
+    # Nulls are already filtered in the loader's SQL, so no copy is made
 
-    # Get top cities by total job count
-    top_cities = df_clean.groupby('city')['job_count'].sum().nlargest(top_n).index
+    # Get top cities by total job count; sort=False skips the sort on the
+    # group keys that nlargest would redo anyway
+    top_cities = df.groupby('city', sort=False, observed=True)['job_count'].sum().nlargest(top_n).index
 
     # Filter to top cities
-    df_top = df_clean[df_clean['city'].isin(top_cities)]
+    df_top = df[df['city'].isin(top_cities)]
 
-    # Group by city and location type
-    city_location = df_top.groupby(['city', 'location_type'])['job_count'].sum().reset_index()
-
-    fig = px.bar(
-        city_location,
-        x='city',
-        y='job_count',
-        color='location_type',
-        title=f'Location Types in Top {top_n} Cities',
-        labels={'job_count': 'Number of Jobs', 'city': 'City', 'location_type': 'Location Type'},
-        barmode='group',
-        color_discrete_map={
-            'remote': '#2ca02c',
-            'hybrid': '#ff7f0e',
-            'office': '#1f77b4'
-        }
+    # Aggregate and pivot in one pass, then build one go.Bar per
+    # location type directly — px.bar would rerun its own type coercion
+    # and color-mapping pipeline on every call
+    city_location = df_top.pivot_table(
+        index='city',
+        columns='location_type',
+        values='job_count',
+        aggfunc='sum',
+        fill_value=0,
+        observed=True
     )
 
+    fig = go.Figure()
+
+    for location_type in city_location.columns:
+        fig.add_trace(go.Bar(
+            x=city_location.index,
+            y=city_location[location_type].to_numpy(),
+            name=str(location_type).title(),
+            marker_color=LOCATION_TYPE_COLORS.get(location_type, _DEFAULT_COLOR)
+        ))
+
     fig.update_layout(
+        template='dashboard',
+        barmode='group',
+        title=f'Location Types in Top {top_n} Cities',
+        xaxis_title='City',
+        yaxis_title='Number of Jobs',
+        legend_title_text='Location Type',
         height=450,
         xaxis_tickangle=-45
     )
@@ -284,61 +309,47 @@ def create_location_summary_table(df: pd.DataFrame, top_n: int = 15) -> pd.DataF
     if df.empty or 'city' not in df.columns:
         return pd.DataFrame()
 
-    # Filter valid cities
-    df_clean = df[df['city'].notna()].copy()
-
-    if df_clean.empty:
-        return pd.DataFrame()
-
-    # Group by city and region
-    summary = df_clean.groupby(['city', 'region']).agg({
-        'job_count': 'sum'
-    }).reset_index()
-
-    summary = summary.nlargest(top_n, 'job_count')
-    summary = summary.rename(columns={
-        'city': 'City',
-        'region': 'Region',
-        'job_count': 'Job Count'
-    })
-
-    summary = summary.reset_index(drop=True)
-    summary.index = summary.index + 1
+    # Group by city and region (nulls already filtered in the loader's
+    # SQL); as_index=False keeps the keys as columns without the
+    # reset_index copy, and the 1-based row numbers are assigned as a
+    # RangeIndex directly
+    summary = (
+        df.groupby(['city', 'region'], as_index=False, sort=False, observed=True)
+        .agg(job_count=('job_count', 'sum'))
+        .nlargest(top_n, 'job_count')
+        .rename(columns={
+            'city': 'City',
+            'region': 'Region',
+            'job_count': 'Job Count'
+        })
+    )
+    summary.index = pd.RangeIndex(1, len(summary) + 1)
 
     return summary
 
 
-def plot_remote_percentage_trend(df: pd.DataFrame) -> go.Figure:
+@_cache_figure
+def plot_remote_percentage_trend(trend: pd.DataFrame) -> go.Figure:
     """
     Create line chart showing percentage of remote jobs over time.
 
     Args:
-        df: DataFrame with snapshot_date, location_type, and job_count
+        trend: Pre-aggregated DataFrame with snapshot_date and
+            remote_pct, as returned by
+            DashboardDataLoader.get_remote_pct_trend
 
     Returns:
         Plotly figure
     """
-    if df.empty or 'snapshot_date' not in df.columns or 'location_type' not in df.columns:
+    if trend.empty or 'snapshot_date' not in trend.columns or 'remote_pct' not in trend.columns:
         return _empty_figure("No temporal location data available")
 
-    # Calculate total jobs and remote jobs per date
-    total_by_date = df.groupby('snapshot_date')['job_count'].sum().reset_index()
-    total_by_date.columns = ['snapshot_date', 'total_jobs']
-
-    remote_by_date = df[df['location_type'] == 'remote'].groupby('snapshot_date')['job_count'].sum().reset_index()
-    remote_by_date.columns = ['snapshot_date', 'remote_jobs']
-
-    # Merge and calculate percentage
-    trend = total_by_date.merge(remote_by_date, on='snapshot_date', how='left')
-    trend['remote_jobs'] = trend['remote_jobs'].fillna(0)
-    trend['remote_pct'] = (trend['remote_jobs'] / trend['total_jobs'] * 100).round(1)
-
-    if trend.empty:
-        return _empty_figure("Insufficient data for trend")
+    if len(trend) > _MAX_TREND_POINTS:
+        trend = trend.iloc[_downsample_indices(trend['remote_pct'].to_numpy())]
 
     fig = go.Figure()
 
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=trend['snapshot_date'],
         y=trend['remote_pct'],
         mode='lines+markers',
@@ -351,42 +362,11 @@ def plot_remote_percentage_trend(df: pd.DataFrame) -> go.Figure:
     ))
 
     fig.update_layout(
+        template='dashboard',
         title='Remote Work Trend',
         xaxis_title='Date',
         yaxis_title='Percentage of Remote Jobs (%)',
-        hovermode='x unified',
-        height=400
-    )
-
-    return fig
-
-
-def _empty_figure(message: str) -> go.Figure:
-    """
-    Create an empty figure with a message.
-
-    Args:
-        message: Message to display
-
-    Returns:
-        Plotly figure
-    """
-    fig = go.Figure()
-
-    fig.add_annotation(
-        text=message,
-        xref="paper",
-        yref="paper",
-        x=0.5,
-        y=0.5,
-        showarrow=False,
-        font=dict(size=16, color="gray")
-    )
-
-    fig.update_layout(
-        xaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
-        yaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
-        height=400
+        hovermode='x unified'
     )
 
     return fig
@@ -2,12 +2,27 @@
 Salary visualization components for dashboard.
 """
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import streamlit as st
 
+from ._helpers import _MAX_TREND_POINTS, _downsample_indices, _empty_figure
 
+
+
+# Memoize built figures on (data hash, params): a Streamlit rerun with
+# unchanged inputs reuses the prior figure instead of rebuilding and
+# re-serializing it. DataFrames are hashed by shape plus row hashes so
+# the cache key tracks content, not object identity.
+_cache_figure = st.cache_data(
+    ttl=3600,
+    hash_funcs={pd.DataFrame: lambda df: (df.shape, pd.util.hash_pandas_object(df, index=False).sum())},
+)
+
+@_cache_figure
 def plot_salary_distribution(df: pd.DataFrame) -> go.Figure:
     """
     Create histogram of salary distribution.
@@ -18,26 +33,39 @@ def plot_salary_distribution(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly figure
     """
-    if df.empty or 'salary_avg' not in df.columns:
+    if df.shape[0] == 0 or 'salary_avg' not in df.columns:
         return _empty_figure("No salary data available")
 
-    # Filter out nulls
-    df_clean = df[df['salary_avg'].notna()].copy()
+    # Only the salary column is read, so pull it as an ndarray directly
+    # instead of filtering and copying the whole frame
+    salaries = df['salary_avg'].dropna().to_numpy(dtype=np.float64)
 
-    if df_clean.empty:
+    if salaries.size == 0:
         return _empty_figure("No valid salary data")
 
-    fig = px.histogram(
-        df_clean,
-        x='salary_avg',
-        nbins=30,
+    # Bin server-side: the figure then carries 30 bar heights instead of
+    # every raw salary, so payload size and browser work stay O(nbins)
+    # no matter how many postings are loaded
+    counts, edges = np.histogram(salaries, bins=30)
+    centers = (edges[:-1] + edges[1:]) / 2
+
+    fig = go.Figure(go.Bar(
+        x=centers,
+        y=counts,
+        width=np.diff(edges),
+        marker_color='#1f77b4',
+        hovertemplate='Salary: %{x:,.0f} PLN<br>Jobs: %{y}<extra></extra>'
+    ))
+
+    fig.update_layout(
         title='Salary Distribution (PLN)',
-        labels={'salary_avg': 'Average Salary (PLN)', 'count': 'Number of Jobs'},
-        color_discrete_sequence=['#1f77b4']
+        xaxis_title='Average Salary (PLN)',
+        yaxis_title='Number of Jobs',
+        bargap=0
     )
 
     # Add median line
-    median_salary = df_clean['salary_avg'].median()
+    median_salary = np.median(salaries)
     fig.add_vline(
         x=median_salary,
         line_dash='dash',
@@ -55,6 +83,7 @@ def plot_salary_distribution(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@_cache_figure
 def plot_salary_by_technology(df: pd.DataFrame, top_n: int = 15) -> go.Figure:
     """
     Create box plot of salaries by technology.
@@ -66,7 +95,7 @@ def plot_salary_by_technology(df: pd.DataFrame, top_n: int = 15) -> go.Figure:
     Returns:
         Plotly figure
     """
-    if df.empty:
+    if df.shape[0] == 0 or not {'technology', 'avg_salary', 'job_count'}.issubset(df.columns):
         return _empty_figure("No technology salary data available")
 
     # Sort by job count and take top N
@@ -79,7 +108,8 @@ def plot_salary_by_technology(df: pd.DataFrame, top_n: int = 15) -> go.Figure:
         y=df_sorted['technology'],
         x=df_sorted['avg_salary'],
         orientation='h',
-        text=[f"{val:,.0f} PLN" for val in df_sorted['avg_salary']],
+        # Client-side label formatting: no Python loop over the values
+        texttemplate='%{x:,.0f} PLN',
         textposition='auto',
         marker=dict(
             color=df_sorted['avg_salary'],
@@ -104,6 +134,7 @@ def plot_salary_by_technology(df: pd.DataFrame, top_n: int = 15) -> go.Figure:
     return fig
 
 
+@_cache_figure
 def plot_salary_trends(df: pd.DataFrame) -> go.Figure:
     """
     Create time series of salary trends.
@@ -114,15 +145,18 @@ def plot_salary_trends(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly figure
     """
-    if df.empty or 'snapshot_date' not in df.columns or 'salary_avg' not in df.columns:
+    if df.shape[0] == 0 or not {'snapshot_date', 'salary_avg'}.issubset(df.columns):
         return _empty_figure("No salary trend data available")
 
-    # Group by date and calculate statistics
-    df_trend = df.groupby('snapshot_date').agg({
+    # Group by date and calculate statistics; the groupby skips its
+    # implicit key sort and the much smaller aggregated frame is ordered
+    # chronologically afterwards
+    df_trend = df.groupby('snapshot_date', sort=False, observed=True).agg({
         'salary_avg': ['mean', 'median', 'count']
     }).reset_index()
 
     df_trend.columns = ['snapshot_date', 'mean_salary', 'median_salary', 'count']
+    df_trend = df_trend.sort_values('snapshot_date')
 
     # Filter dates with enough data points
     df_trend = df_trend[df_trend['count'] >= 5]
@@ -130,10 +164,17 @@ def plot_salary_trends(df: pd.DataFrame) -> go.Figure:
     if df_trend.empty:
         return _empty_figure("Insufficient data for trend analysis")
 
+    # Long histories are LTTB-downsampled on the mean so both lines keep
+    # the same dates and stay aligned
+    if len(df_trend) > _MAX_TREND_POINTS:
+        df_trend = df_trend.iloc[_downsample_indices(df_trend['mean_salary'].to_numpy(dtype=float))]
+
     fig = go.Figure()
 
+    # Scattergl traces render through WebGL, so the browser cost stays
+    # flat as the history grows
     # Add mean salary line
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=df_trend['snapshot_date'],
         y=df_trend['mean_salary'],
         mode='lines+markers',
@@ -143,7 +184,7 @@ def plot_salary_trends(df: pd.DataFrame) -> go.Figure:
     ))
 
     # Add median salary line
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=df_trend['snapshot_date'],
         y=df_trend['median_salary'],
         mode='lines+markers',
@@ -169,6 +210,7 @@ def plot_salary_trends(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@_cache_figure
 def plot_salary_by_seniority(df: pd.DataFrame) -> go.Figure:
     """
     Create box plot of salaries by seniority level.
@@ -179,11 +221,11 @@ def plot_salary_by_seniority(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly figure
     """
-    if df.empty or 'seniority_level' not in df.columns or 'salary_avg' not in df.columns:
+    if df.shape[0] == 0 or not {'seniority_level', 'salary_avg'}.issubset(df.columns):
         return _empty_figure("No seniority salary data available")
 
-    # Filter valid data
-    df_clean = df[df['seniority_level'].notna() & df['salary_avg'].notna()].copy()
+    # dropna filters both columns in one pass; no .copy() of the slice
+    df_clean = df.dropna(subset=['seniority_level', 'salary_avg'])
 
     if df_clean.empty:
         return _empty_figure("No valid seniority data")
@@ -193,11 +235,11 @@ def plot_salary_by_seniority(df: pd.DataFrame) -> go.Figure:
     existing_levels = [level for level in seniority_order if level in df_clean['seniority_level'].values]
 
     if existing_levels:
-        df_clean['seniority_level'] = pd.Categorical(
+        df_clean = df_clean.assign(seniority_level=pd.Categorical(
             df_clean['seniority_level'],
             categories=existing_levels,
             ordered=True
-        )
+        ))
 
     fig = px.box(
         df_clean,
@@ -221,6 +263,7 @@ def plot_salary_by_seniority(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@_cache_figure
 def plot_salary_by_location_type(df: pd.DataFrame) -> go.Figure:
     """
     Create box plot comparing salaries by location type.
@@ -231,12 +274,11 @@ def plot_salary_by_location_type(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly figure
     """
-    if df.empty:
+    if df.shape[0] == 0 or not {'location_type', 'salary_avg'}.issubset(df.columns):
         return _empty_figure("No location salary data available")
 
-    # Merge location and salary data
-    # This assumes df already has both location_type and salary_avg
-    df_clean = df[df['location_type'].notna() & df['salary_avg'].notna()].copy()
+    # dropna filters both columns in one pass, no .copy() of the slice
+    df_clean = df.dropna(subset=['location_type', 'salary_avg'])
 
     if df_clean.empty:
         return _empty_figure("No valid location data")
@@ -273,55 +315,24 @@ def create_salary_summary_table(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Summary DataFrame
     """
-    if df.empty or 'salary_avg' not in df.columns:
+    if df.shape[0] == 0 or 'salary_avg' not in df.columns:
         return pd.DataFrame()
 
-    df_clean = df[df['salary_avg'].notna()]
+    salaries = df['salary_avg'].dropna().to_numpy(dtype=np.float64)
 
-    if df_clean.empty:
+    if salaries.size == 0:
         return pd.DataFrame()
 
+    # One quantile call covers min/quartiles/median/max in a single pass
+    # over the array instead of six separate pandas reductions
+    q_min, q25, median, q75, q_max = np.quantile(salaries, [0, 0.25, 0.5, 0.75, 1.0])
+
     summary = pd.DataFrame({
         'Metric': ['Mean', 'Median', 'Min', 'Max', '25th Percentile', '75th Percentile'],
         'Value (PLN)': [
-            f"{df_clean['salary_avg'].mean():,.0f}",
-            f"{df_clean['salary_avg'].median():,.0f}",
-            f"{df_clean['salary_avg'].min():,.0f}",
-            f"{df_clean['salary_avg'].max():,.0f}",
-            f"{df_clean['salary_avg'].quantile(0.25):,.0f}",
-            f"{df_clean['salary_avg'].quantile(0.75):,.0f}"
+            f"{value:,.0f}"
+            for value in (salaries.mean(), median, q_min, q_max, q25, q75)
         ]
     })
 
     return summary
-
-
-def _empty_figure(message: str) -> go.Figure:
-    """
-    Create an empty figure with a message.
-
-    Args:
-        message: Message to display
-
-    Returns:
-        Plotly figure
-    """
-    fig = go.Figure()
-
-    fig.add_annotation(
-        text=message,
-        xref="paper",
-        yref="paper",
-        x=0.5,
-        y=0.5,
-        showarrow=False,
-        font=dict(size=16, color="gray")
-    )
-
-    fig.update_layout(
-        xaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
-        yaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
-        height=400
-    )
-
-    return fig
@@ -2,37 +2,51 @@
 Technology trends visualization components for dashboard.
 """
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import streamlit as st
 
+from ._helpers import _MAX_TREND_POINTS, _downsample_indices, _empty_figure
 
-def plot_top_technologies(df: pd.DataFrame, top_n: int = 20) -> go.Figure:
+
+
+# Memoize built figures on (data hash, params): a Streamlit rerun with
+# unchanged inputs reuses the prior figure instead of rebuilding and
+# re-serializing it. DataFrames are hashed by shape plus row hashes so
+# the cache key tracks content, not object identity.
+_cache_figure = st.cache_data(
+    ttl=3600,
+    hash_funcs={pd.DataFrame: lambda df: (df.shape, pd.util.hash_pandas_object(df, index=False).sum())},
+)
+
+@_cache_figure
+def plot_top_technologies(tech_counts: pd.DataFrame, top_n: int = 20) -> go.Figure:
     """
     Create bar chart of most popular technologies.
 
     Args:
-        df: DataFrame with technology data
-        top_n: Number of top technologies to show
+        tech_counts: Pre-aggregated DataFrame with technology and
+            job_count, as returned by
+            DashboardDataLoader.get_top_technologies
+        top_n: Number of top technologies to show (title only; the
+            loader already limits the rows)
 
     Returns:
         Plotly figure
     """
-    if df.empty or 'technology' not in df.columns:
+    if tech_counts.shape[0] == 0 or not {'technology', 'job_count'}.issubset(tech_counts.columns):
         return _empty_figure("No technology data available")
 
-    # Group by technology and sum job counts
-    tech_counts = df.groupby('technology')['job_count'].sum().reset_index()
-    tech_counts = tech_counts.nlargest(top_n, 'job_count')
-
     fig = go.Figure()
 
     fig.add_trace(go.Bar(
         x=tech_counts['job_count'],
         y=tech_counts['technology'],
         orientation='h',
-        text=tech_counts['job_count'],
+        texttemplate='%{x:,d}',
         textposition='auto',
         marker=dict(
             color=tech_counts['job_count'],
@@ -57,28 +71,31 @@ def plot_top_technologies(df: pd.DataFrame, top_n: int = 20) -> go.Figure:
     return fig
 
 
-def plot_technology_trends(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
+@_cache_figure
+def plot_technology_trends(df_top: pd.DataFrame, top_n: int = 10) -> go.Figure:
     """
     Create line chart showing technology popularity trends over time.
 
     Args:
-        df: DataFrame with technology, snapshot_date, and job_count
-        top_n: Number of top technologies to show
+        df_top: Pre-aggregated DataFrame with technology, snapshot_date
+            and job_count, already limited to the top technologies by
+            DashboardDataLoader.get_top_technology_trends
+        top_n: Number of top technologies to show (title only; the
+            loader already limits the rows)
 
     Returns:
         Plotly figure
     """
-    if df.empty or 'snapshot_date' not in df.columns:
+    if df_top.shape[0] == 0 or not {'technology', 'snapshot_date', 'job_count'}.issubset(df_top.columns):
         return _empty_figure("No technology trend data available")
 
-    # Get top N technologies by total job count
-    top_techs = df.groupby('technology')['job_count'].sum().nlargest(top_n).index
-
-    # Filter to only top technologies
-    df_top = df[df['technology'].isin(top_techs)].copy()
-
-    if df_top.empty:
-        return _empty_figure("Insufficient data for trends")
+    # Long histories are LTTB-downsampled per technology so each line
+    # carries a bounded number of points
+    if df_top['snapshot_date'].nunique() > _MAX_TREND_POINTS:
+        df_top = pd.concat([
+            group.iloc[_downsample_indices(group['job_count'].to_numpy(dtype=float))]
+            for _, group in df_top.groupby('technology', sort=False, observed=True)
+        ])
 
     fig = px.line(
         df_top,
@@ -87,7 +104,9 @@ def plot_technology_trends(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
         color='technology',
         title=f'Technology Popularity Trends (Top {top_n})',
         labels={'snapshot_date': 'Date', 'job_count': 'Number of Jobs', 'technology': 'Technology'},
-        markers=True
+        markers=True,
+        # WebGL rendering keeps the multi-line chart responsive
+        render_mode='webgl'
     )
 
     fig.update_layout(
@@ -104,6 +123,7 @@ def plot_technology_trends(df: pd.DataFrame, top_n: int = 10) -> go.Figure:
     return fig
 
 
+@_cache_figure
 def plot_technology_categories(df: pd.DataFrame) -> go.Figure:
     """
     Create pie chart of technology distribution by category.
@@ -114,11 +134,11 @@ def plot_technology_categories(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly figure
     """
-    if df.empty or 'category' not in df.columns:
+    if df.shape[0] == 0 or not {'category', 'job_count'}.issubset(df.columns):
         return _empty_figure("No category data available")
 
     # Group by category
-    category_counts = df.groupby('category')['job_count'].sum().reset_index()
+    category_counts = df.groupby('category', sort=False, observed=True)['job_count'].sum().reset_index()
     category_counts = category_counts[category_counts['job_count'] > 0]
 
     if category_counts.empty:
@@ -146,6 +166,7 @@ def plot_technology_categories(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+@_cache_figure
 def plot_technology_by_category(df: pd.DataFrame, top_per_category: int = 5) -> go.Figure:
     """
     Create grouped bar chart of top technologies per category.
@@ -157,23 +178,27 @@ def plot_technology_by_category(df: pd.DataFrame, top_per_category: int = 5) ->
     Returns:
         Plotly figure
     """
-    if df.empty:
+    if df.shape[0] == 0 or not {'category', 'technology', 'job_count'}.issubset(df.columns):
         return _empty_figure("No technology data available")
 
-    # Get top technologies per category
-    top_techs = []
-
-    for category in df['category'].unique():
-        if pd.notna(category):
-            cat_df = df[df['category'] == category].groupby('technology')['job_count'].sum().reset_index()
-            cat_top = cat_df.nlargest(top_per_category, 'job_count')
-            cat_top['category'] = category
-            top_techs.append(cat_top)
+    # One grouped aggregation over the whole frame, then a vectorized
+    # top-N per category via sort + head — replaces the per-category
+    # mask / groupby / nlargest / concat loop with two passes total
+    agg = (
+        df.dropna(subset=['category'])
+        .groupby(['category', 'technology'], sort=False, observed=True)['job_count']
+        .sum()
+        .reset_index()
+    )
 
-    if not top_techs:
+    if agg.empty:
         return _empty_figure("No valid category data")
 
-    df_top = pd.concat(top_techs, ignore_index=True)
+    df_top = (
+        agg.sort_values(['category', 'job_count'], ascending=[True, False])
+        .groupby('category', sort=False, observed=True)
+        .head(top_per_category)
+    )
 
     fig = px.bar(
         df_top,
@@ -193,21 +218,67 @@ def plot_technology_by_category(df: pd.DataFrame, top_per_category: int = 5) ->
     return fig
 
 
+@_cache_figure
 def plot_technology_co_occurrence(df: pd.DataFrame, technology: str, top_n: int = 10) -> go.Figure:
     """
     Show which technologies most commonly appear with a given technology.
 
     Args:
-        df: DataFrame with job technologies
+        df: DataFrame with distinct job_id / technology pairs, as
+            returned by DashboardDataLoader.get_job_technology_pairs
         technology: The technology to analyze
         top_n: Number of co-occurring technologies to show
 
     Returns:
         Plotly figure
     """
-    # This requires a different query structure - simplified version
-    # In practice, you'd need to query job_technologies for co-occurrence
-    return _empty_figure(f"Co-occurrence analysis for {technology} - Feature coming soon")
+    if df.shape[0] == 0 or not {'job_id', 'technology'}.issubset(df.columns):
+        return _empty_figure("No co-occurrence data available")
+
+    jobs = df['job_id'].to_numpy()
+    techs = df['technology'].to_numpy()
+
+    # Jobs that list the target technology, then every other technology
+    # those jobs mention — all in vectorized set operations, no
+    # per-job Python loop
+    target_jobs = np.unique(jobs[techs == technology])
+
+    if target_jobs.size == 0:
+        return _empty_figure(f"No active jobs found using {technology}")
+
+    mask = np.isin(jobs, target_jobs) & (techs != technology)
+    co_techs, counts = np.unique(techs[mask], return_counts=True)
+
+    if co_techs.size == 0:
+        return _empty_figure(f"No technologies co-occur with {technology}")
+
+    # argpartition pulls the top N without sorting the full array;
+    # ascending order within the cut suits the horizontal bars
+    keep = min(top_n, counts.size)
+    top = np.argpartition(counts, -keep)[-keep:]
+    top = top[np.argsort(counts[top])]
+
+    fig = go.Figure(go.Bar(
+        x=counts[top],
+        y=co_techs[top],
+        orientation='h',
+        text=counts[top],
+        textposition='auto',
+        marker=dict(color=counts[top], colorscale='Viridis'),
+        hovertemplate='<b>%{y}</b><br>' +
+                      f'Jobs shared with {technology}: %{{x}}<br>' +
+                      '<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title=f'Technologies Most Often Required Alongside {technology}',
+        xaxis_title='Number of Shared Job Postings',
+        yaxis_title='Technology',
+        height=max(400, keep * 30),
+        showlegend=False
+    )
+
+    return fig
 
 
 def create_technology_summary_table(df: pd.DataFrame, top_n: int = 20) -> pd.DataFrame:
@@ -221,11 +292,11 @@ def create_technology_summary_table(df: pd.DataFrame, top_n: int = 20) -> pd.Dat
     Returns:
         Summary DataFrame
     """
-    if df.empty:
+    if df.shape[0] == 0 or not {'technology', 'category', 'job_count'}.issubset(df.columns):
         return pd.DataFrame()
 
     # Group by technology
-    summary = df.groupby(['technology', 'category']).agg({
+    summary = df.groupby(['technology', 'category'], sort=False, observed=True).agg({
         'job_count': 'sum'
     }).reset_index()
 
@@ -242,6 +313,7 @@ def create_technology_summary_table(df: pd.DataFrame, top_n: int = 20) -> pd.Dat
     return summary
 
 
+@_cache_figure
 def plot_skill_demand_heatmap(df: pd.DataFrame) -> go.Figure:
     """
     Create heatmap of skill demand over time.
@@ -252,11 +324,11 @@ def plot_skill_demand_heatmap(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly figure
     """
-    if df.empty or 'snapshot_date' not in df.columns:
+    if df.shape[0] == 0 or not {'technology', 'snapshot_date', 'job_count'}.issubset(df.columns):
         return _empty_figure("No temporal data available for heatmap")
 
     # Get top 15 technologies
-    top_techs = df.groupby('technology')['job_count'].sum().nlargest(15).index
+    top_techs = df.groupby('technology', sort=False, observed=True)['job_count'].sum().nlargest(15).index
 
     # Filter and pivot
     df_top = df[df['technology'].isin(top_techs)]
@@ -264,18 +336,23 @@ def plot_skill_demand_heatmap(df: pd.DataFrame) -> go.Figure:
     if df_top.empty:
         return _empty_figure("Insufficient data for heatmap")
 
-    # Pivot to create heatmap data
-    heatmap_data = df_top.pivot_table(
-        index='technology',
-        columns='snapshot_date',
-        values='job_count',
-        fill_value=0
-    )
+    # Scatter the counts straight into a dense (technology, date) matrix
+    # instead of routing through pivot_table's indexers: np.unique yields
+    # the axis labels and the row/column id of every observation, and
+    # np.add.at accumulates in one pass
+    techs, row_ids = np.unique(df_top['technology'].to_numpy(), return_inverse=True)
+    dates, col_ids = np.unique(df_top['snapshot_date'].to_numpy(), return_inverse=True)
+    matrix = np.zeros((techs.size, dates.size), dtype=np.int64)
+    np.add.at(matrix, (row_ids, col_ids), df_top['job_count'].to_numpy(dtype=np.int64))
+
+    # Reorder rows to the demand ranking
+    positions = {tech: i for i, tech in enumerate(techs)}
+    row_order = [positions[tech] for tech in top_techs if tech in positions]
 
     fig = go.Figure(data=go.Heatmap(
-        z=heatmap_data.values,
-        x=[str(col) for col in heatmap_data.columns],
-        y=heatmap_data.index,
+        z=matrix[row_order],
+        x=[str(col) for col in dates],
+        y=[techs[i] for i in row_order],
         colorscale='YlOrRd',
         hovertemplate='Technology: %{y}<br>Date: %{x}<br>Jobs: %{z}<extra></extra>'
     ))
@@ -288,34 +365,3 @@ def plot_skill_demand_heatmap(df: pd.DataFrame) -> go.Figure:
     )
 
     return fig
-
-
-def _empty_figure(message: str) -> go.Figure:
-    """
-    Create an empty figure with a message.
-
-    Args:
-        message: Message to display
-
-    Returns:
-        Plotly figure
-    """
-    fig = go.Figure()
-
-    fig.add_annotation(
-        text=message,
-        xref="paper",
-        yref="paper",
-        x=0.5,
-        y=0.5,
-        showarrow=False,
-        font=dict(size=16, color="gray")
-    )
-
-    fig.update_layout(
-        xaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
-        yaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
-        height=400
-    )
-
-    return fig
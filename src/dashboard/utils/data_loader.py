@@ -7,6 +7,7 @@ import pandas as pd
 from datetime import date, timedelta
 from typing import Optional, List
 from ...database.db_manager import DatabaseManager
+from ...database.models import VIEWS
 
 
 class DashboardDataLoader:
@@ -20,6 +21,10 @@ class DashboardDataLoader:
             db: Database manager instance
         """
         self.db = db
+        # Databases initialized before the consolidated snapshot view
+        # was added may not have it; creating it is idempotent
+        for view_sql in VIEWS:
+            self.db.execute_query(view_sql)
 
     def get_active_jobs(self, date_from: Optional[date] = None, date_to: Optional[date] = None) -> pd.DataFrame:
         """
@@ -32,41 +37,14 @@ class DashboardDataLoader:
         Returns:
             DataFrame with job data
         """
-        query = '''
-            SELECT
-                jp.job_id,
-                jp.title,
-                jp.company_name,
-                jp.url,
-                jp.first_seen_date,
-                jp.last_seen_date,
-                js.snapshot_date,
-                js.location_type,
-                js.city,
-                js.region,
-                js.seniority_level,
-                js.employment_type,
-                s.salary_min,
-                s.salary_max,
-                s.salary_avg,
-                s.currency,
-                s.period,
-                s.is_b2b
-            FROM job_postings jp
-            LEFT JOIN job_snapshots js ON jp.job_id = js.job_id
-            LEFT JOIN salaries s ON jp.job_id = s.job_id AND js.snapshot_date = s.snapshot_date
-            WHERE jp.is_active = 1
-        '''
+        query = "SELECT * FROM v_active_job_snapshot WHERE 1=1"
 
-        if date_from:
-            query += f" AND js.snapshot_date >= '{date_from}'"
-        if date_to:
-            query += f" AND js.snapshot_date <= '{date_to}'"
+        date_filter, params = self._date_filter(date_from, date_to, column='snapshot_date')
+        query += f" {date_filter} ORDER BY first_seen_date DESC"
 
-        query += " ORDER BY jp.first_seen_date DESC"
-
-        rows = self.db.fetch_all(query)
-        return pd.DataFrame(rows) if rows else pd.DataFrame()
+        df = self._fetch_df(query, tuple(params))
+        return self._categorize(df, ('location_type', 'city', 'region',
+                                     'seniority_level', 'employment_type'))
 
     def get_salary_data(self, date_from: Optional[date] = None, date_to: Optional[date] = None) -> pd.DataFrame:
         """
@@ -79,30 +57,27 @@ class DashboardDataLoader:
         Returns:
             DataFrame with salary information
         """
+        # currency = 'PLN' also drops the view's rows without a salary
         query = '''
             SELECT
-                s.snapshot_date,
-                s.salary_min,
-                s.salary_max,
-                s.salary_avg,
-                s.currency,
-                s.is_b2b,
-                jp.title,
-                js.seniority_level,
-                js.city
-            FROM salaries s
-            JOIN job_postings jp ON s.job_id = jp.job_id
-            JOIN job_snapshots js ON s.job_id = js.job_id AND s.snapshot_date = js.snapshot_date
-            WHERE jp.is_active = 1 AND s.currency = 'PLN'
+                snapshot_date,
+                salary_min,
+                salary_max,
+                salary_avg,
+                currency,
+                is_b2b,
+                title,
+                seniority_level,
+                city
+            FROM v_active_job_snapshot
+            WHERE currency = 'PLN'
         '''
 
-        if date_from:
-            query += f" AND s.snapshot_date >= '{date_from}'"
-        if date_to:
-            query += f" AND s.snapshot_date <= '{date_to}'"
+        date_filter, params = self._date_filter(date_from, date_to, column='snapshot_date')
+        query += f" {date_filter}"
 
-        rows = self.db.fetch_all(query)
-        return pd.DataFrame(rows) if rows else pd.DataFrame()
+        df = self._fetch_df(query, tuple(params))
+        return self._categorize(df, ('seniority_level', 'city'))
 
     def get_technology_data(self, date_from: Optional[date] = None, date_to: Optional[date] = None) -> pd.DataFrame:
         """
@@ -115,28 +90,29 @@ class DashboardDataLoader:
         Returns:
             DataFrame with technology information
         """
+        # job_technologies is UNIQUE(job_id, technology_id, snapshot_date)
+        # and job_postings is unique per job_id, so each job appears once
+        # per (technology, snapshot_date) group; COUNT(*) matches
+        # COUNT(DISTINCT jt.job_id) without the per-group dedup hashset
         query = '''
             SELECT
                 t.name as technology,
                 t.category,
                 jt.snapshot_date,
-                COUNT(DISTINCT jt.job_id) as job_count
+                COUNT(*) as job_count
             FROM technologies t
             JOIN job_technologies jt ON t.id = jt.technology_id
             JOIN job_postings jp ON jt.job_id = jp.job_id
             WHERE jp.is_active = 1
         '''
 
-        if date_from:
-            query += f" AND jt.snapshot_date >= '{date_from}'"
-        if date_to:
-            query += f" AND jt.snapshot_date <= '{date_to}'"
-
+        date_filter, params = self._date_filter(date_from, date_to, column='jt.snapshot_date')
+        query += f" {date_filter}"
         query += " GROUP BY t.id, t.name, t.category, jt.snapshot_date"
         query += " ORDER BY job_count DESC"
 
-        rows = self.db.fetch_all(query)
-        return pd.DataFrame(rows) if rows else pd.DataFrame()
+        df = self._fetch_df(query, tuple(params))
+        return self._categorize(df, ('technology', 'category'))
 
     def get_location_data(self, date_from: Optional[date] = None, date_to: Optional[date] = None) -> pd.DataFrame:
         """
@@ -151,25 +127,246 @@ class DashboardDataLoader:
         """
         query = '''
             SELECT
-                js.snapshot_date,
-                js.location_type,
-                js.city,
-                js.region,
-                COUNT(DISTINCT jp.job_id) as job_count
-            FROM job_snapshots js
-            JOIN job_postings jp ON js.job_id = jp.job_id
-            WHERE jp.is_active = 1
+                snapshot_date,
+                location_type,
+                city,
+                region,
+                COUNT(DISTINCT job_id) as job_count
+            FROM v_active_job_snapshot
+            WHERE city IS NOT NULL
+              AND location_type IS NOT NULL
         '''
 
+        date_filter, params = self._date_filter(date_from, date_to, column='snapshot_date')
+        query += f" {date_filter}"
+        query += " GROUP BY snapshot_date, location_type, city, region"
+
+        df = self._fetch_df(query, tuple(params))
+        return self._categorize(df, ('city', 'region', 'location_type'))
+
+    # Aggregation queries used by the geographic charts. Kept as class
+    # attributes so the SQL text is built once; callers only supply
+    # parameters. Snapshots are unique per (job_id, snapshot_date), so
+    # COUNT(*) here equals the sum of per-date distinct-job counts.
+    _CITY_COUNTS_SQL = '''
+        SELECT js.city, COUNT(*) as job_count
+        FROM job_snapshots js
+        JOIN job_postings jp ON js.job_id = jp.job_id
+        WHERE jp.is_active = 1 AND js.city IS NOT NULL
+        {date_filter}
+        GROUP BY js.city
+        ORDER BY job_count DESC
+        LIMIT ?
+    '''
+
+    _REGION_COUNTS_SQL = '''
+        SELECT js.region, COUNT(*) as job_count
+        FROM job_snapshots js
+        JOIN job_postings jp ON js.job_id = jp.job_id
+        WHERE jp.is_active = 1 AND js.region IS NOT NULL
+        {date_filter}
+        GROUP BY js.region
+        ORDER BY job_count ASC
+    '''
+
+    _LOCATION_TYPE_COUNTS_SQL = '''
+        SELECT js.location_type, COUNT(*) as job_count
+        FROM job_snapshots js
+        JOIN job_postings jp ON js.job_id = jp.job_id
+        WHERE jp.is_active = 1 AND js.location_type IS NOT NULL
+        {date_filter}
+        GROUP BY js.location_type
+    '''
+
+    _LOCATION_TYPE_TREND_SQL = '''
+        SELECT js.snapshot_date, js.location_type, COUNT(*) as job_count
+        FROM job_snapshots js
+        JOIN job_postings jp ON js.job_id = jp.job_id
+        WHERE jp.is_active = 1 AND js.location_type IS NOT NULL
+        {date_filter}
+        GROUP BY js.snapshot_date, js.location_type
+        ORDER BY js.snapshot_date ASC
+    '''
+
+    _REMOTE_PCT_TREND_SQL = '''
+        SELECT
+            js.snapshot_date,
+            COUNT(*) as total_jobs,
+            SUM(js.location_type = 'remote') as remote_jobs,
+            ROUND(SUM(js.location_type = 'remote') * 100.0 / COUNT(*), 1) as remote_pct
+        FROM job_snapshots js
+        JOIN job_postings jp ON js.job_id = jp.job_id
+        WHERE jp.is_active = 1
+        {date_filter}
+        GROUP BY js.snapshot_date
+        ORDER BY js.snapshot_date ASC
+    '''
+
+    # Top-technology selection pushed into SQL: totals and ranking are
+    # computed server-side so only the kept rows cross the cursor.
+    # (job_id, technology_id, snapshot_date) rows are unique, so
+    # COUNT(*) equals the sum of per-date distinct-job counts.
+    _TOP_TECH_SQL = '''
+        SELECT t.name as technology, t.category, COUNT(*) as job_count
+        FROM technologies t
+        JOIN job_technologies jt ON t.id = jt.technology_id
+        JOIN job_postings jp ON jt.job_id = jp.job_id
+        WHERE jp.is_active = 1
+        {date_filter}
+        GROUP BY t.id
+        ORDER BY job_count DESC
+        LIMIT ?
+    '''
+
+    _TOP_TECH_TREND_SQL = '''
+        WITH tops AS (
+            SELECT jt.technology_id
+            FROM job_technologies jt
+            JOIN job_postings jp ON jt.job_id = jp.job_id
+            WHERE jp.is_active = 1
+            {date_filter}
+            GROUP BY jt.technology_id
+            ORDER BY COUNT(*) DESC
+            LIMIT ?
+        )
+        SELECT t.name as technology, jt.snapshot_date, COUNT(*) as job_count
+        FROM job_technologies jt
+        JOIN technologies t ON jt.technology_id = t.id
+        JOIN job_postings jp ON jt.job_id = jp.job_id
+        WHERE jp.is_active = 1
+        AND jt.technology_id IN (SELECT technology_id FROM tops)
+        {date_filter}
+        GROUP BY jt.technology_id, jt.snapshot_date
+        ORDER BY jt.snapshot_date ASC
+    '''
+
+    @staticmethod
+    def _date_filter(date_from: Optional[date], date_to: Optional[date],
+                     column: str = 'js.snapshot_date') -> tuple:
+        """Build the optional snapshot-date predicate and its parameters."""
+        clauses = []
+        params = []
         if date_from:
-            query += f" AND js.snapshot_date >= '{date_from}'"
+            clauses.append(f"AND {column} >= ?")
+            params.append(date_from)
         if date_to:
-            query += f" AND js.snapshot_date <= '{date_to}'"
+            clauses.append(f"AND {column} <= ?")
+            params.append(date_to)
+        return ' '.join(clauses), params
+
+    @staticmethod
+    def _categorize(df: pd.DataFrame, columns: tuple) -> pd.DataFrame:
+        """
+        Cast low-cardinality string columns to categoricals.
+
+        Groupby, isin and serialization then work on integer codes
+        instead of re-hashing repeated Python strings on every rerun.
+        """
+        if df.empty:
+            return df
+        for col in columns:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        return df
+
+    def _fetch_df(self, query: str, params: Optional[tuple] = None) -> pd.DataFrame:
+        """
+        Run a query and return the rows as an Arrow-backed DataFrame.
+
+        Delegates to DatabaseManager.fetch_df; Arrow-backed columns
+        already match the layout Streamlit serializes to the browser,
+        so st.dataframe and st.plotly_chart hand the data over without
+        re-encoding NumPy object arrays.
+        """
+        return self.db.fetch_df(query, params, dtype_backend='pyarrow')
+
+    def get_city_counts(self, date_from: Optional[date] = None,
+                        date_to: Optional[date] = None,
+                        top_n: int = 15) -> pd.DataFrame:
+        """
+        Get job counts per city, pre-aggregated in SQL.
+
+        Args:
+            date_from: Start date filter
+            date_to: End date filter
+            top_n: Number of top cities to return
+
+        Returns:
+            DataFrame with city and job_count, highest counts first
+        """
+        date_filter, params = self._date_filter(date_from, date_to)
+        query = self._CITY_COUNTS_SQL.format(date_filter=date_filter)
+        return self._fetch_df(query, tuple(params) + (top_n,))
 
-        query += " GROUP BY js.snapshot_date, js.location_type, js.city, js.region"
+    def get_region_counts(self, date_from: Optional[date] = None,
+                          date_to: Optional[date] = None) -> pd.DataFrame:
+        """
+        Get job counts per region, pre-aggregated in SQL.
+
+        Args:
+            date_from: Start date filter
+            date_to: End date filter
+
+        Returns:
+            DataFrame with region and job_count, ascending by count
+        """
+        date_filter, params = self._date_filter(date_from, date_to)
+        query = self._REGION_COUNTS_SQL.format(date_filter=date_filter)
+        return self._fetch_df(query, tuple(params))
+
+    def get_location_type_counts(self, date_from: Optional[date] = None,
+                                 date_to: Optional[date] = None) -> pd.DataFrame:
+        """
+        Get job counts per location type, pre-aggregated in SQL.
+
+        Args:
+            date_from: Start date filter
+            date_to: End date filter
+
+        Returns:
+            DataFrame with location_type and job_count
+        """
+        date_filter, params = self._date_filter(date_from, date_to)
+        query = self._LOCATION_TYPE_COUNTS_SQL.format(date_filter=date_filter)
+        df = self._fetch_df(query, tuple(params))
+        if not df.empty:
+            df['location_type'] = df['location_type'].astype('category')
+        return df
+
+    def get_location_type_trend(self, date_from: Optional[date] = None,
+                                date_to: Optional[date] = None) -> pd.DataFrame:
+        """
+        Get job counts per (snapshot_date, location_type), pre-aggregated in SQL.
+
+        Args:
+            date_from: Start date filter
+            date_to: End date filter
+
+        Returns:
+            DataFrame with snapshot_date, location_type and job_count
+        """
+        date_filter, params = self._date_filter(date_from, date_to)
+        query = self._LOCATION_TYPE_TREND_SQL.format(date_filter=date_filter)
+        df = self._fetch_df(query, tuple(params))
+        if not df.empty:
+            df['location_type'] = df['location_type'].astype('category')
+        return df
+
+    def get_remote_pct_trend(self, date_from: Optional[date] = None,
+                             date_to: Optional[date] = None) -> pd.DataFrame:
+        """
+        Get the daily share of remote jobs, pre-aggregated in SQL.
+
+        Args:
+            date_from: Start date filter
+            date_to: End date filter
 
-        rows = self.db.fetch_all(query)
-        return pd.DataFrame(rows) if rows else pd.DataFrame()
+        Returns:
+            DataFrame with snapshot_date, total_jobs, remote_jobs, remote_pct
+        """
+        date_filter, params = self._date_filter(date_from, date_to)
+        query = self._REMOTE_PCT_TREND_SQL.format(date_filter=date_filter)
+        return self._fetch_df(query, tuple(params))
 
     def get_salary_by_technology(self, top_n: int = 20) -> pd.DataFrame:
         """
@@ -181,27 +378,32 @@ class DashboardDataLoader:
         Returns:
             DataFrame with technology and salary data
         """
-        query = f'''
-            SELECT
-                t.name as technology,
-                t.category,
-                COUNT(DISTINCT jt.job_id) as job_count,
-                AVG(s.salary_avg) as avg_salary,
-                MIN(s.salary_min) as min_salary,
-                MAX(s.salary_max) as max_salary
-            FROM technologies t
-            JOIN job_technologies jt ON t.id = jt.technology_id
-            JOIN salaries s ON jt.job_id = s.job_id AND jt.snapshot_date = s.snapshot_date
-            JOIN job_postings jp ON jt.job_id = jp.job_id
-            WHERE jp.is_active = 1 AND s.currency = 'PLN'
-            GROUP BY t.id, t.name, t.category
-            HAVING job_count >= 2
-            ORDER BY job_count DESC
-            LIMIT {top_n}
+        # Technologies are picked by demand (job_count) but returned
+        # sorted by salary, so consumers can slice .head(n) for the
+        # highest-paying list without re-sorting in pandas
+        query = '''
+            SELECT * FROM (
+                SELECT
+                    t.name as technology,
+                    t.category,
+                    COUNT(DISTINCT jt.job_id) as job_count,
+                    AVG(s.salary_avg) as avg_salary,
+                    MIN(s.salary_min) as min_salary,
+                    MAX(s.salary_max) as max_salary
+                FROM technologies t
+                JOIN job_technologies jt ON t.id = jt.technology_id
+                JOIN salaries s ON jt.job_id = s.job_id AND jt.snapshot_date = s.snapshot_date
+                JOIN job_postings jp ON jt.job_id = jp.job_id
+                WHERE jp.is_active = 1 AND s.currency = 'PLN'
+                GROUP BY t.id, t.name, t.category
+                HAVING job_count >= 2
+                ORDER BY job_count DESC
+                LIMIT ?
+            )
+            ORDER BY avg_salary DESC
         '''
 
-        rows = self.db.fetch_all(query)
-        return pd.DataFrame(rows) if rows else pd.DataFrame()
+        return self._fetch_df(query, (top_n,))
 
     def get_daily_metrics(self, days: int = 90) -> pd.DataFrame:
         """
@@ -215,7 +417,7 @@ class DashboardDataLoader:
         """
         date_from = date.today() - timedelta(days=days)
 
-        query = f'''
+        query = '''
             SELECT
                 metric_date,
                 total_jobs,
@@ -225,62 +427,53 @@ class DashboardDataLoader:
                 avg_salary_pln,
                 median_salary_pln
             FROM daily_metrics
-            WHERE metric_date >= '{date_from}'
+            WHERE metric_date >= ?
             ORDER BY metric_date ASC
         '''
 
-        rows = self.db.fetch_all(query)
-        return pd.DataFrame(rows) if rows else pd.DataFrame()
-
-    def get_kpi_metrics(self) -> dict:
-        """
-        Get key performance indicators for dashboard.
-
-        Returns:
-            Dictionary with KPI values
-        """
-        # Total active jobs
-        total_jobs = self.db.fetch_one(
-            "SELECT COUNT(*) as count FROM job_postings WHERE is_active = 1"
-        )
+        return self._fetch_df(query, (date_from,))
 
-        # Average salary
-        avg_salary = self.db.fetch_one(
-            '''SELECT AVG(salary_avg) as avg_salary
+    # All four KPIs in one statement: one round trip and one plan
+    # instead of four, with each scalar subquery seeking its own
+    # latest-snapshot index
+    _KPI_SQL = '''
+        SELECT
+            (SELECT COUNT(*) FROM job_postings WHERE is_active = 1) as total_jobs,
+            (SELECT AVG(s.salary_avg)
                FROM salaries s
                JOIN job_postings jp ON s.job_id = jp.job_id
                WHERE jp.is_active = 1 AND s.currency = 'PLN'
-               AND s.snapshot_date = (SELECT MAX(snapshot_date) FROM salaries)'''
-        )
-
-        # Remote percentage
-        location_stats = self.db.fetch_one(
-            '''SELECT
-                SUM(CASE WHEN location_type = 'remote' THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as remote_pct
+               AND s.snapshot_date = (SELECT MAX(snapshot_date) FROM salaries)) as avg_salary,
+            (SELECT SUM(js.location_type = 'remote') * 100.0 / COUNT(*)
                FROM job_snapshots js
                JOIN job_postings jp ON js.job_id = jp.job_id
                WHERE jp.is_active = 1
-               AND js.snapshot_date = (SELECT MAX(snapshot_date) FROM job_snapshots)'''
-        )
-
-        # Top technology
-        top_tech = self.db.fetch_one(
-            '''SELECT t.name, COUNT(*) as count
+               AND js.snapshot_date = (SELECT MAX(snapshot_date) FROM job_snapshots)) as remote_pct,
+            (SELECT t.name
                FROM technologies t
                JOIN job_technologies jt ON t.id = jt.technology_id
                JOIN job_postings jp ON jt.job_id = jp.job_id
                WHERE jp.is_active = 1
                AND jt.snapshot_date = (SELECT MAX(snapshot_date) FROM job_technologies)
                GROUP BY t.name
-               ORDER BY count DESC
-               LIMIT 1'''
-        )
+               ORDER BY COUNT(*) DESC
+               LIMIT 1) as top_technology
+    '''
+
+    def get_kpi_metrics(self) -> dict:
+        """
+        Get key performance indicators for dashboard.
+
+        Returns:
+            Dictionary with KPI values
+        """
+        row = self.db.fetch_one(self._KPI_SQL)
 
         return {
-            'total_jobs': total_jobs['count'] if total_jobs else 0,
-            'avg_salary': avg_salary['avg_salary'] if avg_salary and avg_salary['avg_salary'] else 0,
-            'remote_pct': location_stats['remote_pct'] if location_stats and location_stats['remote_pct'] else 0,
-            'top_technology': top_tech['name'] if top_tech else 'N/A'
+            'total_jobs': row['total_jobs'] if row else 0,
+            'avg_salary': row['avg_salary'] if row and row['avg_salary'] else 0,
+            'remote_pct': row['remote_pct'] if row and row['remote_pct'] else 0,
+            'top_technology': row['top_technology'] if row and row['top_technology'] else 'N/A'
         }
 
     def get_technology_trends(self, technologies: List[str], days: int = 30) -> pd.DataFrame:
@@ -297,11 +490,13 @@ class DashboardDataLoader:
         date_from = date.today() - timedelta(days=days)
 
         placeholders = ','.join(['?' for _ in technologies])
+        # Grouped by (name, snapshot_date): the job_technologies UNIQUE
+        # constraint makes COUNT(*) equivalent to COUNT(DISTINCT job_id)
         query = f'''
             SELECT
                 t.name as technology,
                 jt.snapshot_date,
-                COUNT(DISTINCT jt.job_id) as job_count
+                COUNT(*) as job_count
             FROM technologies t
             JOIN job_technologies jt ON t.id = jt.technology_id
             JOIN job_postings jp ON jt.job_id = jp.job_id
@@ -312,8 +507,66 @@ class DashboardDataLoader:
             ORDER BY jt.snapshot_date ASC
         '''
 
-        rows = self.db.fetch_all(query, tuple(technologies) + (date_from,))
-        return pd.DataFrame(rows) if rows else pd.DataFrame()
+        return self._fetch_df(query, tuple(technologies) + (date_from,))
+
+    def get_top_technologies(self, top_n: int = 20,
+                             date_from: Optional[date] = None,
+                             date_to: Optional[date] = None) -> pd.DataFrame:
+        """
+        Get total job counts for the most in-demand technologies.
+
+        Args:
+            top_n: Number of top technologies to return
+            date_from: Start date filter
+            date_to: End date filter
+
+        Returns:
+            DataFrame with technology, category and job_count,
+            highest counts first
+        """
+        date_filter, params = self._date_filter(date_from, date_to, column='jt.snapshot_date')
+        query = self._TOP_TECH_SQL.format(date_filter=date_filter)
+        return self._fetch_df(query, tuple(params) + (top_n,))
+
+    def get_top_technology_trends(self, top_n: int = 10,
+                                  date_from: Optional[date] = None,
+                                  date_to: Optional[date] = None) -> pd.DataFrame:
+        """
+        Get per-date job counts for the most in-demand technologies.
+
+        Args:
+            top_n: Number of top technologies to include
+            date_from: Start date filter
+            date_to: End date filter
+
+        Returns:
+            DataFrame with technology, snapshot_date and job_count,
+            chronological
+        """
+        date_filter, params = self._date_filter(date_from, date_to, column='jt.snapshot_date')
+        query = self._TOP_TECH_TREND_SQL.format(date_filter=date_filter)
+        # The filter appears in both the ranking CTE and the outer query
+        return self._fetch_df(query, tuple(params) + (top_n,) + tuple(params))
+
+    def get_job_technology_pairs(self) -> pd.DataFrame:
+        """
+        Get distinct (job_id, technology) pairs for active jobs.
+
+        Feeds the co-occurrence analysis, which needs per-job technology
+        sets rather than aggregated counts.
+
+        Returns:
+            DataFrame with job_id and technology
+        """
+        query = '''
+            SELECT DISTINCT jt.job_id, t.name as technology
+            FROM job_technologies jt
+            JOIN technologies t ON jt.technology_id = t.id
+            JOIN job_postings jp ON jt.job_id = jp.job_id
+            WHERE jp.is_active = 1
+        '''
+
+        return self._fetch_df(query)
 
     def get_last_scrape_info(self) -> dict:
         """
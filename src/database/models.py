@@ -109,44 +109,176 @@ SCHEMA = {
     '''
 }
 
-# Index definitions for performance optimization
+# Full-text search over snapshot free text. An external-content FTS5
+# table indexes description/requirements without duplicating the text;
+# the triggers keep it in sync with job_snapshots, so searching the
+# corpus is an inverted-index lookup instead of a sequential LIKE scan
+FTS = [
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS job_snapshots_fts USING fts5(
+        description,
+        requirements,
+        content='job_snapshots',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS job_snapshots_fts_ai
+    AFTER INSERT ON job_snapshots BEGIN
+        INSERT INTO job_snapshots_fts(rowid, description, requirements)
+        VALUES (new.id, new.description, new.requirements);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS job_snapshots_fts_ad
+    AFTER DELETE ON job_snapshots BEGIN
+        INSERT INTO job_snapshots_fts(job_snapshots_fts, rowid, description, requirements)
+        VALUES ('delete', old.id, old.description, old.requirements);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS job_snapshots_fts_au
+    AFTER UPDATE ON job_snapshots BEGIN
+        INSERT INTO job_snapshots_fts(job_snapshots_fts, rowid, description, requirements)
+        VALUES ('delete', old.id, old.description, old.requirements);
+        INSERT INTO job_snapshots_fts(rowid, description, requirements)
+        VALUES (new.id, new.description, new.requirements);
+    END
+    ''',
+]
+
+# View definitions. The dashboard loaders repeatedly scan the same
+# job_postings / job_snapshots / salaries join with different
+# projections; the view gives them one shared definition to select from
+VIEWS = [
+    '''
+    CREATE VIEW IF NOT EXISTS v_active_job_snapshot AS
+    SELECT
+        jp.job_id,
+        jp.title,
+        jp.company_name,
+        jp.url,
+        jp.first_seen_date,
+        jp.last_seen_date,
+        js.snapshot_date,
+        js.location_type,
+        js.city,
+        js.region,
+        js.seniority_level,
+        js.employment_type,
+        s.salary_min,
+        s.salary_max,
+        s.salary_avg,
+        s.currency,
+        s.period,
+        s.is_b2b
+    FROM job_postings jp
+    LEFT JOIN job_snapshots js ON jp.job_id = js.job_id
+    LEFT JOIN salaries s ON js.job_id = s.job_id AND js.snapshot_date = s.snapshot_date
+    WHERE jp.is_active = 1
+    '''
+]
+
+# Index definitions for performance optimization.
+# Single-column indexes that duplicate a UNIQUE constraint's implicit
+# index (job_postings.job_id, technologies.name, daily_metrics.metric_date)
+# or the leftmost prefix of a composite index (job_snapshots.job_id,
+# salaries.job_id, job_technologies.job_id) are deliberately absent:
+# they only add write amplification on inserts.
 INDEXES = [
-    'CREATE INDEX IF NOT EXISTS idx_job_postings_active ON job_postings(is_active)',
-    'CREATE INDEX IF NOT EXISTS idx_job_postings_job_id ON job_postings(job_id)',
-    'CREATE INDEX IF NOT EXISTS idx_job_snapshots_date ON job_snapshots(snapshot_date)',
-    'CREATE INDEX IF NOT EXISTS idx_job_snapshots_job_id ON job_snapshots(job_id)',
-    'CREATE INDEX IF NOT EXISTS idx_salaries_date ON salaries(snapshot_date)',
-    'CREATE INDEX IF NOT EXISTS idx_salaries_job_id ON salaries(job_id)',
-    'CREATE INDEX IF NOT EXISTS idx_job_technologies_date ON job_technologies(snapshot_date)',
-    'CREATE INDEX IF NOT EXISTS idx_job_technologies_job_id ON job_technologies(job_id)',
-    'CREATE INDEX IF NOT EXISTS idx_daily_metrics_date ON daily_metrics(metric_date)',
-    'CREATE INDEX IF NOT EXISTS idx_technologies_name ON technologies(name)',
+    # Partial index on the active slice only: every hot query filters
+    # is_active = 1, and over the database's lifetime active jobs are a
+    # small fraction of all postings, so this stays far smaller than a
+    # full index on the flag
+    'CREATE INDEX IF NOT EXISTS idx_job_postings_active ON job_postings(job_id) WHERE is_active = 1',
+    'CREATE INDEX IF NOT EXISTS idx_job_snapshots_date ON job_snapshots(snapshot_date, job_id)',
+    # Composite (snapshot_date, job_id) indexes: the leading column serves
+    # snapshot-date filters and the pair makes the ETL verification counts
+    # index-only scans; the leftmost prefix subsumes a plain date index.
+    # salary_avg is appended so the daily metrics average and median read
+    # the day's values without touching the salaries table at all
+    'CREATE INDEX IF NOT EXISTS idx_salaries_snapshot ON salaries(snapshot_date, job_id, salary_avg)',
+    'CREATE INDEX IF NOT EXISTS idx_job_technologies_snapshot ON job_technologies(snapshot_date, job_id)',
+    # Partial index for get_last_scrape_time: only successful runs are
+    # kept, pre-ordered by run_date, so the lookup is a one-row seek
+    "CREATE INDEX IF NOT EXISTS idx_scrape_runs_success_date ON scrape_runs(run_date DESC) WHERE status = 'success'",
+    # Covering indexes for the dashboard's location aggregations: each
+    # includes snapshot_date and job_id so the GROUP BY city / region /
+    # (snapshot_date, location_type) queries with their date filters and
+    # job_postings join resolve as index-only scans
+    'CREATE INDEX IF NOT EXISTS idx_job_snapshots_city ON job_snapshots(city, snapshot_date, job_id)',
+    'CREATE INDEX IF NOT EXISTS idx_job_snapshots_region ON job_snapshots(region, snapshot_date, job_id)',
+    'CREATE INDEX IF NOT EXISTS idx_job_snapshots_location_type ON job_snapshots(location_type, snapshot_date, job_id)',
+    # Dashboard loader joins: (snapshot_date, technology_id) ranks the
+    # per-snapshot top technologies, (job_id, snapshot_date) serves the
+    # salary join keyed on both columns
+    'CREATE INDEX IF NOT EXISTS idx_job_technologies_date_tech ON job_technologies(snapshot_date, technology_id)',
+    'CREATE INDEX IF NOT EXISTS idx_salaries_job_date ON salaries(job_id, snapshot_date)',
 ]
 
 
-def create_all_tables(connection):
+def create_tables(connection):
     """
-    Create all database tables and indexes.
+    Create all database tables and views, without indexes.
+
+    Kept separate from create_indexes so bulk seed loads can insert
+    into bare tables and build the indexes once afterwards, instead of
+    paying index maintenance on every row.
 
     Args:
         connection: SQLite database connection
     """
-    cursor = connection.cursor()
+    # One executescript call parses and runs the whole batch inside a
+    # single implicit transaction, instead of one Python round-trip per
+    # statement
+    connection.executescript(';\n'.join([*SCHEMA.values(), *FTS, *VIEWS]) + ';')
 
-    # Create tables
-    for table_name, create_sql in SCHEMA.items():
-        cursor.execute(create_sql)
+    for table_name in SCHEMA:
         print(f"Created table: {table_name}")
+    print("Created full-text index: job_snapshots_fts")
+    print(f"Created {len(VIEWS)} views")
+
 
-    # Create indexes
-    for index_sql in INDEXES:
-        cursor.execute(index_sql)
+def create_indexes(connection):
+    """
+    Create all indexes over existing tables.
+
+    Args:
+        connection: SQLite database connection
+    """
+    connection.executescript(';\n'.join(INDEXES) + ';')
 
     print(f"Created {len(INDEXES)} indexes")
 
+
+def analyze(connection):
+    """
+    Refresh planner statistics so the query planner actually picks
+    the indexes instead of falling back to table scans.
+
+    Args:
+        connection: SQLite database connection
+    """
+    connection.execute("ANALYZE")
     connection.commit()
 
 
+def create_all_tables(connection):
+    """
+    Create all database tables, indexes and views.
+
+    Bulk loaders that seed a fresh database should prefer
+    create_tables → load → create_indexes → analyze.
+
+    Args:
+        connection: SQLite database connection
+    """
+    create_tables(connection)
+    create_indexes(connection)
+    analyze(connection)
+
+
 def drop_all_tables(connection):
     """
     Drop all database tables (useful for testing/reset).
@@ -156,7 +288,26 @@ def drop_all_tables(connection):
     """
     cursor = connection.cursor()
 
-    # Get all table names
+    # Tables are dropped in sqlite_master order, which ignores relationships;
+    # suspend foreign key enforcement so parent tables can go before children
+    cursor.execute("PRAGMA foreign_keys = OFF")
+
+    # Drop views first; they reference the tables
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='view'")
+    for (view_name,) in cursor.fetchall():
+        cursor.execute(f"DROP VIEW IF EXISTS {view_name}")
+        print(f"Dropped view: {view_name}")
+
+    # Drop virtual tables next; removing one also removes its shadow
+    # tables, which must not be dropped directly
+    cursor.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND sql LIKE 'CREATE VIRTUAL TABLE%'"
+    )
+    for (table_name,) in cursor.fetchall():
+        cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+        print(f"Dropped table: {table_name}")
+
+    # Get all remaining table names
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
     tables = cursor.fetchall()
 
@@ -168,3 +319,4 @@ def drop_all_tables(connection):
             print(f"Dropped table: {table_name}")
 
     connection.commit()
+    cursor.execute("PRAGMA foreign_keys = ON")
@@ -4,7 +4,8 @@ Loads transformed data into the database.
 """
 
 import logging
-from typing import Dict, List, Optional, Set
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Set
 from datetime import date
 
 from ..database.db_manager import DatabaseManager
@@ -21,6 +22,10 @@ class DataLoader:
             db: Database manager instance
         """
         self.db = db
+        # name -> id cache for the technologies table; loaded once and
+        # kept current as batches insert new names, so repeat loads skip
+        # the full-table re-reads
+        self._tech_ids: Dict[str, int] = {}
         self.stats = {
             'jobs_new': 0,
             'jobs_updated': 0,
@@ -29,13 +34,17 @@ class DataLoader:
             'errors': 0
         }
 
-    def load_all(self, transformed_data_list: List[Dict], snapshot_date: date = None) -> Dict:
+    def load_all(self, transformed_data_list: List[Dict], snapshot_date: date = None,
+                 commit: bool = True) -> Dict:
         """
         Load all transformed job data into database.
 
         Args:
             transformed_data_list: List of transformed job data
             snapshot_date: Date for this snapshot (defaults to today)
+            commit: Commit at the end of this load. Pass False when
+                batching several loads into one caller-managed
+                transaction and commit once at the end.
 
         Returns:
             Statistics dictionary
@@ -54,215 +63,415 @@ class DataLoader:
 
         logging.info(f"Loading {len(transformed_data_list)} jobs into database")
 
-        # Track which jobs we've seen in this run
-        active_job_ids = set()
-
-        with self.db.transaction():
-            for job_data in transformed_data_list:
-                try:
-                    self._load_job(job_data, snapshot_date)
-                    active_job_ids.add(job_data['job_posting']['job_id'])
-                except Exception as e:
-                    self.stats['errors'] += 1
-                    logging.error(f"Error loading job {job_data['job_posting'].get('job_id')}: {e}")
-
-            # Mark jobs not seen in this run as inactive
-            if active_job_ids:
-                expired_count = self._mark_expired_jobs(active_job_ids)
-                self.stats['jobs_expired'] = expired_count
-
-            # Update daily metrics
-            self._update_daily_metrics(snapshot_date)
+        if commit:
+            try:
+                with self.db.transaction():
+                    self._load_batch(transformed_data_list, snapshot_date)
+            except Exception:
+                # A rollback may have discarded rows the cache already
+                # points at; drop it so the next load re-reads the table
+                self._tech_ids.clear()
+                raise
+        else:
+            self._load_batch(transformed_data_list, snapshot_date)
 
         logging.info(f"Load complete: {self.stats}")
 
         return self.stats
 
-    def _load_job(self, job_data: Dict, snapshot_date: date):
+    def load_all_chunked(self, transformed_data_iter: Iterable[Dict],
+                         snapshot_date: date = None,
+                         chunk_size: int = 5000) -> Dict:
         """
-        Load a single job into the database.
+        Load a stream of transformed jobs in fixed-size chunks.
+
+        Consumes the iterator chunk by chunk inside one transaction, so
+        peak memory stays O(chunk_size) instead of O(total jobs) while
+        SQLite still commits (and fsyncs) only once. Pairs with the
+        transformer's iter_transform_batch for end-to-end streaming;
+        expiry marking and daily metrics run once at the end, exactly as
+        in load_all.
 
         Args:
-            job_data: Transformed job data
-            snapshot_date: Date for this snapshot
+            transformed_data_iter: Iterable of transformed job data
+            snapshot_date: Date for this snapshot (defaults to today)
+            chunk_size: Jobs inserted per executemany round
+
+        Returns:
+            Statistics dictionary
         """
-        job_posting = job_data['job_posting']
-        job_id = job_posting['job_id']
+        if snapshot_date is None:
+            snapshot_date = date.today()
 
-        # Check if job already exists
-        existing = self.db.fetch_one(
-            "SELECT * FROM job_postings WHERE job_id = ?",
-            (job_id,)
-        )
+        self.stats = {
+            'jobs_new': 0,
+            'jobs_updated': 0,
+            'jobs_expired': 0,
+            'technologies_new': 0,
+            'errors': 0
+        }
 
-        if existing:
-            # Update existing job
-            self._update_job_posting(job_posting)
-            self.stats['jobs_updated'] += 1
-        else:
-            # Insert new job
-            self._insert_job_posting(job_posting)
-            self.stats['jobs_new'] += 1
-
-        # Insert snapshot
-        self._insert_job_snapshot(job_id, job_data['snapshot'], snapshot_date)
-
-        # Insert salary if available
-        if job_data.get('salary'):
-            self._insert_salary(job_id, job_data['salary'], snapshot_date)
-
-        # Insert technologies
-        if job_data.get('technologies'):
-            self._insert_technologies(job_id, job_data['technologies'], snapshot_date)
-
-    def _insert_job_posting(self, job_posting: Dict):
-        """Insert new job posting."""
-        query = '''
-            INSERT INTO job_postings
-            (job_id, title, company_name, url, first_seen_date, last_seen_date, is_active)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        '''
+        iterator = iter(transformed_data_iter)
+        active_job_ids = set()
+        loaded = 0
+
+        try:
+            with self.db.transaction():
+                while True:
+                    chunk = list(islice(iterator, chunk_size))
+                    if not chunk:
+                        break
+                    active_job_ids |= self._insert_batch(chunk, snapshot_date)
+                    loaded += len(chunk)
+
+                if active_job_ids:
+                    self.stats['jobs_expired'] = self._mark_expired_jobs(active_job_ids)
+                self._update_daily_metrics(snapshot_date)
+        except Exception:
+            self._tech_ids.clear()
+            raise
+
+        logging.info(f"Chunked load complete ({loaded} jobs): {self.stats}")
 
-        self.db.execute_query(
-            query,
-            (
-                job_posting['job_id'],
-                job_posting['title'],
-                job_posting['company_name'],
-                job_posting['url'],
-                job_posting['first_seen_date'],
-                job_posting['last_seen_date'],
-                1  # is_active
-            )
-        )
+        return self.stats
 
-    def _update_job_posting(self, job_posting: Dict):
-        """Update existing job posting."""
-        query = '''
-            UPDATE job_postings
-            SET last_seen_date = ?,
-                is_active = 1,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE job_id = ?
-        '''
+    def _load_batch(self, transformed_data_list: List[Dict], snapshot_date: date):
+        """
+        Load one batch of jobs; transaction handling is up to the caller.
+        """
+        active_job_ids = self._insert_batch(transformed_data_list, snapshot_date)
 
-        self.db.execute_query(
-            query,
-            (job_posting['last_seen_date'], job_posting['job_id'])
-        )
+        # Mark jobs not seen in this run as inactive
+        if active_job_ids:
+            expired_count = self._mark_expired_jobs(active_job_ids)
+            self.stats['jobs_expired'] = expired_count
 
-    def _insert_job_snapshot(self, job_id: str, snapshot: Dict, snapshot_date: date):
-        """Insert job snapshot for historical tracking."""
-        query = '''
-            INSERT OR REPLACE INTO job_snapshots
-            (job_id, snapshot_date, description, requirements, location_type,
-             city, region, country, seniority_level, employment_type)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        '''
+        # Update daily metrics
+        self._update_daily_metrics(snapshot_date)
 
-        self.db.execute_query(
-            query,
-            (
-                job_id,
-                snapshot_date,
-                snapshot.get('description'),
-                snapshot.get('requirements'),
-                snapshot.get('location_type'),
-                snapshot.get('city'),
-                snapshot.get('region'),
-                snapshot.get('country', 'Poland'),
-                snapshot.get('seniority_level'),
-                snapshot.get('employment_type')
-            )
-        )
+    def _insert_batch(self, transformed_data_list: List[Dict], snapshot_date: date) -> Set[str]:
+        """
+        Insert one batch of jobs and return the job ids it contained.
 
-    def _insert_salary(self, job_id: str, salary: Dict, snapshot_date: date):
-        """Insert salary information."""
-        query = '''
-            INSERT OR REPLACE INTO salaries
-            (job_id, snapshot_date, currency, salary_min, salary_max,
-             salary_avg, period, is_b2b)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        '''
+        Rows are collected per table and pushed through one executemany
+        each, so the INSERT programs are compiled once and stepped N times
+        instead of being re-prepared per job. Stats accumulate, so callers
+        may invoke this several times per load. Expiry marking and metrics
+        are the caller's responsibility.
+        """
+        posting_rows = []
+        snapshot_rows = []
+        salary_rows = []
+        tech_links = []  # (job_id, tech_name)
+        tech_catalog = {}  # name -> category
+        active_job_ids = set()
 
-        self.db.execute_query(
-            query,
-            (
-                job_id,
-                snapshot_date,
-                salary.get('currency', 'PLN'),
-                salary.get('salary_min'),
-                salary.get('salary_max'),
-                salary.get('salary_avg'),
-                salary.get('period', 'monthly'),
-                1 if salary.get('is_b2b') else 0
+        for job_data in transformed_data_list:
+            try:
+                job_posting = job_data['job_posting']
+                job_id = job_posting['job_id']
+
+                posting_rows.append((
+                    job_id,
+                    job_posting['title'],
+                    job_posting['company_name'],
+                    job_posting['url'],
+                    job_posting['first_seen_date'],
+                    job_posting['last_seen_date'],
+                    1  # is_active
+                ))
+
+                snapshot = job_data['snapshot']
+                snapshot_rows.append((
+                    job_id,
+                    snapshot_date,
+                    snapshot.get('description'),
+                    snapshot.get('requirements'),
+                    snapshot.get('location_type'),
+                    snapshot.get('city'),
+                    snapshot.get('region'),
+                    snapshot.get('country', 'Poland'),
+                    snapshot.get('seniority_level'),
+                    snapshot.get('employment_type')
+                ))
+
+                salary = job_data.get('salary')
+                if salary:
+                    salary_rows.append((
+                        job_id,
+                        snapshot_date,
+                        salary.get('currency', 'PLN'),
+                        salary.get('salary_min'),
+                        salary.get('salary_max'),
+                        salary.get('salary_avg'),
+                        salary.get('period', 'monthly'),
+                        1 if salary.get('is_b2b') else 0
+                    ))
+
+                for tech in job_data.get('technologies', []):
+                    tech_catalog.setdefault(tech['name'], tech['category'])
+                    tech_links.append((job_id, tech['name']))
+
+                active_job_ids.add(job_id)
+            except (KeyError, TypeError) as e:
+                self.stats['errors'] += 1
+                logging.error(f"Error loading job {job_data.get('job_posting', {}).get('job_id')}: {e}")
+
+        with self.db.get_connection() as conn:
+            # New-vs-updated split for the stats, resolved with IN queries
+            # chunked under SQLite's bound-parameter limit so batches of
+            # thousands of jobs don't overflow it
+            existing = set()
+            batch_ids = list(active_job_ids)
+            limit = DatabaseManager._MAX_SQL_PARAMS
+            for i in range(0, len(batch_ids), limit):
+                id_chunk = batch_ids[i:i + limit]
+                placeholders = ','.join('?' * len(id_chunk))
+                existing.update(
+                    row['job_id'] for row in conn.execute(
+                        f"SELECT job_id FROM job_postings WHERE job_id IN ({placeholders})",
+                        id_chunk
+                    )
+                )
+            updated = sum(1 for row in posting_rows if row[0] in existing)
+            self.stats['jobs_updated'] += updated
+            self.stats['jobs_new'] += len(posting_rows) - updated
+
+            conn.executemany(
+                '''INSERT INTO job_postings
+                   (job_id, title, company_name, url, first_seen_date, last_seen_date, is_active)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(job_id) DO UPDATE SET
+                       last_seen_date = excluded.last_seen_date,
+                       is_active = 1,
+                       updated_at = CURRENT_TIMESTAMP''',
+                posting_rows
+            )
+            # Upsert rather than INSERT OR REPLACE: REPLACE deletes the
+            # conflicting row without firing the FTS delete trigger
+            # (recursive_triggers is off), which would orphan its index
+            # entry; DO UPDATE keeps the rowid and fires the sync trigger
+            conn.executemany(
+                '''INSERT INTO job_snapshots
+                   (job_id, snapshot_date, description, requirements, location_type,
+                    city, region, country, seniority_level, employment_type)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(job_id, snapshot_date) DO UPDATE SET
+                       description = excluded.description,
+                       requirements = excluded.requirements,
+                       location_type = excluded.location_type,
+                       city = excluded.city,
+                       region = excluded.region,
+                       country = excluded.country,
+                       seniority_level = excluded.seniority_level,
+                       employment_type = excluded.employment_type''',
+                snapshot_rows
+            )
+            conn.executemany(
+                '''INSERT OR REPLACE INTO salaries
+                   (job_id, snapshot_date, currency, salary_min, salary_max,
+                    salary_avg, period, is_b2b)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
+                salary_rows
             )
-        )
 
-    def _insert_technologies(self, job_id: str, technologies: List[Dict], snapshot_date: date):
+            tech_ids = self._resolve_technology_ids(conn, tech_catalog)
+            conn.executemany(
+                '''INSERT OR IGNORE INTO job_technologies
+                   (job_id, technology_id, snapshot_date)
+                   VALUES (?, ?, ?)''',
+                [(job_id, tech_ids[name], snapshot_date)
+                 for job_id, name in tech_links]
+            )
+
+        return active_job_ids
+
+    def load_all_bulk(self, transformed_jobs_by_date: Dict[date, List[Dict]]) -> Dict:
         """
-        Insert job technologies with many-to-many relationship.
+        Load transformed jobs for multiple snapshot dates in a single transaction.
+
+        Builds one row list per table and pushes it through a single
+        executemany call, so SQLite commits (and fsyncs) only once for the
+        whole load instead of once per row. Intended for bulk population
+        (e.g. sample data); the incremental path remains load_all.
 
         Args:
-            job_id: Job ID
-            technologies: List of technology dictionaries
-            snapshot_date: Snapshot date
+            transformed_jobs_by_date: Mapping of snapshot date to list of
+                transformed job data
+
+        Returns:
+            Statistics dictionary
         """
-        for tech in technologies:
-            tech_name = tech['name']
-            tech_category = tech['category']
+        self.stats = {
+            'jobs_new': 0,
+            'jobs_updated': 0,
+            'jobs_expired': 0,
+            'technologies_new': 0,
+            'errors': 0
+        }
 
-            # Get or create technology
-            tech_id = self._get_or_create_technology(tech_name, tech_category)
+        total_jobs = sum(len(jobs) for jobs in transformed_jobs_by_date.values())
+        logging.info(f"Bulk loading {total_jobs} jobs across {len(transformed_jobs_by_date)} dates")
+
+        # Collect rows per table
+        posting_rows = []
+        snapshot_rows = []
+        salary_rows = []
+        tech_links = []  # (job_id, tech_name, snapshot_date)
+        tech_catalog = {}  # name -> category
+
+        seen_job_ids = set()
+
+        for snapshot_date in sorted(transformed_jobs_by_date.keys()):
+            for job_data in transformed_jobs_by_date[snapshot_date]:
+                job_posting = job_data['job_posting']
+                job_id = job_posting['job_id']
+
+                if job_id not in seen_job_ids:
+                    seen_job_ids.add(job_id)
+                    posting_rows.append((
+                        job_id,
+                        job_posting['title'],
+                        job_posting['company_name'],
+                        job_posting['url'],
+                        job_posting['first_seen_date'],
+                        job_posting['last_seen_date'],
+                        1  # is_active
+                    ))
+
+                snapshot = job_data['snapshot']
+                snapshot_rows.append((
+                    job_id,
+                    snapshot_date,
+                    snapshot.get('description'),
+                    snapshot.get('requirements'),
+                    snapshot.get('location_type'),
+                    snapshot.get('city'),
+                    snapshot.get('region'),
+                    snapshot.get('country', 'Poland'),
+                    snapshot.get('seniority_level'),
+                    snapshot.get('employment_type')
+                ))
+
+                salary = job_data.get('salary')
+                if salary:
+                    salary_rows.append((
+                        job_id,
+                        snapshot_date,
+                        salary.get('currency', 'PLN'),
+                        salary.get('salary_min'),
+                        salary.get('salary_max'),
+                        salary.get('salary_avg'),
+                        salary.get('period', 'monthly'),
+                        1 if salary.get('is_b2b') else 0
+                    ))
+
+                for tech in job_data.get('technologies', []):
+                    tech_catalog.setdefault(tech['name'], tech['category'])
+                    tech_links.append((job_id, tech['name'], snapshot_date))
+
+        with self.db.get_connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    '''INSERT OR REPLACE INTO job_postings
+                       (job_id, title, company_name, url, first_seen_date, last_seen_date, is_active)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)''',
+                    posting_rows
+                )
+                # Upsert for the same reason as _insert_batch: REPLACE
+                # bypasses the FTS delete trigger and orphans index entries
+                conn.executemany(
+                    '''INSERT INTO job_snapshots
+                       (job_id, snapshot_date, description, requirements, location_type,
+                        city, region, country, seniority_level, employment_type)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(job_id, snapshot_date) DO UPDATE SET
+                           description = excluded.description,
+                           requirements = excluded.requirements,
+                           location_type = excluded.location_type,
+                           city = excluded.city,
+                           region = excluded.region,
+                           country = excluded.country,
+                           seniority_level = excluded.seniority_level,
+                           employment_type = excluded.employment_type''',
+                    snapshot_rows
+                )
+                conn.executemany(
+                    '''INSERT OR REPLACE INTO salaries
+                       (job_id, snapshot_date, currency, salary_min, salary_max,
+                        salary_avg, period, is_b2b)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
+                    salary_rows
+                )
 
-            # Link to job
-            self._link_job_technology(job_id, tech_id, snapshot_date)
+                tech_ids = self._resolve_technology_ids(conn, tech_catalog)
+                conn.executemany(
+                    '''INSERT OR IGNORE INTO job_technologies
+                       (job_id, technology_id, snapshot_date)
+                       VALUES (?, ?, ?)''',
+                    [(job_id, tech_ids[name], snap_date)
+                     for job_id, name, snap_date in tech_links]
+                )
 
-    def _get_or_create_technology(self, tech_name: str, category: str) -> int:
-        """
-        Get existing technology ID or create new one.
+                # Update daily metrics once per date (still inside the transaction)
+                for snapshot_date in sorted(transformed_jobs_by_date.keys()):
+                    self._update_daily_metrics(snapshot_date)
 
-        Args:
-            tech_name: Technology name
-            category: Technology category
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                self._tech_ids.clear()
+                self.stats['errors'] += 1
+                logging.error(f"Bulk load failed, rolling back: {e}")
+                raise
 
-        Returns:
-            Technology ID
-        """
-        # Check if exists
-        existing = self.db.fetch_one(
-            "SELECT id FROM technologies WHERE name = ?",
-            (tech_name,)
-        )
+        self.stats['jobs_new'] = len(posting_rows)
+        logging.info(f"Bulk load complete: {self.stats}")
 
-        if existing:
-            return existing['id']
+        return self.stats
 
-        # Create new
-        self.db.execute_query(
-            "INSERT INTO technologies (name, category) VALUES (?, ?)",
-            (tech_name, category)
-        )
+    def _resolve_technology_ids(self, conn, tech_catalog: Dict[str, str]) -> Dict[str, int]:
+        """
+        Map technology names to ids, inserting unknown ones.
 
-        self.stats['technologies_new'] += 1
+        The full table is read once per loader lifetime into _tech_ids;
+        after that only genuinely new names cost an insert plus one
+        targeted IN-list lookup, instead of re-reading the whole table
+        twice per batch.
 
-        # Get the ID
-        result = self.db.fetch_one(
-            "SELECT id FROM technologies WHERE name = ?",
-            (tech_name,)
-        )
+        Args:
+            conn: Open database connection (inside the load transaction)
+            tech_catalog: Mapping of technology name to category
 
-        return result['id']
+        Returns:
+            Mapping of technology name to id covering tech_catalog
+        """
+        if not self._tech_ids:
+            self._tech_ids = {
+                row['name']: row['id'] for row in
+                conn.execute("SELECT id, name FROM technologies")
+            }
+
+        new_techs = [
+            (name, category) for name, category in tech_catalog.items()
+            if name not in self._tech_ids
+        ]
+        if new_techs:
+            conn.executemany(
+                "INSERT OR IGNORE INTO technologies (name, category) VALUES (?, ?)",
+                new_techs
+            )
+            placeholders = ','.join('?' * len(new_techs))
+            for row in conn.execute(
+                f"SELECT id, name FROM technologies WHERE name IN ({placeholders})",
+                tuple(name for name, _ in new_techs)
+            ):
+                self._tech_ids[row['name']] = row['id']
 
-    def _link_job_technology(self, job_id: str, tech_id: int, snapshot_date: date):
-        """Link a technology to a job."""
-        query = '''
-            INSERT OR IGNORE INTO job_technologies
-            (job_id, technology_id, snapshot_date)
-            VALUES (?, ?, ?)
-        '''
+        self.stats['technologies_new'] += len(new_techs)
 
-        self.db.execute_query(query, (job_id, tech_id, snapshot_date))
+        return self._tech_ids
 
     def _mark_expired_jobs(self, active_job_ids: Set[str]) -> int:
         """
@@ -274,22 +483,27 @@ class DataLoader:
         Returns:
             Number of jobs marked as expired
         """
-        # Get all currently active job IDs
-        all_active = self.db.fetch_all(
-            "SELECT job_id FROM job_postings WHERE is_active = 1"
+        # Stage the still-active ids in a temp table, then flip everything
+        # else in one set-based UPDATE inside SQLite — no per-row
+        # round trips, and no IN-list length limit to worry about
+        conn = self.db.connect()
+        conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS _active_jobs (job_id TEXT PRIMARY KEY)"
+        )
+        conn.execute("DELETE FROM _active_jobs")
+        conn.executemany(
+            "INSERT INTO _active_jobs (job_id) VALUES (?)",
+            [(job_id,) for job_id in active_job_ids]
         )
 
-        expired_count = 0
+        cursor = conn.execute(
+            '''UPDATE job_postings SET is_active = 0
+               WHERE is_active = 1
+                 AND job_id NOT IN (SELECT job_id FROM _active_jobs)'''
+        )
+        expired_count = cursor.rowcount
 
-        for row in all_active:
-            job_id = row['job_id']
-            if job_id not in active_job_ids:
-                # Mark as inactive
-                self.db.execute_query(
-                    "UPDATE job_postings SET is_active = 0 WHERE job_id = ?",
-                    (job_id,)
-                )
-                expired_count += 1
+        conn.execute("DROP TABLE _active_jobs")
 
         if expired_count > 0:
             logging.info(f"Marked {expired_count} jobs as inactive")
@@ -303,19 +517,20 @@ class DataLoader:
         Args:
             metric_date: Date for metrics
         """
-        # Calculate metrics from current data
+        # Calculate metrics from current data. Independent scalar
+        # subqueries instead of one three-way join: each aggregate scans
+        # only its own table through its covering index, and the old
+        # snapshot x salary fan-out (which double-counted snapshots when a
+        # job had several salary rows for the date) cannot occur
         metrics_query = '''
             SELECT
-                COUNT(DISTINCT jp.job_id) as total_jobs,
-                SUM(CASE WHEN js.location_type = 'remote' THEN 1 ELSE 0 END) as remote_jobs,
-                SUM(CASE WHEN js.location_type = 'office' THEN 1 ELSE 0 END) as office_jobs,
-                SUM(CASE WHEN js.location_type = 'hybrid' THEN 1 ELSE 0 END) as hybrid_jobs,
-                AVG(s.salary_avg) as avg_salary,
-                COUNT(DISTINCT s.job_id) as jobs_with_salary
-            FROM job_postings jp
-            LEFT JOIN job_snapshots js ON jp.job_id = js.job_id AND js.snapshot_date = ?
-            LEFT JOIN salaries s ON jp.job_id = s.job_id AND s.snapshot_date = ?
-            WHERE jp.is_active = 1
+                (SELECT COUNT(*) FROM job_postings WHERE is_active = 1) as total_jobs,
+                (SELECT AVG(s.salary_avg) FROM salaries s
+                    JOIN job_postings jp ON jp.job_id = s.job_id
+                    WHERE jp.is_active = 1 AND s.snapshot_date = ?) as avg_salary,
+                (SELECT COUNT(DISTINCT s.job_id) FROM salaries s
+                    JOIN job_postings jp ON jp.job_id = s.job_id
+                    WHERE jp.is_active = 1 AND s.snapshot_date = ?) as jobs_with_salary
         '''
 
         metrics = self.db.fetch_one(metrics_query, (metric_date, metric_date))
@@ -324,20 +539,36 @@ class DataLoader:
             logging.warning("Could not calculate metrics")
             return
 
-        # Calculate median salary (requires separate query)
+        # Location split in one grouped pass over the day's snapshots,
+        # pivoted in Python, instead of one filtered count per type
+        location_counts = {
+            row['location_type']: row['n']
+            for row in self.db.fetch_all(
+                '''SELECT js.location_type, COUNT(*) as n
+                   FROM job_snapshots js
+                   JOIN job_postings jp ON jp.job_id = js.job_id
+                   WHERE jp.is_active = 1 AND js.snapshot_date = ?
+                   GROUP BY js.location_type''',
+                (metric_date,)
+            )
+        }
+
+        # Calculate median salary in one pass: window functions number and
+        # count the day's rows in the same ordered scan, where the old
+        # LIMIT/OFFSET form read the table twice (once for COUNT, once to
+        # seek the middle row)
         median_query = '''
-            SELECT salary_avg
-            FROM salaries
-            WHERE snapshot_date = ?
-            ORDER BY salary_avg
-            LIMIT 1 OFFSET (
-                SELECT COUNT(*) / 2
+            WITH ordered AS (
+                SELECT salary_avg,
+                       ROW_NUMBER() OVER (ORDER BY salary_avg) AS rn,
+                       COUNT(*) OVER () AS cnt
                 FROM salaries
                 WHERE snapshot_date = ?
             )
+            SELECT salary_avg FROM ordered WHERE rn = cnt / 2 + 1
         '''
 
-        median_result = self.db.fetch_one(median_query, (metric_date, metric_date))
+        median_result = self.db.fetch_one(median_query, (metric_date,))
         median_salary = median_result['salary_avg'] if median_result else None
 
         # Insert or update metrics
@@ -353,9 +584,9 @@ class DataLoader:
             (
                 metric_date,
                 metrics['total_jobs'],
-                metrics['remote_jobs'],
-                metrics['office_jobs'],
-                metrics['hybrid_jobs'],
+                location_counts.get('remote', 0),
+                location_counts.get('office', 0),
+                location_counts.get('hybrid', 0),
                 metrics['avg_salary'],
                 median_salary,
                 metrics['total_jobs']
@@ -5,7 +5,34 @@ Normalizes, cleans, and standardizes job data.
 
 import re
 import logging
-from typing import Dict, Optional, List, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Batches at least this large take the vectorized pandas path
+VECTORIZED_THRESHOLD = 200
+
+# Patterns compiled once at import; normalize_salary and clean_description
+# run for every scraped job
+_NUMBER_RE = re.compile(r'\d+')
+_WHITESPACE_RE = re.compile(r'\s+')
+# Salary-text detectors: each used to be two or three substring checks,
+# every one re-lowercasing the text; now the text is lowered once per
+# call and each detector is a single compiled search
+_EUR_RE = re.compile(r'EUR|€')
+_USD_RE = re.compile(r'USD|\$')
+_HOURLY_RE = re.compile(r'/h|godz|hour')
+_ANNUAL_RE = re.compile(r'/rok|annual|yearly')
+_B2B_RE = re.compile(r'b2b|netto|net')
+# Thousands separators seen in scraped salary strings, removed in one
+# C-level translate pass instead of chained str.replace copies
+_SEPARATOR_TBL = str.maketrans('', '', ' \xa0\t ')
+# Seniority tiers, one compiled alternation each instead of a per-call
+# tuple build plus Python-level any() loop
+_SENIOR_RE = re.compile(r'senior|starszy|lead|principal|architect')
+_JUNIOR_RE = re.compile(r'junior|młodszy|trainee|graduate|entry')
 
 
 class DataTransformer:
@@ -57,6 +84,30 @@ class DataTransformer:
         ]
     }
 
+    # Remote-work keywords checked against the lowercased location text
+    REMOTE_KEYWORDS = ('zdalna', 'remote', 'zdalnie', 'praca zdalna', 'remotely')
+
+    # Flat lookup tables derived once from the mappings above: an O(1)
+    # lowercase-name dict for exact category matches, and a pre-lowered
+    # city list so standardize_location skips per-call .lower() calls
+    _CATEGORY_BY_NAME = {
+        tech.lower(): category
+        for category, tech_list in TECHNOLOGY_CATEGORIES.items()
+        for tech in tech_list
+    }
+    _CITY_LOOKUP = tuple(
+        (city.lower(), city, region) for city, region in CITY_TO_REGION.items()
+    )
+
+    # Compiled alternations over the tables above: one C-level regex scan
+    # of the location text replaces a Python loop of substring checks per
+    # call. The canonical map resolves the matched lowercase city back to
+    # its display name and region
+    _REMOTE_RE = re.compile('|'.join(re.escape(k) for k in REMOTE_KEYWORDS))
+    _CITY_RE = re.compile('|'.join(re.escape(c) for c, _, _ in _CITY_LOOKUP))
+    _CITY_BY_LOWER = {c: (name, region) for c, name, region in _CITY_LOOKUP}
+    _TECH_SUBSTR_RE = re.compile('|'.join(re.escape(t) for t in _CATEGORY_BY_NAME))
+
     def __init__(self):
         """Initialize transformer."""
         pass
@@ -150,12 +201,43 @@ class DataTransformer:
         if not salary_text:
             return None
 
+        fields = self._salary_fields(salary_text)
+        if fields is None:
+            return None
+
+        salary_min, salary_max, salary_avg, currency, period, is_b2b = fields
+        return {
+            'salary_min': salary_min,
+            'salary_max': salary_max,
+            'salary_avg': salary_avg,
+            'currency': currency,
+            'period': period,
+            'is_b2b': is_b2b
+        }
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _salary_fields(cls, salary_text: str) -> Optional[Tuple]:
+        """
+        Parse salary text into its field tuple, cached per unique string.
+
+        Scraped batches repeat the same salary strings across many
+        postings, so parsing each distinct string once covers the batch.
+        Returns an immutable tuple — the public wrapper builds a fresh
+        dict per call, so cache hits never share mutable state.
+
+        Args:
+            salary_text: Raw salary text
+
+        Returns:
+            (min, max, avg, currency, period, is_b2b) tuple or None
+        """
         try:
             # Remove spaces for easier parsing
-            cleaned = salary_text.replace(' ', '').replace('\xa0', '')
+            cleaned = salary_text.translate(_SEPARATOR_TBL)
 
             # Extract numbers
-            numbers = re.findall(r'\d+', cleaned)
+            numbers = _NUMBER_RE.findall(cleaned)
             if len(numbers) < 2:
                 # Try single number (might be exact salary)
                 if len(numbers) == 1:
@@ -171,34 +253,32 @@ class DataTransformer:
             if salary_min > salary_max:
                 salary_min, salary_max = salary_max, salary_min
 
-            # Detect currency
+            cleaned_lower = cleaned.lower()
+
+            # Detect currency (case-sensitive: codes and symbols)
             currency = 'PLN'
-            if 'EUR' in cleaned or '€' in cleaned:
+            if _EUR_RE.search(cleaned):
                 currency = 'EUR'
-            elif 'USD' in cleaned or '$' in cleaned:
+            elif _USD_RE.search(cleaned):
                 currency = 'USD'
 
             # Detect period
             period = 'monthly'
-            if '/h' in cleaned or 'godz' in cleaned.lower() or 'hour' in cleaned.lower():
+            if _HOURLY_RE.search(cleaned_lower):
                 period = 'hourly'
-            elif '/rok' in cleaned or 'annual' in cleaned.lower() or 'yearly' in cleaned.lower():
+            elif _ANNUAL_RE.search(cleaned_lower):
                 period = 'annual'
 
             # Detect B2B vs employment
-            is_b2b = any(word in cleaned.lower() for word in ['b2b', 'netto', 'net'])
+            is_b2b = _B2B_RE.search(cleaned_lower) is not None
 
             # Calculate average
             salary_avg = (salary_min + salary_max) / 2
 
-            return {
-                'salary_min': float(salary_min),
-                'salary_max': float(salary_max),
-                'salary_avg': float(salary_avg),
-                'currency': currency,
-                'period': period,
-                'is_b2b': is_b2b
-            }
+            return (
+                float(salary_min), float(salary_max), float(salary_avg),
+                currency, period, is_b2b
+            )
 
         except Exception as e:
             logging.warning(f"Could not parse salary '{salary_text}': {e}")
@@ -215,28 +295,41 @@ class DataTransformer:
             Dictionary with location_type, city, region, country
         """
         if not location_text:
-            return {
-                'location_type': None,
-                'city': None,
-                'region': None,
-                'country': 'Poland'
-            }
+            location_type = city = region = None
+        else:
+            location_type, city, region = self._location_fields(location_text)
+
+        return {
+            'location_type': location_type,
+            'city': city,
+            'region': region,
+            'country': 'Poland'
+        }
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _location_fields(cls, location_text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Resolve location text to its field tuple, cached per unique string.
+
+        Args:
+            location_text: Raw location text
 
+        Returns:
+            (location_type, city, region) tuple
+        """
         location_lower = location_text.lower()
 
         # Detect remote keywords
-        remote_keywords = ['zdalna', 'remote', 'zdalnie', 'praca zdalna', 'remotely']
-        is_remote = any(keyword in location_lower for keyword in remote_keywords)
+        is_remote = cls._REMOTE_RE.search(location_lower) is not None
 
         # Extract city
         city = None
         region = None
 
-        for city_name, region_name in self.CITY_TO_REGION.items():
-            if city_name.lower() in location_lower:
-                city = city_name
-                region = region_name
-                break
+        city_match = cls._CITY_RE.search(location_lower)
+        if city_match:
+            city, region = cls._CITY_BY_LOWER[city_match.group(0)]
 
         # Determine location type
         if is_remote and city:
@@ -248,16 +341,15 @@ class DataTransformer:
         else:
             location_type = None
 
-        return {
-            'location_type': location_type,
-            'city': city,
-            'region': region,
-            'country': 'Poland'
-        }
+        return (location_type, city, region)
 
-    def categorize_technology(self, tech_name: str) -> str:
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def categorize_technology(cls, tech_name: str) -> str:
         """
-        Categorize a technology.
+        Categorize a technology. Cached per unique name — batches repeat
+        the same technology names constantly, and the result is an
+        immutable string.
 
         Args:
             tech_name: Technology name
@@ -267,23 +359,26 @@ class DataTransformer:
         """
         tech_lower = tech_name.lower()
 
-        # First pass: exact match
-        for category, tech_list in self.TECHNOLOGY_CATEGORIES.items():
-            for tech in tech_list:
-                if tech.lower() == tech_lower:
-                    return category
+        # First pass: exact match is a single dict lookup
+        category = cls._CATEGORY_BY_NAME.get(tech_lower)
+        if category is not None:
+            return category
 
-        # Second pass: substring match (tech name contains list item)
-        for category, tech_list in self.TECHNOLOGY_CATEGORIES.items():
-            for tech in tech_list:
-                if tech.lower() in tech_lower:
-                    return category
+        # Second pass: substring match (tech name contains list item),
+        # run as one scan of the compiled alternation instead of ~60
+        # Python-level `in` checks
+        match = cls._TECH_SUBSTR_RE.search(tech_lower)
+        if match:
+            return cls._CATEGORY_BY_NAME[match.group(0)]
 
         return 'other'
 
-    def normalize_seniority(self, seniority: Optional[str]) -> str:
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def normalize_seniority(cls, seniority: Optional[str]) -> str:
         """
-        Normalize seniority level.
+        Normalize seniority level. Cached per unique string; the result
+        is an immutable string.
 
         Args:
             seniority: Raw seniority string
@@ -296,9 +391,9 @@ class DataTransformer:
 
         seniority_lower = seniority.lower()
 
-        if any(word in seniority_lower for word in ['senior', 'starszy', 'lead', 'principal', 'architect']):
+        if _SENIOR_RE.search(seniority_lower):
             return 'senior'
-        elif any(word in seniority_lower for word in ['junior', 'młodszy', 'trainee', 'graduate', 'entry']):
+        elif _JUNIOR_RE.search(seniority_lower):
             return 'junior'
         else:
             return 'mid'
@@ -330,7 +425,7 @@ class DataTransformer:
             return None
 
         # Remove excessive whitespace
-        cleaned = re.sub(r'\s+', ' ', description)
+        cleaned = _WHITESPACE_RE.sub(' ', description)
 
         # Truncate
         if len(cleaned) > max_length:
@@ -348,6 +443,9 @@ class DataTransformer:
         Returns:
             List of transformed job data
         """
+        if len(extracted_data_list) >= VECTORIZED_THRESHOLD:
+            return self.transform_batch_vectorized(extracted_data_list)
+
         transformed_list = []
 
         for data in extracted_data_list:
@@ -361,3 +459,133 @@ class DataTransformer:
         logging.info(f"Transformed {len(transformed_list)}/{len(extracted_data_list)} jobs")
 
         return transformed_list
+
+    def iter_transform_batch(self, extracted_data_iter: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Lazily transform extracted jobs.
+
+        Yields one transformed job at a time, so a chunked loader can
+        consume the stream without both the extracted list and the full
+        transformed list being resident at once. Counterpart of the
+        extractor's iter_extract_batch; transform_batch remains the
+        list-returning convenience wrapper.
+
+        Args:
+            extracted_data_iter: Iterable of extracted job data
+
+        Yields:
+            Transformed job data dictionaries
+        """
+        _transform = self.transform
+        dropped = 0
+
+        for data in extracted_data_iter:
+            try:
+                yield _transform(data)
+            except Exception as e:
+                dropped += 1
+                logging.error(f"Error transforming job data: {e}")
+
+        if dropped:
+            logging.warning(f"Dropped {dropped} jobs during transform")
+
+    def transform_batch_vectorized(self, extracted_data_list: List[Dict]) -> List[Dict]:
+        """
+        Transform a batch through vectorized pandas column operations.
+
+        Salary parsing and location standardization — the regex-heavy
+        transforms — run as one pandas kernel per column instead of
+        several Python-level calls per job. Seniority and technology
+        categorization stay per-row (dict lookups, already cheap).
+        Output is identical in shape to transform_batch.
+
+        Args:
+            extracted_data_list: List of extracted job data
+
+        Returns:
+            List of transformed job data
+        """
+        if not extracted_data_list:
+            return []
+
+        salary_s = pd.Series(
+            [d['salary'].get('salary_text') for d in extracted_data_list],
+            dtype='string'
+        )
+        location_s = pd.Series(
+            [d['snapshot'].get('location') for d in extracted_data_list],
+            dtype='string'
+        )
+
+        # Salary: strip separators, pull the first two numbers, then do
+        # the min/max/avg arithmetic as array operations
+        cleaned = salary_s.str.translate(_SEPARATOR_TBL)
+        numbers = cleaned.str.extract(r'(\d+)(?:\D+(\d+))?')
+        raw_min = pd.to_numeric(numbers[0], errors='coerce')
+        raw_max = pd.to_numeric(numbers[1], errors='coerce').fillna(raw_min)
+        salary_min = np.minimum(raw_min, raw_max)
+        salary_max = np.maximum(raw_min, raw_max)
+        salary_avg = (salary_min + salary_max) / 2
+        salary_valid = raw_min.notna()
+
+        cleaned_lower = cleaned.str.lower()
+        currency = np.where(
+            cleaned.str.contains(_EUR_RE, na=False), 'EUR',
+            np.where(cleaned.str.contains(_USD_RE, na=False), 'USD', 'PLN')
+        )
+        period = np.where(
+            cleaned_lower.str.contains(_HOURLY_RE, na=False), 'hourly',
+            np.where(cleaned_lower.str.contains(_ANNUAL_RE, na=False), 'annual', 'monthly')
+        )
+        is_b2b = cleaned_lower.str.contains(_B2B_RE, na=False)
+
+        # Location: remote flag and city extraction over the whole column
+        location_lower = location_s.str.lower()
+        is_remote = location_lower.str.contains(self._REMOTE_RE, na=False)
+        city_key = location_lower.str.extract(f'({self._CITY_RE.pattern})', expand=False)
+        has_city = city_key.notna()
+        city = city_key.map({k: v[0] for k, v in self._CITY_BY_LOWER.items()})
+        region = city_key.map({k: v[1] for k, v in self._CITY_BY_LOWER.items()})
+        location_type = np.select(
+            [is_remote & has_city, is_remote, has_city],
+            ['hybrid', 'remote', 'office'],
+            default=None
+        )
+
+        transformed_list = []
+
+        for i, data in enumerate(extracted_data_list):
+            try:
+                snapshot = data['snapshot'].copy()
+                snapshot.update({
+                    'location_type': location_type[i],
+                    'city': city[i] if has_city[i] else None,
+                    'region': region[i] if has_city[i] else None,
+                    'country': 'Poland',
+                    'seniority_level': self.normalize_seniority(snapshot.get('seniority'))
+                })
+
+                salary = None
+                if salary_valid[i]:
+                    salary = {
+                        'salary_min': float(salary_min[i]),
+                        'salary_max': float(salary_max[i]),
+                        'salary_avg': float(salary_avg[i]),
+                        'currency': currency[i],
+                        'period': period[i],
+                        'is_b2b': bool(is_b2b[i])
+                    }
+
+                transformed_list.append({
+                    'job_posting': data['job_posting'].copy(),
+                    'snapshot': snapshot,
+                    'salary': salary,
+                    'technologies': self._transform_technologies(data['technologies'])
+                })
+            except Exception as e:
+                logging.error(f"Error transforming job data: {e}")
+                continue
+
+        logging.info(f"Transformed {len(transformed_list)}/{len(extracted_data_list)} jobs")
+
+        return transformed_list
@@ -5,13 +5,38 @@ Coordinates scraping with rate limiting and error handling.
 
 import requests
 import logging
-import time
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
 from urllib.parse import urljoin
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from .rate_limiter import RateLimiter, CircuitBreaker
 from .parser import JobParser
+from .page_cache import PageCache
+
+# Advertise modern codecs only when the matching decoder is importable:
+# urllib3 decompresses transparently, but advertising a codec we cannot
+# decode would hand us undecodable bytes. Brotli/zstd typically shave
+# 15-25% off gzip for HTML, which matters on listing-heavy runs.
+_ACCEPT_ENCODING = 'gzip, deflate'
+try:
+    import zstandard  # noqa: F401
+    _ACCEPT_ENCODING = 'zstd, ' + _ACCEPT_ENCODING
+except ImportError:
+    pass
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'br, ' + _ACCEPT_ENCODING
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = 'br, ' + _ACCEPT_ENCODING
+    except ImportError:
+        pass
 
 
 class NoFluffScraper:
@@ -29,21 +54,58 @@ class NoFluffScraper:
         self.search_url = config['scraper']['search_url']
         self.user_agent = config['scraper']['user_agent']
         self.timeout = config['scraper']['timeout_seconds']
+        # Hard cap on decompressed response size: one runaway page (or a
+        # misconfigured download) no longer drives peak memory for the run
+        self.max_bytes = config['scraper'].get('max_response_bytes', 5 * 1024 * 1024)
         self.max_pages = config['scraping']['max_pages']
         self.max_jobs = config['scraping'].get('max_jobs_per_run', 1000)
+        # Detail pages are fetched by this many workers at once; pacing
+        # between request starts still goes through the rate limiter, so
+        # concurrency overlaps network round trips without raising the
+        # request rate
+        self.concurrency = config['scraping'].get('concurrency', 4)
 
         # Initialize components
         self.rate_limiter = RateLimiter(config['rate_limiting'])
         self.circuit_breaker = CircuitBreaker(failure_threshold=5, timeout_seconds=300)
         self.parser = JobParser(self.base_url)
 
-        # Session for connection pooling
+        # On-disk cache for detail pages: re-runs within the TTL serve
+        # unchanged pages from disk instead of the network. cache_hours: 0
+        # disables caching entirely
+        cache_hours = config['scraping'].get('cache_hours', 12)
+        self.page_cache = PageCache(
+            config['scraping'].get('cache_path', 'data/page_cache.sqlite'),
+            ttl_hours=cache_hours,
+        ) if cache_hours > 0 else None
+
+        # Session for connection pooling. The adapter pool is sized to the
+        # worker count so concurrent detail fetches reuse warm TLS
+        # connections instead of discarding them, and transient failures
+        # (5xx, timeouts, connection resets) are retried with exponential
+        # backoff inside urllib3. 429 is deliberately excluded from the
+        # forcelist: _fetch_page handles it so the adaptive rate limiter
+        # sees every rate-limit response.
         self.session = requests.Session()
+        retry_policy = Retry(
+            total=config['rate_limiting'].get('retry_attempts', 3),
+            backoff_factor=config['rate_limiting'].get('retry_backoff', 2),
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_maxsize=max(10, self.concurrency),
+            max_retries=retry_policy,
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': self.user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'pl-PL,pl;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': _ACCEPT_ENCODING,
             'Connection': 'keep-alive',
         })
 
@@ -54,6 +116,10 @@ class NoFluffScraper:
             'jobs_scraped': 0,
             'errors': 0
         }
+        # Serialize rate-limiter pacing and stats updates across the
+        # detail-fetch workers
+        self._pacing_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
 
     def scrape_all(self) -> List[Dict]:
         """
@@ -62,116 +128,210 @@ class NoFluffScraper:
         Returns:
             List of job data dictionaries
         """
+        return list(self.iter_jobs())
+
+    def iter_jobs(self):
+        """
+        Scrape job listings, yielding each job as soon as it is parsed.
+
+        Listing discovery and detail fetching are fused into one
+        pipeline: each listing page's URLs are handed to the worker pool
+        immediately, so detail round trips start while later listing
+        pages are still being discovered, and finished jobs stream out
+        while both are in flight. Total wall time approaches
+        max(discovery, details) instead of their sum.
+
+        Yields:
+            Job data dictionaries
+        """
         logging.info("Starting NoFluffJobs scraper")
         logging.info(f"Max pages: {self.max_pages}, Max jobs: {self.max_jobs}")
 
-        # Phase 1: Get all job URLs
-        job_urls = self._scrape_job_urls()
-        logging.info(f"Found {len(job_urls)} job URLs")
+        submitted = 0
+        completed = 0
+        pending = deque()
 
-        if not job_urls:
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for url in self._iter_job_urls(executor):
+                if submitted >= self.max_jobs:
+                    logging.info(f"Limiting to {self.max_jobs} jobs")
+                    break
+                pending.append(executor.submit(self._scrape_one, url))
+                submitted += 1
+
+                # Emit whatever has already finished so downstream work
+                # (disk writes, extraction) overlaps the ongoing scrape.
+                # Draining from the head keeps results in submission order
+                while pending and pending[0].done():
+                    job_data = pending.popleft().result()
+                    completed += 1
+                    if job_data:
+                        logging.info(
+                            f"✓ Successfully scraped ({completed}/{submitted}): "
+                            f"{job_data.get('title', 'Unknown')}"
+                        )
+                        yield job_data
+
+            while pending:
+                job_data = pending.popleft().result()
+                completed += 1
+                if job_data:
+                    logging.info(
+                        f"✓ Successfully scraped ({completed}/{submitted}): "
+                        f"{job_data.get('title', 'Unknown')}"
+                    )
+                    yield job_data
+
+        if not submitted:
             logging.warning("No job URLs found. Check if website structure changed.")
-            return []
-
-        # Limit to max jobs
-        if len(job_urls) > self.max_jobs:
-            logging.info(f"Limiting to {self.max_jobs} jobs")
-            job_urls = job_urls[:self.max_jobs]
-
-        # Phase 2: Scrape each job detail
-        all_jobs = []
-        for i, url in enumerate(job_urls, 1):
-            if not self.circuit_breaker.can_proceed():
-                logging.error("Circuit breaker open, stopping scrape")
-                break
 
-            try:
-                logging.info(f"Scraping job {i}/{len(job_urls)}: {url}")
+        # Log final statistics
+        self._log_statistics()
 
-                # Rate limiting
-                if i > 1:  # Don't wait before first request
-                    self.rate_limiter.wait()
+    def _scrape_one(self, url: str) -> Optional[Dict]:
+        """
+        Worker task: pace, fetch and parse one job detail page.
 
-                job_data = self._scrape_job_detail(url)
+        Runs on the detail-fetch pool; returns None when the circuit
+        breaker is open or the page could not be scraped.
 
-                if job_data:
-                    all_jobs.append(job_data)
-                    self.stats['jobs_scraped'] += 1
-                    self.circuit_breaker.record_success()
-                    logging.info(f"✓ Successfully scraped: {job_data.get('title', 'Unknown')}")
-                else:
-                    logging.warning(f"Failed to scrape job: {url}")
-
-            except Exception as e:
-                self.stats['errors'] += 1
-                self.circuit_breaker.record_failure()
-                logging.error(f"Error scraping {url}: {e}")
+        Args:
+            url: Job posting URL
 
-                # Continue with next job
-                continue
+        Returns:
+            Job data dictionary or None
+        """
+        # Cached pages involve no network I/O, so they skip the circuit
+        # breaker and consume no rate-limiter token
+        if self.page_cache:
+            html = self.page_cache.get(url)
+            if html is not None:
+                try:
+                    tree = self.parser.parse_html(html)
+                    return self.parser.parse_job_detail(tree, url)
+                except Exception as e:
+                    # Corrupt cache entry: fall through to a fresh fetch
+                    logging.warning(f"Failed to parse cached page {url}: {e}")
+
+        if not self.circuit_breaker.can_proceed():
+            logging.error("Circuit breaker open, skipping job fetch")
+            return None
 
-        # Log final statistics
-        self._log_statistics()
+        with self._pacing_lock:
+            self.rate_limiter.wait()
 
-        return all_jobs
+        try:
+            job_data = self._scrape_job_detail(url)
+        except Exception as e:
+            with self._stats_lock:
+                self.stats['errors'] += 1
+            self.circuit_breaker.record_failure()
+            logging.error(f"Error scraping {url}: {e}")
+            return None
 
-    def _scrape_job_urls(self) -> List[str]:
+        if job_data:
+            with self._stats_lock:
+                self.stats['jobs_scraped'] += 1
+            self.circuit_breaker.record_success()
+        else:
+            logging.warning(f"Failed to scrape job: {url}")
+
+        return job_data
+
+    def _iter_job_urls(self, executor: ThreadPoolExecutor) -> Iterator[str]:
         """
-        Scrape all job URLs from listing pages.
+        Discover job URLs from listing pages, yielding them as found.
 
-        Returns:
-            List of job URLs
+        Listing pages are independent, so they are fetched speculatively
+        in waves of `concurrency` instead of strictly one RTT at a time.
+        Results are still consumed in page order and the walk stops at
+        the first empty page (or when pagination ends); at most the rest
+        of the current wave is wasted, and every fetch — used or not —
+        pays its rate-limiter token, so the request budget is unchanged.
+
+        Args:
+            executor: Worker pool shared with the detail fetches
+
+        Yields:
+            Unique job URLs, page by page
         """
-        all_urls = []
+        # Accumulated directly as a set: membership stays O(1) and there
+        # is no second dedupe pass over the full collection at the end
+        all_urls: set = set()
         page = 1
 
         while page <= self.max_pages:
-            try:
-                logging.info(f"Scraping listing page {page}")
-
-                # Rate limiting
-                if page > 1:
-                    self.rate_limiter.wait()
-
-                # Fetch page
-                url = self._get_page_url(page)
-                html = self._fetch_page(url)
+            wave = range(page, min(page + self.concurrency, self.max_pages + 1))
+            results = executor.map(self._fetch_listing_page, wave)
 
+            stop = False
+            for page, html in zip(wave, results):
                 if not html:
                     logging.warning(f"Empty response for page {page}")
+                    stop = True
                     break
 
-                soup = BeautifulSoup(html, 'lxml')
-
-                # Extract job URLs
-                page_urls = self.parser.extract_job_urls(soup)
+                try:
+                    tree = self.parser.parse_html(html)
+                    page_urls = self.parser.extract_job_urls(tree)
+                except Exception as e:
+                    logging.error(f"Error scraping page {page}: {e}")
+                    stop = True
+                    break
 
                 if not page_urls:
                     logging.info(f"No more jobs found on page {page}")
+                    stop = True
                     break
 
-                all_urls.extend(page_urls)
+                new_urls = [u for u in page_urls if u not in all_urls]
+                all_urls.update(new_urls)
                 self.stats['pages_scraped'] += 1
-                self.stats['jobs_found'] += len(page_urls)
+                self.stats['jobs_found'] += len(new_urls)
 
-                logging.info(f"Found {len(page_urls)} jobs on page {page} (total: {len(all_urls)})")
+                logging.info(f"Found {len(new_urls)} jobs on page {page} (total: {len(all_urls)})")
 
-                # Check if there's a next page
-                if not self.parser.has_next_page(soup):
+                yield from new_urls
+
+                if not self.parser.has_next_page(tree):
                     logging.info("No more pages available")
+                    stop = True
                     break
 
-                page += 1
-
-            except Exception as e:
-                logging.error(f"Error scraping page {page}: {e}")
+            if stop:
                 break
+            page += 1
 
-        # Remove duplicates
-        unique_urls = list(set(all_urls))
-        logging.info(f"Found {len(unique_urls)} unique job URLs (removed {len(all_urls) - len(unique_urls)} duplicates)")
+        logging.info(f"Found {len(all_urls)} unique job URLs")
 
-        return unique_urls
+    def _scrape_job_urls(self) -> List[str]:
+        """
+        Scrape all job URLs from listing pages.
+
+        Returns:
+            List of job URLs
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            return list(self._iter_job_urls(executor))
+
+    def _fetch_listing_page(self, page: int) -> Optional[bytes]:
+        """
+        Worker task: pace and fetch one listing page.
+
+        Args:
+            page: Listing page number
+
+        Returns:
+            HTML bytes or None if the fetch failed
+        """
+        logging.info(f"Scraping listing page {page}")
+        with self._pacing_lock:
+            self.rate_limiter.wait()
+        try:
+            return self._fetch_page(self._get_page_url(page))
+        except Exception as e:
+            logging.error(f"Error fetching listing page {page}: {e}")
+            return None
 
     def _scrape_job_detail(self, url: str) -> Optional[Dict]:
         """
@@ -189,8 +349,12 @@ class NoFluffScraper:
             if not html:
                 return None
 
-            soup = BeautifulSoup(html, 'lxml')
-            job_data = self.parser.parse_job_detail(soup, url)
+            tree = self.parser.parse_html(html)
+            job_data = self.parser.parse_job_detail(tree, url)
+
+            # Only pages that parsed into a job are worth caching
+            if job_data and self.page_cache:
+                self.page_cache.put(url, html)
 
             return job_data
 
@@ -198,80 +362,79 @@ class NoFluffScraper:
             logging.error(f"Error parsing job detail: {e}")
             return None
 
-    def _fetch_page(self, url: str, retry_count: int = 0) -> Optional[str]:
+    def _fetch_page(self, url: str, retry_count: int = 0) -> Optional[bytes]:
         """
-        Fetch a page with retry logic.
+        Fetch a page, returning the raw body bytes.
+
+        The body is streamed and read up to max_response_bytes, so a
+        runaway page cannot blow up memory, and it stays bytes all the
+        way into lxml (which does its own encoding detection) instead of
+        paying for an up-front Unicode decode of the full document.
+
+        Transient failures — 5xx responses, timeouts, connection errors —
+        are retried with exponential backoff by the urllib3 Retry policy
+        mounted on the session, so they arrive here only after the retry
+        budget is spent. 429 is handled manually so the adaptive rate
+        limiter sees every rate-limit response.
 
         Args:
             url: URL to fetch
-            retry_count: Current retry attempt
+            retry_count: Current 429 retry attempt
 
         Returns:
-            HTML content or None if failed
+            HTML content as bytes or None if failed
         """
         max_retries = self.rate_limiter.retry_attempts
 
         try:
-            response = self.session.get(
+            with self.session.get(
                 url,
+                stream=True,
                 timeout=self.timeout,
                 verify=self.config['scraper'].get('verify_ssl', True)
-            )
-
-            # Handle different status codes
-            if response.status_code == 200:
-                return response.text
-
-            elif response.status_code == 429:
-                # Rate limited
-                if retry_count < max_retries:
-                    logging.warning(f"Rate limited (429), retry {retry_count + 1}/{max_retries}")
-                    self.rate_limiter.handle_rate_limit_error(retry_count)
-                    return self._fetch_page(url, retry_count + 1)
-                else:
-                    logging.error("Max retries reached for rate limiting")
-                    return None
-
-            elif response.status_code == 404:
-                # Job not found (might be expired)
-                logging.info(f"Job not found (404): {url}")
-                return None
-
-            elif response.status_code in [500, 502, 503, 504]:
-                # Server error
-                if retry_count < max_retries:
-                    delay = self.rate_limiter.get_retry_delay(retry_count)
-                    logging.warning(f"Server error ({response.status_code}), waiting {delay}s before retry")
-                    time.sleep(delay)
-                    return self._fetch_page(url, retry_count + 1)
-                else:
-                    logging.error(f"Server error {response.status_code}, max retries reached")
-                    return None
-
-            else:
-                logging.error(f"Unexpected status code {response.status_code} for {url}")
-                return None
+            ) as response:
+                if response.status_code == 200:
+                    # Read one byte past the cap so truncation is detectable
+                    body = response.raw.read(self.max_bytes + 1, decode_content=True)
+        except requests.RequestException as e:
+            logging.error(f"Request failed after retries for {url}: {e}")
+            return None
 
-        except requests.Timeout:
+        if response.status_code == 200:
+            if len(body) > self.max_bytes:
+                logging.warning(
+                    f"Response for {url} exceeds {self.max_bytes} bytes, truncating"
+                )
+                body = body[:self.max_bytes]
+            # Feed the adaptive rate limiter so a rate lowered by an
+            # earlier 429 climbs back toward the configured ceiling
+            self.rate_limiter.record_success()
+            return body
+
+        elif response.status_code == 429:
+            # Rate limited
             if retry_count < max_retries:
-                logging.warning(f"Request timeout, retry {retry_count + 1}/{max_retries}")
-                time.sleep(self.rate_limiter.get_retry_delay(retry_count))
+                logging.warning(f"Rate limited (429), retry {retry_count + 1}/{max_retries}")
+                self.rate_limiter.handle_rate_limit_error(retry_count)
                 return self._fetch_page(url, retry_count + 1)
             else:
-                logging.error(f"Timeout after {max_retries} retries")
+                logging.error("Max retries reached for rate limiting")
                 return None
 
-        except requests.ConnectionError as e:
-            if retry_count < max_retries:
-                logging.warning(f"Connection error, retry {retry_count + 1}/{max_retries}")
-                time.sleep(self.rate_limiter.get_retry_delay(retry_count) * 2)
-                return self._fetch_page(url, retry_count + 1)
-            else:
-                logging.error(f"Connection error after {max_retries} retries: {e}")
-                return None
+        elif response.status_code == 404:
+            # Job not found (might be expired)
+            logging.info(f"Job not found (404): {url}")
+            return None
 
-        except Exception as e:
-            logging.error(f"Unexpected error fetching {url}: {e}")
+        elif response.status_code in [500, 502, 503, 504]:
+            # urllib3 already retried; back the shared rate off so the
+            # other workers stop hammering a struggling server
+            self.rate_limiter.record_failure()
+            logging.error(f"Server error {response.status_code} after retries: {url}")
+            return None
+
+        else:
+            logging.error(f"Unexpected status code {response.status_code} for {url}")
             return None
 
     def _get_page_url(self, page: int) -> str:
@@ -301,6 +464,11 @@ class NoFluffScraper:
         logging.info(f"Jobs found: {self.stats['jobs_found']}")
         logging.info(f"Jobs scraped successfully: {self.stats['jobs_scraped']}")
         logging.info(f"Errors: {self.stats['errors']}")
+        if self.page_cache:
+            logging.info(
+                f"Page cache: {self.page_cache.hits} hits, "
+                f"{self.page_cache.misses} misses"
+            )
         logging.info("=" * 60)
 
     def check_robots_txt(self):
@@ -322,8 +490,10 @@ class NoFluffScraper:
         return None
 
     def close(self):
-        """Close the session."""
+        """Close the session and the page cache."""
         self.session.close()
+        if self.page_cache:
+            self.page_cache.close()
 
     def __enter__(self):
         """Context manager entry."""
@@ -0,0 +1,105 @@
+"""
+On-disk cache for fetched job detail pages.
+Lets re-runs skip the network for pages scraped recently.
+"""
+
+import sqlite3
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class PageCache:
+    """
+    SQLite-backed HTML cache keyed by URL.
+
+    Job detail pages are effectively immutable once posted, so a re-run
+    within the TTL can serve them straight from disk — microseconds
+    instead of a rate-limited network round trip. Entries past the TTL
+    are treated as misses and purged on startup so the file stays
+    bounded. All methods are thread-safe.
+    """
+
+    def __init__(self, db_path: str = "data/page_cache.sqlite",
+                 ttl_hours: float = 12):
+        """
+        Initialize page cache.
+
+        Args:
+            db_path: Path to the cache database file
+            ttl_hours: How long a cached page stays fresh, in hours
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_hours * 3600
+
+        # A single shared connection guarded by a lock: cache traffic is
+        # tiny compared to the network time it saves, so contention is
+        # not a concern
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                fetched_at REAL NOT NULL,
+                html BLOB NOT NULL
+            )
+        ''')
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+        self._purge_expired()
+
+    def get(self, url: str) -> Optional[bytes]:
+        """
+        Look up a cached page.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Cached HTML bytes, or None on a miss or expired entry
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT html, fetched_at FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+            if row and time.time() - row[1] <= self.ttl_seconds:
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+            return None
+
+    def put(self, url: str, html: bytes):
+        """
+        Store a fetched page.
+
+        Args:
+            url: Page URL
+            html: Raw HTML bytes
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (url, fetched_at, html) VALUES (?, ?, ?)",
+                (url, time.time(), html)
+            )
+            self._conn.commit()
+
+    def _purge_expired(self):
+        """Drop entries past the TTL so the cache file stays bounded."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM pages WHERE fetched_at < ?",
+                (time.time() - self.ttl_seconds,)
+            )
+            self._conn.commit()
+        if cursor.rowcount:
+            logging.info(f"Page cache: purged {cursor.rowcount} expired entries")
+
+    def close(self):
+        """Close the cache database."""
+        self._conn.close()
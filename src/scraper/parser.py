@@ -4,11 +4,125 @@ Extracts job listings and detailed job information.
 """
 
 import re
+import json
 import logging
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from typing import List, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+import lxml.html
+from lxml import etree
 from urllib.parse import urljoin
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# XPath expressions compiled once at import time. Evaluation runs entirely
+# in libxml2's C code, unlike CSS-selector matching over a Python tree.
+_XP_JOB_LINKS = etree.XPath('//a[contains(@href, "/job/")]/@href')
+_XP_TITLE = etree.XPath('string(//h1[1])')
+_XP_TITLE_FALLBACK = etree.XPath('//*[contains(@class, "title")]')
+_XP_COMPANY = etree.XPath(
+    '//*[contains(@class, "company")] | //a[contains(@href, "/company/")]'
+)
+_XP_DESCRIPTION = etree.XPath(
+    '//*[contains(@class, "description")] | //*[contains(@class, "about")]'
+)
+_XP_REQUIREMENTS = etree.XPath(
+    '//*[contains(@class, "requirement")] | //*[contains(@class, "must-have")]'
+)
+_XP_SALARY = etree.XPath(
+    '//*[contains(@class, "salary")] | //*[contains(@class, "money")]'
+)
+_XP_LOCATION = etree.XPath(
+    '//*[contains(@class, "location")] | //*[contains(@class, "city")]'
+)
+_XP_TECHNOLOGIES = etree.XPath(
+    '//*[contains(@class, "technology")] | //*[contains(@class, "skill")]'
+    ' | //*[contains(@class, "tech-")] | //span[contains(@class, "tag")]'
+    ' | //div[contains(@class, "tags")]/span'
+)
+_XP_NEXT_PAGE = etree.XPath(
+    '//a[@rel="next"] | //a[contains(@class, "next")]'
+    ' | //a[contains(@aria-label, "next")] | //button[contains(@class, "next")]'
+    ' | //a[contains(text(), "Next")] | //a[contains(text(), "Następna")]'
+)
+
+# JSON-LD fast path: job boards embed the canonical posting as a
+# schema.org JobPosting blob, which carries the same fields the DOM
+# selectors try to reconstruct
+_XP_JSONLD = etree.XPath('//script[@type="application/ld+json"]/text()')
+
+# schema.org employmentType values mapped onto the repo vocabulary
+_JSONLD_EMPLOYMENT = {
+    'FULL_TIME': 'full-time',
+    'PART_TIME': 'part-time',
+    'CONTRACTOR': 'contract',
+    'CONTRACT': 'contract',
+    'TEMPORARY': 'contract',
+    'B2B': 'b2b',
+}
+
+_JOB_ID_RE = re.compile(r'/job/([^/?]+)')
+_SALARY_DIGIT_RE = re.compile(r'\d')
+_SALARY_TEXT_RE = re.compile(r'(\d[\d\s]*-[\d\s]*\d)\s*(PLN|zł|EUR)')
+
+# Common technologies in Polish IT job market, matched by a single compiled
+# alternation so the page text is scanned once instead of once per keyword.
+# The alternation sits inside a lookahead so overlapping keywords are all
+# reported (e.g. ".NET" inside "ASP.NET", which starts at its own word
+# boundary), matching what the old one-pattern-per-keyword loop found.
+_TECH_KEYWORDS = [
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'C#', 'C++', 'Go', 'Rust',
+    'Ruby', 'PHP', 'Swift', 'Kotlin', 'Scala',
+    'React', 'Angular', 'Vue', 'Django', 'Flask', 'FastAPI', 'Spring',
+    'Node.js', 'Express', '.NET', 'ASP.NET',
+    'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Elasticsearch', 'Oracle',
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Terraform',
+    'Git', 'Jenkins', 'GitLab', 'CI/CD', 'Ansible',
+    'Linux', 'Ubuntu', 'Windows', 'MacOS'
+]
+_TECH_RE = re.compile(
+    r'\b(?=(' + '|'.join(re.escape(tech) for tech in _TECH_KEYWORDS) + r')\b)',
+    re.IGNORECASE,
+)
+
+_SENIOR_WORDS = ('senior', 'starszy', 'lead', 'principal', 'architect')
+_JUNIOR_WORDS = ('junior', 'młodszy', 'trainee', 'graduate')
+_MID_WORDS = ('mid', 'regular')
+
+# One-pass page classifier: a single alternation scan over the lowered page
+# text sets one bit per named group, and the seniority/employment-type
+# fallbacks decode the mask by priority instead of each running their own
+# substring searches over the whole document. The keywords are deliberately
+# bare substrings (no word boundaries) to match the old `in` checks.
+_SEN_SENIOR, _SEN_JUNIOR = 1 << 0, 1 << 1
+_EMP_B2B, _EMP_FULL, _EMP_PART, _EMP_CONTRACT = 1 << 2, 1 << 3, 1 << 4, 1 << 5
+_CLASS_ALL = (1 << 6) - 1
+_CLASS_BITS = {
+    'sen_senior': _SEN_SENIOR,
+    'sen_junior': _SEN_JUNIOR,
+    'emp_b2b': _EMP_B2B,
+    'emp_full': _EMP_FULL,
+    'emp_part': _EMP_PART,
+    'emp_contract': _EMP_CONTRACT,
+}
+_CLASS_RE = re.compile(
+    r'(?P<sen_senior>senior|starszy)'
+    r'|(?P<sen_junior>junior|młodszy)'
+    r'|(?P<emp_b2b>b2b)'
+    r'|(?P<emp_full>full-time|pełny etat)'
+    r'|(?P<emp_part>part-time|część etatu)'
+    r'|(?P<emp_contract>contract|kontrakt|umowa)'
+)
+
+
+def _text(element) -> str:
+    """Whitespace-normalized text content of an element."""
+    return ' '.join(element.text_content().split())
+
 
 class JobParser:
     """Parses HTML content from NoFluffJobs."""
@@ -22,68 +136,241 @@ class JobParser:
         """
         self.base_url = base_url
 
-    def extract_job_urls(self, soup: BeautifulSoup) -> List[str]:
+    def parse_html(self, html: Union[str, bytes]) -> lxml.html.HtmlElement:
+        """
+        Parse raw HTML into an lxml element tree.
+
+        Args:
+            html: HTML source; bytes are preferred — lxml detects the
+                encoding itself and skips a separate Unicode decode
+
+        Returns:
+            Root element of the parsed document
+        """
+        return lxml.html.fromstring(html)
+
+    def extract_job_urls(self, tree: lxml.html.HtmlElement) -> List[str]:
         """
         Extract all job URLs from a listing page.
 
         Args:
-            soup: BeautifulSoup object of the listing page
+            tree: Parsed listing page
 
         Returns:
             List of absolute job URLs
         """
         job_urls = []
+        seen = set()
 
-        # NoFluffJobs typically uses links with specific patterns
-        # Try multiple selectors to be robust
-        selectors = [
-            'a[href*="/job/"]',
-            'a.posting-list-item',
-            'a[class*="posting"]',
-            'div.posting a',
-            'article a[href*="/pl/job/"]'
-        ]
-
-        for selector in selectors:
-            links = soup.select(selector)
-            for link in links:
-                href = link.get('href')
-                if href and '/job/' in href:
-                    # Convert to absolute URL
-                    absolute_url = urljoin(self.base_url, href)
-                    if absolute_url not in job_urls:
-                        job_urls.append(absolute_url)
+        for href in _XP_JOB_LINKS(tree):
+            absolute_url = urljoin(self.base_url, href)
+            if absolute_url not in seen:
+                seen.add(absolute_url)
+                job_urls.append(absolute_url)
 
         logging.info(f"Extracted {len(job_urls)} job URLs from page")
         return job_urls
 
-    def parse_job_detail(self, soup: BeautifulSoup, url: str) -> Dict:
+    def parse_job_detail(self, tree: lxml.html.HtmlElement, url: str) -> Dict:
         """
         Parse detailed job information from a job detail page.
 
         Args:
-            soup: BeautifulSoup object of the job detail page
+            tree: Parsed job detail page
             url: URL of the job posting
 
         Returns:
             Dictionary with job details
         """
+        # Fast path: a schema.org JobPosting blob carries everything the
+        # selectors below reconstruct, for the cost of one JSON parse
+        job_data = self._parse_jsonld(tree, url)
+        if job_data:
+            return job_data
+
+        # Full document text extracted once and shared by the fallbacks;
+        # one scan over the lowered copy classifies seniority and
+        # employment type together
+        page_text = tree.text_content()
+        class_mask = self._classify_page(page_text.lower())
+
         job_data = {
             'url': url,
             'job_id': self._extract_job_id(url),
-            'title': self._extract_title(soup),
-            'company_name': self._extract_company(soup),
-            'description': self._extract_description(soup),
-            'requirements': self._extract_requirements(soup),
-            'salary': self._extract_salary(soup),
-            'location': self._extract_location(soup),
-            'technologies': self._extract_technologies(soup),
-            'seniority': self._extract_seniority(soup),
-            'employment_type': self._extract_employment_type(soup),
+            'title': self._extract_title(tree),
+            'company_name': self._extract_company(tree),
+            'description': self._extract_description(tree),
+            'requirements': self._extract_requirements(tree),
+            'salary': self._extract_salary(tree, page_text),
+            'location': self._extract_location(tree),
+            'technologies': self._extract_technologies(tree, page_text),
+            'seniority': self._extract_seniority(tree, class_mask),
+            'employment_type': self._extract_employment_type(class_mask),
         }
 
         return job_data
 
+    def _parse_jsonld(self, tree, url: str) -> Optional[Dict]:
+        """
+        Try to build the job dict from embedded JSON-LD.
+
+        Args:
+            tree: Parsed job detail page
+            url: URL of the job posting
+
+        Returns:
+            Job data dictionary, or None when no usable JobPosting blob
+            is present (caller falls back to DOM scraping)
+        """
+        for script in _XP_JSONLD(tree):
+            try:
+                # str() because orjson rejects lxml's smart-string subclass
+                data = _json_loads(str(script))
+            except ValueError:
+                continue
+
+            if isinstance(data, dict) and '@graph' in data:
+                data = data['@graph']
+            items = data if isinstance(data, list) else [data]
+
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
+                if item.get('@type') not in ('JobPosting', ['JobPosting']):
+                    continue
+                try:
+                    return self._from_jsonld(item, url)
+                except Exception as e:
+                    logging.warning(f"Malformed JobPosting JSON-LD on {url}: {e}")
+
+        return None
+
+    def _from_jsonld(self, obj: Dict, url: str) -> Dict:
+        """
+        Map a schema.org JobPosting object onto the job dict shape.
+
+        Args:
+            obj: Decoded JobPosting object
+            url: URL of the job posting
+
+        Returns:
+            Dictionary with the same keys as the DOM-scraping path
+        """
+        title = str(obj.get('title') or 'Unknown Title')
+
+        org = obj.get('hiringOrganization')
+        company = 'Unknown Company'
+        if isinstance(org, dict) and org.get('name'):
+            company = str(org['name'])
+
+        description = obj.get('description') or None
+        if isinstance(description, str):
+            if '<' in description:
+                # Descriptions usually arrive as embedded HTML fragments
+                description = ' '.join(
+                    lxml.html.fromstring(description).text_content().split()
+                )
+            description = description[:5000]
+        else:
+            description = None
+
+        requirements = obj.get('qualifications') or obj.get('experienceRequirements')
+        requirements = requirements[:5000] if isinstance(requirements, str) else None
+
+        # Same keyword classification as the DOM path, run over the
+        # fields we actually have instead of the whole page text
+        title_lower = title.lower()
+        class_mask = self._classify_page(
+            f"{title_lower} {(description or '').lower()} "
+            f"{(requirements or '').lower()}"
+        )
+
+        if any(word in title_lower for word in _SENIOR_WORDS):
+            seniority = 'senior'
+        elif any(word in title_lower for word in _JUNIOR_WORDS):
+            seniority = 'junior'
+        elif any(word in title_lower for word in _MID_WORDS):
+            seniority = 'mid'
+        elif class_mask & _SEN_SENIOR:
+            seniority = 'senior'
+        elif class_mask & _SEN_JUNIOR:
+            seniority = 'junior'
+        else:
+            seniority = 'mid'
+
+        employment = obj.get('employmentType')
+        if isinstance(employment, list) and employment:
+            employment = employment[0]
+        employment_type = (
+            _JSONLD_EMPLOYMENT.get(str(employment).upper().replace('-', '_'))
+            if employment else None
+        ) or self._extract_employment_type(class_mask)
+
+        return {
+            'url': url,
+            'job_id': self._extract_job_id(url),
+            'title': title,
+            'company_name': company,
+            'description': description,
+            'requirements': requirements,
+            'salary': self._jsonld_salary(obj.get('baseSalary')),
+            'location': self._jsonld_location(obj),
+            'technologies': self._jsonld_skills(obj.get('skills')),
+            'seniority': seniority,
+            'employment_type': employment_type,
+        }
+
+    @staticmethod
+    def _jsonld_salary(base_salary) -> Optional[str]:
+        """Format a schema.org MonetaryAmount as the usual salary text."""
+        if not isinstance(base_salary, dict):
+            return None
+
+        currency = base_salary.get('currency') or ''
+        value = base_salary.get('value')
+
+        if isinstance(value, dict):
+            low, high = value.get('minValue'), value.get('maxValue')
+            if low is not None and high is not None:
+                return f"{low} - {high} {currency}".strip()
+            value = value.get('value')
+
+        if value is not None:
+            return f"{value} {currency}".strip()
+        return None
+
+    @staticmethod
+    def _jsonld_location(obj: Dict) -> Optional[str]:
+        """Join jobLocation cities, tagging telecommute postings as Remote."""
+        parts = []
+
+        locations = obj.get('jobLocation')
+        if isinstance(locations, dict):
+            locations = [locations]
+        for location in locations or []:
+            if not isinstance(location, dict):
+                continue
+            address = location.get('address')
+            city = address.get('addressLocality') if isinstance(address, dict) else None
+            if city and city not in parts:
+                parts.append(str(city))
+
+        if str(obj.get('jobLocationType', '')).upper() == 'TELECOMMUTE':
+            parts.append('Remote')
+
+        return ', '.join(parts) if parts else None
+
+    @staticmethod
+    def _jsonld_skills(skills) -> List[str]:
+        """Normalize the skills field (string or list) to a list of names."""
+        if isinstance(skills, str):
+            names = [s.strip() for s in skills.split(',')]
+        elif isinstance(skills, list):
+            names = [str(s).strip() for s in skills]
+        else:
+            names = []
+        return [name for name in names if name][:50]
+
     def _extract_job_id(self, url: str) -> str:
         """
         Extract unique job ID from URL.
@@ -95,7 +382,7 @@ class JobParser:
             Job ID string
         """
         # Extract from URL pattern: /job/some-job-title-123abc
-        match = re.search(r'/job/([^/?]+)', url)
+        match = _JOB_ID_RE.search(url)
         if match:
             return match.group(1)
 
@@ -103,241 +390,162 @@ class JobParser:
         import hashlib
         return hashlib.md5(url.encode()).hexdigest()[:16]
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, tree) -> str:
         """Extract job title."""
-        # Try multiple selectors
-        selectors = ['h1', 'h1.posting-title', '[class*="title"]']
+        title = ' '.join(_XP_TITLE(tree).split())
+        if title and len(title) > 5:  # Sanity check
+            return title
 
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                title = element.get_text(strip=True)
-                if title and len(title) > 5:  # Sanity check
-                    return title
+        for element in _XP_TITLE_FALLBACK(tree):
+            title = _text(element)
+            if title and len(title) > 5:
+                return title
 
         logging.warning("Could not extract job title")
         return "Unknown Title"
 
-    def _extract_company(self, soup: BeautifulSoup) -> str:
+    def _extract_company(self, tree) -> str:
         """Extract company name."""
-        selectors = [
-            '[class*="company"]',
-            'a[href*="/company/"]',
-            'div.company-name',
-            'span.company'
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                company = element.get_text(strip=True)
-                if company:
-                    return company
+        for element in _XP_COMPANY(tree):
+            company = _text(element)
+            if company:
+                return company
 
         logging.warning("Could not extract company name")
         return "Unknown Company"
 
-    def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_description(self, tree) -> Optional[str]:
         """Extract job description."""
-        # Look for description section
-        selectors = [
-            '[class*="description"]',
-            '[class*="about"]',
-            'section.job-description',
-            'div.description'
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                # Get text, preserve some structure
-                description = element.get_text(separator='\n', strip=True)
-                if description:
-                    return description[:5000]  # Limit length
+        for element in _XP_DESCRIPTION(tree):
+            description = element.text_content().strip()
+            if description:
+                return description[:5000]  # Limit length
 
         return None
 
-    def _extract_requirements(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_requirements(self, tree) -> Optional[str]:
         """Extract job requirements."""
-        selectors = [
-            '[class*="requirement"]',
-            '[class*="must-have"]',
-            'section.requirements'
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                requirements = element.get_text(separator='\n', strip=True)
-                if requirements:
-                    return requirements[:5000]
+        for element in _XP_REQUIREMENTS(tree):
+            requirements = element.text_content().strip()
+            if requirements:
+                return requirements[:5000]
 
         return None
 
-    def _extract_salary(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_salary(self, tree, page_text: str) -> Optional[str]:
         """Extract salary information."""
-        # Look for salary elements
-        selectors = [
-            '[class*="salary"]',
-            '[class*="money"]',
-            'span.salary',
-            'div.salary-range'
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                salary_text = element.get_text(strip=True)
-                # Look for numbers and currency
-                if re.search(r'\d', salary_text):
-                    return salary_text
+        for element in _XP_SALARY(tree):
+            salary_text = _text(element)
+            # Look for numbers and currency
+            if _SALARY_DIGIT_RE.search(salary_text):
+                return salary_text
 
         # Try to find in text
-        text = soup.get_text()
-        salary_match = re.search(r'(\d[\d\s]*-[\d\s]*\d)\s*(PLN|zł|EUR)', text)
+        salary_match = _SALARY_TEXT_RE.search(page_text)
         if salary_match:
             return salary_match.group(0)
 
         return None
 
-    def _extract_location(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_location(self, tree) -> Optional[str]:
         """Extract location information."""
-        selectors = [
-            '[class*="location"]',
-            '[class*="city"]',
-            'span.location',
-            'div.location'
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                location = element.get_text(strip=True)
-                if location:
-                    return location
+        for element in _XP_LOCATION(tree):
+            location = _text(element)
+            if location:
+                return location
 
         return None
 
-    def _extract_technologies(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_technologies(self, tree, page_text: str) -> List[str]:
         """Extract required technologies/skills."""
         technologies = []
 
-        # Look for technology tags/badges
-        selectors = [
-            '[class*="technology"]',
-            '[class*="skill"]',
-            '[class*="tech-"]',
-            'span.tag',
-            'div.tags span'
-        ]
-
-        for selector in selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                tech = element.get_text(strip=True)
-                if tech and len(tech) > 1 and tech not in technologies:
-                    technologies.append(tech)
+        for element in _XP_TECHNOLOGIES(tree):
+            tech = _text(element)
+            if tech and len(tech) > 1 and tech not in technologies:
+                technologies.append(tech)
 
         # If no structured tags, try to extract from description
         if not technologies:
-            technologies = self._extract_technologies_from_text(soup)
+            technologies = self._extract_technologies_from_text(page_text)
 
         return technologies[:50]  # Limit to 50
 
-    def _extract_technologies_from_text(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_technologies_from_text(self, page_text: str) -> List[str]:
         """
         Extract technologies from text using common technology keywords.
 
         Args:
-            soup: BeautifulSoup object
+            page_text: Full document text
 
         Returns:
             List of technology names found
         """
-        # Common technologies in Polish IT job market
-        tech_keywords = [
-            'Python', 'Java', 'JavaScript', 'TypeScript', 'C#', 'C++', 'Go', 'Rust',
-            'Ruby', 'PHP', 'Swift', 'Kotlin', 'Scala',
-            'React', 'Angular', 'Vue', 'Django', 'Flask', 'FastAPI', 'Spring',
-            'Node.js', 'Express', '.NET', 'ASP.NET',
-            'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Elasticsearch', 'Oracle',
-            'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Terraform',
-            'Git', 'Jenkins', 'GitLab', 'CI/CD', 'Ansible',
-            'Linux', 'Ubuntu', 'Windows', 'MacOS'
-        ]
-
-        text = soup.get_text()
-        found_techs = []
-
-        for tech in tech_keywords:
-            # Case-insensitive search
-            if re.search(r'\b' + re.escape(tech) + r'\b', text, re.IGNORECASE):
-                if tech not in found_techs:
-                    found_techs.append(tech)
-
-        return found_techs
-
-    def _extract_seniority(self, soup: BeautifulSoup) -> Optional[str]:
+        found = {m.group(1).lower() for m in _TECH_RE.finditer(page_text)}
+        return [tech for tech in _TECH_KEYWORDS if tech.lower() in found]
+
+    def _classify_page(self, page_text_lower: str) -> int:
+        """
+        Scan the lowered page text once and classify it.
+
+        Args:
+            page_text_lower: Full document text, lowercased
+
+        Returns:
+            Bitmask of _SEN_*/_EMP_* flags for every keyword group found
+        """
+        mask = 0
+        for match in _CLASS_RE.finditer(page_text_lower):
+            mask |= _CLASS_BITS[match.lastgroup]
+            if mask == _CLASS_ALL:
+                break
+        return mask
+
+    def _extract_seniority(self, tree, class_mask: int) -> Optional[str]:
         """Extract seniority level."""
-        # Get title and description
-        title_elem = soup.select_one('h1')
-        title = title_elem.get_text(strip=True).lower() if title_elem else ''
+        # Check for seniority keywords in the title first
+        title = _XP_TITLE(tree).lower()
 
-        # Check for seniority keywords
-        if any(word in title for word in ['senior', 'starszy', 'lead', 'principal', 'architect']):
+        if any(word in title for word in _SENIOR_WORDS):
             return 'senior'
-        elif any(word in title for word in ['junior', 'młodszy', 'trainee', 'graduate']):
+        elif any(word in title for word in _JUNIOR_WORDS):
             return 'junior'
-        elif any(word in title for word in ['mid', 'regular']):
+        elif any(word in title for word in _MID_WORDS):
             return 'mid'
 
-        # Check in body
-        text = soup.get_text().lower()
-        if 'senior' in text or 'starszy' in text:
+        # Check in body (bits from the one-pass classifier)
+        if class_mask & _SEN_SENIOR:
             return 'senior'
-        elif 'junior' in text or 'młodszy' in text:
+        elif class_mask & _SEN_JUNIOR:
             return 'junior'
 
         return 'mid'  # Default
 
-    def _extract_employment_type(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_employment_type(self, class_mask: int) -> Optional[str]:
         """Extract employment type (full-time, part-time, contract, etc.)."""
-        text = soup.get_text().lower()
-
-        if 'b2b' in text:
+        if class_mask & _EMP_B2B:
             return 'b2b'
-        elif 'full-time' in text or 'pełny etat' in text:
+        elif class_mask & _EMP_FULL:
             return 'full-time'
-        elif 'part-time' in text or 'część etatu' in text:
+        elif class_mask & _EMP_PART:
             return 'part-time'
-        elif 'contract' in text or 'kontrakt' in text or 'umowa' in text:
+        elif class_mask & _EMP_CONTRACT:
             return 'contract'
 
         return None
 
-    def has_next_page(self, soup: BeautifulSoup) -> bool:
+    def has_next_page(self, tree: lxml.html.HtmlElement) -> bool:
         """
         Check if there's a next page in pagination.
 
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed listing page
 
         Returns:
             True if next page exists, False otherwise
         """
-        # Look for pagination next button
-        next_selectors = [
-            'a[rel="next"]',
-            'a.next',
-            'a[aria-label*="next"]',
-            'button.next',
-            'a:contains("Next")',
-            'a:contains("Następna")'
-        ]
-
-        for selector in next_selectors:
-            element = soup.select_one(selector)
-            if element and not element.get('disabled'):
+        for element in _XP_NEXT_PAGE(tree):
+            if element.get('disabled') is None:
                 return True
 
         return False
@@ -3,15 +3,23 @@ Rate limiter for ethical web scraping.
 Implements delays, request tracking, and exponential backoff.
 """
 
-import time
-import random
 import logging
+import threading
+from time import monotonic, sleep
 from typing import Optional
-from datetime import datetime, timedelta
 
 
 class RateLimiter:
-    """Manages request rate limiting for ethical scraping."""
+    """
+    Token-bucket rate limiter for ethical scraping.
+
+    Tokens refill continuously at requests_per_minute / 60 per second up
+    to a burst capacity; each request spends one token and only blocks
+    when the bucket is empty. Steady state matches the configured rate
+    exactly, short bursts (e.g. several workers starting at once) are
+    absorbed by the capacity, and there is no fixed per-request sleep.
+    All methods are thread-safe.
+    """
 
     def __init__(self, config: dict):
         """
@@ -26,63 +34,102 @@ class RateLimiter:
         self.retry_attempts = config.get('retry_attempts', 3)
         self.retry_backoff = config.get('retry_backoff', 2)
 
-        # Request tracking
-        self.request_times = []
-        self.last_request_time: Optional[float] = None
+        # Sustained rate in tokens per second; burst capacity defaults to
+        # a modest fraction of the per-minute budget so a cold start
+        # doesn't fire the whole minute's quota at once
+        self.rate = self.requests_per_minute / 60.0
+        self.capacity = config.get('burst', max(1, self.requests_per_minute // 4))
+
+        # Adaptive bounds, TCP-congestion-control style: the configured
+        # rate is the ceiling (the scraper never exceeds its own politeness
+        # budget), 429/5xx responses cut the rate multiplicatively, and
+        # sustained successes climb back additively
+        self.max_rate = self.rate
+        self.min_rate = max(1, self.requests_per_minute // 10) / 60.0
+        self.backoff_factor = config.get('backoff_factor', 2.0)
+        self._increase_step = self.max_rate / 20.0
+        self._success_streak = 0
+
+        self._tokens = float(self.capacity)
+        # All timing on the monotonic clock: immune to NTP adjustments
+        # of the wall clock
+        self._last_refill = monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Credit tokens accrued since the last refill. Caller holds _lock."""
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._last_refill) * self.rate
+        )
+        self._last_refill = now
 
     def wait(self):
         """
-        Wait appropriate time before next request.
-        Implements random delay between min and max delay.
-        """
-        # Calculate delay
-        delay = random.uniform(self.min_delay, self.max_delay)
-
-        # If we have a last request time, ensure minimum delay
-        if self.last_request_time:
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.min_delay:
-                additional_wait = self.min_delay - elapsed
-                delay = max(delay, additional_wait)
-
-        # Wait
-        time.sleep(delay)
-
-        # Update last request time
-        self.last_request_time = time.time()
-
-        # Track request time
-        self._record_request()
+        Take one token, sleeping until one is available.
 
-    def _record_request(self):
-        """Record request time for rate limiting."""
-        now = time.time()
-        self.request_times.append(now)
+        Blocks only when the bucket is empty; the sleep happens outside
+        the lock so other threads can queue up their own tokens.
+        """
+        with self._lock:
+            now = monotonic()
+            self._refill(now)
+            # Spend the token up front (the balance may dip below zero);
+            # the shortfall converts directly into sleep time
+            self._tokens -= 1.0
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
 
-        # Clean up old request times (older than 1 minute)
-        cutoff = now - 60
-        self.request_times = [t for t in self.request_times if t > cutoff]
+        if delay > 0:
+            sleep(delay)
 
     def check_rate_limit(self) -> bool:
         """
-        Check if we're within rate limits.
+        Check if a request could proceed right now without blocking.
 
         Returns:
-            True if within limits, False otherwise
+            True if a token is available, False otherwise
         """
-        # Clean old requests
-        now = time.time()
-        cutoff = now - 60
-        self.request_times = [t for t in self.request_times if t > cutoff]
-
-        # Check if we've exceeded requests per minute
-        return len(self.request_times) < self.requests_per_minute
+        with self._lock:
+            self._refill(monotonic())
+            return self._tokens >= 1.0
 
     def wait_if_needed(self):
-        """Wait if rate limit would be exceeded."""
+        """Wait until a request could proceed without blocking."""
         while not self.check_rate_limit():
-            logging.warning("Rate limit approached, waiting 10 seconds...")
-            time.sleep(10)
+            sleep(1.0 / self.rate)
+
+    def record_success(self):
+        """
+        Credit a successful response toward rate recovery.
+
+        After a backoff, each success streak nudges the rate back up
+        additively until the configured ceiling is reached again.
+        """
+        with self._lock:
+            if self.rate >= self.max_rate:
+                return
+            self._success_streak += 1
+            # Recovery accelerates gently with the streak, so one lucky
+            # response doesn't restore the full rate but a healthy run does
+            self.rate = min(
+                self.max_rate,
+                self.rate + self._increase_step * (1 + 0.1 * self._success_streak)
+            )
+
+    def record_failure(self):
+        """
+        Back off after a 429 or server error.
+
+        Cuts the steady-state rate multiplicatively (down to min_rate)
+        and empties the bucket, so all workers pause instead of retrying
+        into a struggling server.
+        """
+        with self._lock:
+            self._success_streak = 0
+            self.rate = max(self.min_rate, self.rate / self.backoff_factor)
+            self._tokens = 0.0
+            self._last_refill = monotonic()
+        logging.warning(f"Backing off: rate reduced to {self.rate * 60:.1f} requests/min")
 
     def get_retry_delay(self, attempt: int) -> float:
         """
@@ -100,17 +147,26 @@ class RateLimiter:
         """
         Handle rate limit error (429 status code).
 
+        Lowers the steady-state rate and sleeps a bounded exponential
+        backoff — seconds, not the minutes-long stalls of the old
+        fixed-60x schedule; the reduced rate carries the caution forward
+        after the retry succeeds.
+
         Args:
             attempt: Current retry attempt number
         """
-        delay = self.get_retry_delay(attempt) * 60  # Convert to minutes
-        logging.warning(f"Rate limited! Waiting {delay/60:.1f} minutes before retry...")
-        time.sleep(delay)
+        self.record_failure()
+        delay = min(120.0, 5.0 * self.get_retry_delay(attempt))
+        logging.warning(f"Rate limited! Waiting {delay:.0f}s before retry...")
+        sleep(delay)
 
     def reset(self):
-        """Reset rate limiter state."""
-        self.request_times = []
-        self.last_request_time = None
+        """Reset rate limiter state to a full bucket at the configured rate."""
+        with self._lock:
+            self.rate = self.max_rate
+            self._success_streak = 0
+            self._tokens = float(self.capacity)
+            self._last_refill = monotonic()
 
 
 class CircuitBreaker:
@@ -119,6 +175,13 @@ class CircuitBreaker:
     Prevents hammering a service that's having issues.
     """
 
+    # Integer state encoding: comparisons in can_proceed() — called before
+    # every scraper request — are single int compares instead of string
+    # equality checks
+    CLOSED, OPEN, HALF_OPEN = 0, 1, 2
+
+    _STATE_NAMES = {CLOSED: 'closed', OPEN: 'open', HALF_OPEN: 'half-open'}
+
     def __init__(self, failure_threshold: int = 5, timeout_seconds: int = 300):
         """
         Initialize circuit breaker.
@@ -130,21 +193,26 @@ class CircuitBreaker:
         self.failure_threshold = failure_threshold
         self.timeout_seconds = timeout_seconds
         self.failure_count = 0
-        self.last_failure_time: Optional[datetime] = None
-        self.state = 'closed'  # closed, open, half-open
+        self._state = self.CLOSED
+        self._opened_at: Optional[float] = None  # monotonic seconds
+
+    @property
+    def state(self) -> str:
+        """Current state as a string ('closed', 'open', 'half-open')."""
+        return self._STATE_NAMES[self._state]
 
     def record_success(self):
         """Record a successful request."""
         self.failure_count = 0
-        self.state = 'closed'
+        self._state = self.CLOSED
 
     def record_failure(self):
         """Record a failed request."""
         self.failure_count += 1
-        self.last_failure_time = datetime.now()
+        self._opened_at = monotonic()
 
         if self.failure_count >= self.failure_threshold:
-            self.state = 'open'
+            self._state = self.OPEN
             logging.error(
                 f"Circuit breaker opened after {self.failure_count} failures. "
                 f"Waiting {self.timeout_seconds}s before retry."
@@ -157,25 +225,20 @@ class CircuitBreaker:
         Returns:
             True if circuit is closed or half-open, False if open
         """
-        if self.state == 'closed':
+        if self._state != self.OPEN:
             return True
 
-        if self.state == 'open':
-            # Check if timeout has passed
-            if self.last_failure_time:
-                elapsed = (datetime.now() - self.last_failure_time).total_seconds()
-                if elapsed >= self.timeout_seconds:
-                    self.state = 'half-open'
-                    logging.info("Circuit breaker entering half-open state")
-                    return True
-
-            return False
+        # Check if timeout has passed
+        if (self._opened_at is not None
+                and monotonic() - self._opened_at >= self.timeout_seconds):
+            self._state = self.HALF_OPEN
+            logging.info("Circuit breaker entering half-open state")
+            return True
 
-        # half-open state
-        return True
+        return False
 
     def reset(self):
         """Reset circuit breaker."""
         self.failure_count = 0
-        self.last_failure_time = None
-        self.state = 'closed'
+        self._opened_at = None
+        self._state = self.CLOSED